@@ -0,0 +1,152 @@
+"""
+Benchmark article content extraction on the checked-in fixture pages.
+
+Compares the single-pass extractor with the previous implementation,
+which cloned every article by re-parsing its HTML and then ran a chain
+of selector passes and regex substitutions over the clone. Both must
+produce identical content.
+
+Usage:
+    cd crawler
+    python benchmarks/bench_extraction.py [--repeat N]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from extraction import extract_article_content
+from parsing import PARSER_BACKENDS, _is_available
+
+CRAWLER_DIR = Path(__file__).parent.parent
+
+# Fixture page -> elements to extract from it
+FIXTURES = {
+    'anthropic_page.html': "a[href^='/news/'], article, section, main, li",
+    'cursor_page.html': 'article, section, main, li, div.prose',
+}
+
+
+def legacy_extract(article_elem, parser: str) -> str:
+    """The clone-and-decompose extraction the crawler used before."""
+    if not article_elem:
+        return ''
+
+    article = BeautifulSoup(str(article_elem), parser)
+
+    for selector in ['nav', 'button', '.button', 'footer', 'header',
+                    '.nav', '.navigation', '.menu', '.sidebar',
+                    '.cookie', '.banner', '.ad', '.advertisement',
+                    'script', 'style', 'iframe', 'noscript']:
+        for elem in article.select(selector):
+            elem.decompose()
+
+    ui_text_patterns = [
+        'learn more', 'read more', 'continue reading',
+        'share', 'tweet', 'like', 'subscribe', 'follow',
+        'previous', 'next', 'back', 'home',
+        'your browser does not support the video tag',
+        'your browser does not support',
+        'models', 'research', 'announcements'
+    ]
+    elements_to_remove = []
+    for elem in article.find_all(string=True):
+        text = elem.strip().lower()
+        for pattern in ui_text_patterns:
+            if pattern in text or text == pattern:
+                parent = elem.parent
+                if parent and parent not in elements_to_remove:
+                    elements_to_remove.append(parent)
+                break
+    for elem in elements_to_remove:
+        elem.decompose()
+
+    content = None
+    for selector in ['article', 'main', '[role="main"]', '.content',
+                    '.article-content', '.post-content', '.entry-content',
+                    'p']:
+        elements = article.select(selector)
+        if elements:
+            paragraphs = []
+            for elem in elements:
+                if elem.name == 'p':
+                    text = elem.get_text(strip=True)
+                    if len(text) > 20:
+                        paragraphs.append(text)
+                else:
+                    for p in elem.find_all('p'):
+                        text = p.get_text(strip=True)
+                        if len(text) > 20:
+                            paragraphs.append(text)
+            if paragraphs:
+                content = ' '.join(paragraphs[:5])
+                break
+
+    if not content:
+        content = article.get_text(separator=' ', strip=True)
+
+    content = ' '.join(content.split())
+    content = content[:800]
+
+    ui_patterns = [
+        r'january \d{4}', r'february \d{4}', r'march \d{4}', r'april \d{4}',
+        r'may \d{4}', r'june \d{4}', r'july \d{4}', r'august \d{4}',
+        r'september \d{4}', r'october \d{4}', r'november \d{4}', r'december \d{4}',
+        r'learn more', r'read more', r'models', r'research', r'announcements',
+        r'your browser does not support the video tag\.?'
+    ]
+    for pattern in ui_patterns:
+        content = re.sub(pattern, '', content, flags=re.IGNORECASE)
+
+    content = ' '.join(content.split())
+
+    if content and content[-1] not in '.!?':
+        for i in range(len(content)-1, max(len(content)-100, 0), -1):
+            if content[i] in '.!?':
+                content = content[:i+1]
+                break
+        else:
+            content = content + '.'
+
+    return content
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument('--repeat', type=int, default=5, help="Iterations per measurement")
+    args = arg_parser.parse_args()
+
+    backends = [b for b in PARSER_BACKENDS if _is_available(b)]
+
+    print(f"{'fixture':<22}{'backend':<14}{'elements':>9}{'legacy ms':>11}{'single ms':>11}{'speedup':>9}")
+    for name, selector in FIXTURES.items():
+        html = (CRAWLER_DIR / name).read_text(encoding='utf-8')
+        for backend in backends:
+            elements = BeautifulSoup(html, backend).select(selector)
+
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                expected = [legacy_extract(e, backend) for e in elements]
+            legacy_ms = (time.perf_counter() - start) / args.repeat * 1000
+
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                actual = [extract_article_content(e) for e in elements]
+            single_ms = (time.perf_counter() - start) / args.repeat * 1000
+
+            if actual != expected:
+                mismatches = sum(a != b for a, b in zip(actual, expected))
+                print(f"  WARNING: {mismatches} elements differ from the previous extraction")
+
+            print(f"{name:<22}{backend:<14}{len(elements):>9}{legacy_ms:>11.1f}"
+                  f"{single_ms:>11.1f}{legacy_ms / single_ms:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark HTML parser backends on the checked-in fixture pages.
+
+Parses each fixture with every installed backend and runs the matching
+source's selectors, checking that all backends select the same articles.
+
+Usage:
+    cd crawler
+    python benchmarks/bench_parsers.py [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import yaml
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from parsing import PARSER_BACKENDS, _is_available
+
+CRAWLER_DIR = Path(__file__).parent.parent
+
+# Fixture page -> source whose selectors apply to it
+FIXTURES = {
+    'anthropic_page.html': 'Anthropic',
+    'cursor_page.html': 'Cursor',
+    'cursor_fetch_test.html': 'Cursor',
+    'debug_page.html': 'Anthropic',
+}
+
+
+def load_fixture(name: str):
+    """Read a fixture page, or None if it is not decodable HTML."""
+    raw = (CRAWLER_DIR / name).read_bytes()
+    try:
+        text = raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    return text if '<html' in text[:2000].lower() else None
+
+
+def select_articles(soup, selectors: dict) -> list:
+    """Run a source's selectors and return (title, link, date) per article."""
+    results = []
+    for article in soup.select(selectors.get('article_list', 'article'))[:20]:
+        title = article.select_one(selectors.get('title', 'h2'))
+        date = article.select_one(selectors.get('date', 'time'))
+        link_selector = selectors.get('link', 'a')
+        link = article if link_selector is None else article.select_one(link_selector)
+        results.append((
+            title.get_text(strip=True) if title else None,
+            link.get('href') if link else None,
+            date.get('datetime', date.get_text(strip=True)) if date else None,
+        ))
+    return results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument('--repeat', type=int, default=20, help="Iterations per measurement")
+    args = arg_parser.parse_args()
+
+    with open(CRAWLER_DIR / 'config.yaml', 'r', encoding='utf-8') as f:
+        sources = {s['name']: s for s in yaml.safe_load(f)['sources']}
+    backends = [b for b in PARSER_BACKENDS if _is_available(b)]
+
+    print(f"{'fixture':<26}{'backend':<14}{'parse ms':>10}{'select ms':>11}{'speedup':>9}")
+    for name, source_name in FIXTURES.items():
+        html = load_fixture(name)
+        if html is None:
+            print(f"{name:<26}skipped (saved from a compressed response, not HTML)")
+            continue
+        selectors = sources[source_name]['selectors']
+
+        baseline = None
+        expected = None
+        for backend in reversed(backends):  # html.parser first as the baseline
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                soup = BeautifulSoup(html, backend)
+            parse_ms = (time.perf_counter() - start) / args.repeat * 1000
+
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                articles = select_articles(soup, selectors)
+            select_ms = (time.perf_counter() - start) / args.repeat * 1000
+
+            if expected is None:
+                expected = articles
+            elif articles != expected:
+                print(f"  WARNING: {backend} selected different articles than html.parser")
+
+            total = parse_ms + select_ms
+            baseline = baseline or total
+            print(f"{name:<26}{backend:<14}{parse_ms:>10.1f}{select_ms:>11.1f}{baseline / total:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+Offline benchmark harness for the crawler.
+
+Provides a `bench` fixture in the style of pytest-benchmark that times a
+callable over several rounds, measures its peak memory with tracemalloc in
+a separate round, and prints throughput and memory for every benchmark at
+the end of the session. Nothing here touches the network.
+
+Usage:
+    cd crawler
+    python -m pytest benchmarks [--bench-rounds N] [--bench-sizes 10000,100000] [--bench-json FILE]
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+_results = []
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('bench', 'offline crawler benchmarks')
+    group.addoption('--bench-rounds', type=int, default=3,
+                    help="Timed rounds per benchmark (the fastest is reported)")
+    group.addoption('--bench-sizes', default='10000',
+                    help="Comma-separated item counts for the synthetic feed benchmarks")
+    group.addoption('--bench-json', default=None,
+                    help="Also write the results to this JSON file")
+
+
+def pytest_configure(config):
+    # feedparser warns once per item on the synthetic feeds
+    config.addinivalue_line('filterwarnings', 'ignore::DeprecationWarning:feedparser')
+
+
+def pytest_generate_tests(metafunc):
+    if 'size' in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption('bench_sizes').split(',') if size]
+        metafunc.parametrize('size', sizes, ids=[f"{size}items" for size in sizes])
+
+
+class Bench:
+    """Callable timing harness handed to each benchmark."""
+
+    def __init__(self, name: str, rounds: int):
+        self.name = name
+        self.rounds = rounds
+
+    def __call__(self, func, *args, items: int = 1, **kwargs):
+        """
+        Benchmark func(*args, **kwargs).
+
+        Args:
+            func: Code under test
+            items: Units of work per call, used for the throughput column
+
+        Returns:
+            The result of the last call, for correctness checks
+        """
+        times = []
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            times.append(time.perf_counter() - start)
+
+        # tracemalloc slows allocation down, so memory gets its own round
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        best = min(times)
+        _results.append({
+            'name': self.name,
+            'rounds': self.rounds,
+            'items': items,
+            'min_seconds': round(best, 6),
+            'mean_seconds': round(sum(times) / len(times), 6),
+            'items_per_second': round(items / best, 1) if best else None,
+            'peak_memory_bytes': peak,
+        })
+        return result
+
+
+@pytest.fixture
+def bench(request):
+    """Time a callable; see Bench.__call__."""
+    return Bench(request.node.name, request.config.getoption('bench_rounds'))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _results:
+        return
+    terminalreporter.section('crawler benchmarks')
+    terminalreporter.write_line(
+        f"{'benchmark':<52}{'min ms':>11}{'mean ms':>11}{'items/s':>13}{'peak MB':>10}"
+    )
+    for result in _results:
+        throughput = result['items_per_second']
+        terminalreporter.write_line(
+            f"{result['name']:<52}"
+            f"{result['min_seconds'] * 1000:>11.1f}"
+            f"{result['mean_seconds'] * 1000:>11.1f}"
+            f"{throughput if throughput is not None else float('nan'):>13,.0f}"
+            f"{result['peak_memory_bytes'] / 1024 / 1024:>10.1f}"
+        )
+
+    output = config.getoption('bench_json')
+    if output:
+        Path(output).write_text(json.dumps({
+            'python': sys.version.split()[0],
+            'results': _results,
+        }, indent=2), encoding='utf-8')
+        terminalreporter.write_line(f"Saved benchmark results to {output}")
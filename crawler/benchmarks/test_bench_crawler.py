@@ -0,0 +1,269 @@
+"""
+Offline benchmarks for the crawler's hot paths.
+
+Replays the checked-in fixture pages through the HTML scraping path and
+synthetic RSS feeds through the feed path, with the network replaced by
+in-memory responses. See conftest.py for options.
+"""
+
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+from bs4 import BeautifulSoup
+
+from crawler import Crawler
+from dates import backfill_cutoff
+from dedup import deduplicate
+
+CRAWLER_DIR = Path(__file__).parent.parent
+
+# Fixture page -> source whose selectors apply to it
+FIXTURES = {
+    'anthropic_page.html': 'Anthropic',
+    'cursor_page.html': 'Cursor',
+    'cursor_fetch_test.html': 'Cursor',
+    'debug_page.html': 'Anthropic',
+}
+
+FEED_URL = 'https://example.com/feed.xml'
+
+DATE_FORMATS = (
+    lambda d: d.strftime('%a, %d %b %Y 08:00:00 GMT'),  # RSS pubDate
+    lambda d: d.strftime('%Y-%m-%dT08:00:00Z'),  # Atom / <time datetime>
+    lambda d: d.strftime('%b %d, %Y'),  # Listing pages
+    lambda d: d.strftime('%B %-d, %Y'),
+)
+
+
+def load_fixture(name: str):
+    """Read a fixture page, or None if it is not decodable HTML."""
+    raw = (CRAWLER_DIR / name).read_bytes()
+    try:
+        text = raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    return text if '<html' in text[:2000].lower() else None
+
+
+def synthetic_dates(size: int) -> list:
+    """Dates in the formats sources publish, spread over two years."""
+    rng = random.Random(size)
+    start = date(2024, 1, 1)
+    return [
+        DATE_FORMATS[n % len(DATE_FORMATS)](start + timedelta(days=rng.randrange(730)))
+        for n in range(size)
+    ]
+
+
+def synthetic_html(size: int) -> list:
+    """Feed item descriptions with the markup feeds typically embed."""
+    return [
+        f'<p>Release <strong>{n}</strong> adds <a href="https://example.com/{n}">agent '
+        f'tooling</a> &amp; fixes.</p><ul><li>Faster tool calls</li><li>Read more</li></ul>'
+        for n in range(size)
+    ]
+
+
+def synthetic_feed(size: int, span_days: int = 730) -> str:
+    """An RSS 2.0 document with `size` items a day apart, newest first, repeating every span_days."""
+    items = [
+        f"<item><title>Update {n}</title><link>https://example.com/posts/{n}</link>"
+        f"<pubDate>{DATE_FORMATS[0](date(2026, 1, 1) - timedelta(days=n % span_days))}</pubDate>"
+        f"<description><![CDATA[{html}]]></description></item>"
+        for n, html in enumerate(synthetic_html(size))
+    ]
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        '<title>Synthetic</title><link>https://example.com</link>'
+        + ''.join(items) + '</channel></rss>'
+    )
+
+
+def synthetic_sitemap(size: int) -> str:
+    """A sitemap with `size` URLs in no particular date order."""
+    urls = [
+        f"<url><loc>https://example.com/posts/update-{n}</loc>"
+        f"<lastmod>{(date(2026, 1, 1) - timedelta(days=(n * 7919) % 730)).isoformat()}T08:00:00+00:00</lastmod></url>"
+        for n in range(size)
+    ]
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">' + ''.join(urls) + '</urlset>'
+    )
+
+
+def synthetic_entries(size: int) -> list:
+    """Enriched entries shaped like entries.json."""
+    return [
+        {
+            'id': f"{n:012x}", 'title': f"Update {n}", 'source': 'Synthetic',
+            'url': f"https://example.com/posts/{n}",
+            'date': (date(2026, 1, 1) - timedelta(days=n % 730)).isoformat(),
+            'content': 'Release notes for agent tooling. ' * 20,
+            'summary': 'A short summary of the release.', 'category': 'Agentic AI',
+            'categoryConfidence': 90, 'tags': ['agents', 'tools'],
+        }
+        for n in range(size)
+    ]
+
+
+def synthetic_articles(size: int) -> list:
+    """Crawled entries with distinct content, every tenth a re-titled copy of the one before."""
+    words = random.Random(0)
+    vocabulary = [''.join(words.choice('abcdefghijklmnop') for _ in range(words.randint(3, 9)))
+                  for _ in range(2000)]
+    entries = []
+    for n in range(size):
+        if n % 10 == 9:
+            content = entries[-1]['content']
+        else:
+            rng = random.Random(n)
+            content = ' '.join(rng.choice(vocabulary) for _ in range(60))
+        entries.append({'id': f"{n:012x}", 'title': f"Update {n}", 'source': 'Synthetic',
+                        'url': f"https://example.com/posts/{n}", 'date': None, 'content': content})
+    return entries
+
+
+@pytest.fixture(scope='module')
+def sources():
+    with open(CRAWLER_DIR / 'config.yaml', 'r', encoding='utf-8') as f:
+        return {s['name']: s for s in yaml.safe_load(f)['sources']}
+
+
+@pytest.fixture
+def crawler(tmp_path, sources):
+    """Crawler with no delays, caches or backfill cutoff, writing to tmp_path."""
+    config = {
+        'output': {'path': str(tmp_path / 'entries.json')},
+        'backfill': {'enabled': False},
+        'crawler': {'delay_between_requests': 0},
+        'sources': list(sources.values()) + [
+            {'name': 'Synthetic Sitemap', 'type': 'sitemap', 'url': 'https://example.com',
+             'sitemap': {'max_urls': 1000000}},
+            {'name': 'Synthetic', 'url': 'https://example.com', 'rss_url': FEED_URL},
+        ],
+    }
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(yaml.safe_dump(config), encoding='utf-8')
+    return Crawler(str(config_path))
+
+
+def fixture_params():
+    return [pytest.param(name, source, id=name.split('.')[0]) for name, source in FIXTURES.items()]
+
+
+@pytest.mark.parametrize('fixture_name, source_name', fixture_params())
+def test_crawl_source_fixture(bench, crawler, sources, fixture_name, source_name):
+    """Fetch (replayed), parse, select and extract one listing page."""
+    html = load_fixture(fixture_name)
+    if html is None:
+        pytest.skip(f"{fixture_name} was saved from a compressed response, not HTML")
+    source = {k: v for k, v in sources[source_name].items() if k != 'rss_url'}
+
+    with patch.object(crawler, '_fetch_text', return_value=(html, False)):
+        entries = crawler.crawl_source(source)
+        bench(crawler.crawl_source, source, items=max(len(entries), 1))
+    assert entries
+
+
+@pytest.mark.parametrize('fixture_name, source_name', fixture_params())
+def test_extract_article_content_fixture(bench, crawler, sources, fixture_name, source_name):
+    """Content extraction for every article element on a fixture page."""
+    html = load_fixture(fixture_name)
+    if html is None:
+        pytest.skip(f"{fixture_name} was saved from a compressed response, not HTML")
+    plan = crawler._source_plan(sources[source_name])
+    articles = plan.articles(BeautifulSoup(html, crawler.parser))
+
+    def extract_all():
+        return [crawler._extract_article_content(article) for article in articles]
+
+    assert any(bench(extract_all, items=len(articles)))
+
+
+def test_clean_html(bench, crawler, size):
+    """Feed description cleanup."""
+    descriptions = synthetic_html(size)
+    cleaned = bench(lambda: [crawler._clean_html(html) for html in descriptions], items=size)
+    assert cleaned[0].startswith('Release 0 adds agent tooling')
+
+
+def test_clean_html_beautifulsoup(bench, crawler, size):
+    """Baseline for test_clean_html: the same descriptions through a BeautifulSoup tree."""
+    descriptions = synthetic_html(size)
+
+    def get_text(html):
+        return ' '.join(BeautifulSoup(html, crawler.parser).get_text(separator=' ', strip=True).split())
+
+    cleaned = bench(lambda: [get_text(html) for html in descriptions], items=size)
+    assert cleaned == [crawler._clean_html(html) for html in descriptions]
+
+
+def test_parse_date(bench, crawler, size):
+    """Date normalization across the formats sources publish."""
+    dates = synthetic_dates(size)
+    parsed = bench(lambda: [crawler._parse_date(value) for value in dates], items=size)
+    assert all(parsed)
+
+
+def test_fetch_rss_synthetic(bench, crawler, size):
+    """Feed parsing and item cleanup."""
+    feed = synthetic_feed(size)
+    with patch.object(crawler, '_fetch_text', return_value=(feed, False)):
+        items = bench(crawler._fetch_rss, FEED_URL, items=size)
+    assert len(items) == size
+
+
+def test_crawl_source_synthetic_feed(bench, crawler, size):
+    """Full RSS source crawl: feed parsing, ids, dates and entry building."""
+    feed = synthetic_feed(size)
+    source = crawler.config['sources'][-1]
+    with patch.object(crawler, '_fetch_text', return_value=(feed, False)):
+        entries = bench(crawler.crawl_source, source, items=size)
+    assert len(entries) == size
+
+
+@pytest.mark.parametrize('stream', [False, True], ids=['feedparser', 'streamed'])
+def test_crawl_source_synthetic_feed_history(bench, crawler, size, stream):
+    """RSS crawl of a long history of which only the newest tenth is after the backfill cutoff."""
+    feed = synthetic_feed(size, span_days=size)
+    new = max(size // 10, 1)
+    crawler.config['crawler']['stream_feeds'] = stream
+    crawler.backfill_start = backfill_cutoff({
+        'enabled': True, 'start_date': (date(2026, 1, 1) - timedelta(days=new - 1)).isoformat()
+    })
+    source = crawler.config['sources'][-1]
+    with patch.object(crawler, '_fetch_text', return_value=(feed, False)):
+        entries = bench(crawler.crawl_source, source, items=size)
+    assert len(entries) == new
+
+
+def test_crawl_source_synthetic_sitemap(bench, crawler, size):
+    """Sitemap source crawl: streaming XML parse, lastmod sort, ids and entry building."""
+    sitemap = synthetic_sitemap(size)
+    source = crawler.config['sources'][-2]
+    with patch.object(crawler, '_fetch_text', return_value=(sitemap, False)):
+        entries = bench(crawler.crawl_source, source, items=size)
+    assert len(entries) == size
+
+
+def test_save_entries(bench, crawler, size):
+    """Streaming entries.json to disk with an atomic replace."""
+    entries = synthetic_entries(size)
+    bench(crawler.save_entries, entries, items=size)
+    assert Path(crawler.config['output']['path']).stat().st_size > 0
+
+
+def test_near_duplicates(bench, size):
+    """SimHash fingerprinting and banded lookup against an archive of the same size."""
+    archive = synthetic_articles(size)
+    entries = [{**entry, 'id': f"new-{entry['id']}"} for entry in synthetic_articles(size)]
+    kept, clusters = bench(
+        lambda: deduplicate([dict(entry) for entry in entries], [dict(entry) for entry in archive]),
+        items=size
+    )
+    assert kept == [] and len(clusters) == size - size // 10
@@ -1,9 +1,12 @@
 import sys
 sys.path.insert(0, 'src')
+from bs4 import BeautifulSoup
+
 from crawler import Crawler
 
 c = Crawler('config.yaml')
-soup = c._fetch_page('https://www.cursor.com/changelog')
+html, _ = c._fetch_text('https://www.cursor.com/changelog')
+soup = BeautifulSoup(html, c.parser) if html else None
 
 with open('cursor_fetch_test.html', 'w', encoding='utf-8') as f:
     f.write(soup.prettify())
@@ -0,0 +1,55 @@
+"""
+Agentic AI Landscape Tracker - Entry Change Detection
+Content fingerprints that let incremental runs skip unchanged entries.
+"""
+
+import hashlib
+from typing import Optional
+
+
+def content_fingerprint(entry: dict) -> str:
+    """
+    Compute a stable fingerprint of an entry's cleaned content.
+
+    Whitespace and case are normalized so cosmetic re-crawls of the same
+    text keep the same fingerprint.
+
+    Args:
+        entry: Entry dict with 'title' and 'content'
+
+    Returns:
+        16-character hex fingerprint
+    """
+    title = ' '.join((entry.get('title') or '').split()).lower()
+    content = ' '.join((entry.get('content') or '').split()).lower()
+    return hashlib.sha256(f"{title}\n{content}".encode()).hexdigest()[:16]
+
+
+def stored_fingerprint(entry: dict) -> str:
+    """Get an entry's fingerprint, computing it for entries stored before fingerprints existed."""
+    return entry.get('contentHash') or content_fingerprint(entry)
+
+
+def has_changed(entry: dict, existing: Optional[dict]) -> bool:
+    """Check whether an entry is new or its content differs from the stored version."""
+    if existing is None:
+        return True
+    return stored_fingerprint(entry) != stored_fingerprint(existing)
+
+
+def needs_processing(entry: dict, existing: Optional[dict], min_confidence: int = 75) -> bool:
+    """
+    Decide whether an entry must go back through summarization and categorization.
+
+    Args:
+        entry: Freshly crawled entry
+        existing: Previously processed version of the entry, if any
+        min_confidence: Entries categorized below this confidence are retried
+
+    Returns:
+        True if the entry is new, its content changed, or its category is unreliable
+    """
+    if has_changed(entry, existing):
+        return True
+    confidence = existing.get('categoryConfidence')
+    return confidence is None or confidence == '' or confidence < min_confidence
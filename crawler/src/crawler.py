@@ -3,22 +3,54 @@ Agentic AI Landscape Tracker - Web Crawler
 Fetches and processes content from AI news sources.
 """
 
-import json
 import hashlib
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-import feedparser
 import yaml
-from bs4 import BeautifulSoup
-from dateutil import parser as date_parser
 
 from summarizer import Summarizer
+from throttle import HostThrottle
+from http_cache import HttpCache
+from http_timing import TimingAdapter
+from changes import content_fingerprint, has_changed
+from llm_cache import open_cache
+from parsing import html_to_text, resolve_parser
+from entry_io import iter_entries, write_entries
+from entry_store import open_store
+from dates import backfill_cutoff, is_on_or_after, parse_date
+from dedup import MAX_DISTANCE, add_duplicates, deduplicate
+from fetch_archive import FetchArchive, open_archive
+from profiling import RunProfile, report_path, timed, write_report
+from source_adapters import SourceAdapter, load_adapter, source_type
+
+
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0'
+}
+
+
+class BoundedRetry(Retry):
+    """Retry policy that caps Retry-After waits at backoff_max, as urllib3 caps its own backoff."""
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.backoff_max)
 
 
 class Crawler:
@@ -26,27 +58,79 @@ class Crawler:
     
     def __init__(self, config_path: str = "../config.yaml"):
         self.config = self._load_config(config_path)
-        self.summarizer = Summarizer()
+        self.llm_cache = open_cache(self.config.get('llm_cache'))
+        self.entry_store = open_store(self.config.get('entry_store'))
+        self.summarizer = Summarizer(cache=self.llm_cache)
         self.entries = []
+        self.known_entries = {}
         self.session = self._create_session()
+        self.throttle = HostThrottle(
+            self.config.get('crawler', {}).get('delay_between_requests', 1)
+        )
+        self.http_cache = self._create_http_cache()
+        self.archive = None
+        self.use_archive(open_archive(self.config.get('fetch_archive')))
+        self.parser = resolve_parser(self.config.get('crawler', {}).get('parser', 'auto'))
+        self.backfill_start = backfill_cutoff(self.config.get('backfill'))
+        self.profile = RunProfile()
+        # Adapters are imported for the configured source types only, and
+        # validate each source so a bad config fails at startup
+        self.adapters = {}
+        self.plans = {}
+        for source in self.config.get('sources', []):
+            if source.get('enabled', True):
+                self._adapter(source_type(source)).prepare(source)
         
     def _load_config(self, config_path: str) -> dict:
         """Load crawler configuration from YAML file."""
         with open(config_path, 'r', encoding='utf-8') as f:
             return yaml.safe_load(f)
     
+    def _create_http_cache(self) -> Optional[HttpCache]:
+        """Create the on-disk HTTP cache if enabled in config."""
+        cache_config = self.config.get('http_cache', {})
+        if not cache_config.get('enabled', False):
+            return None
+        return HttpCache(cache_config.get('path', '../data/.http_cache'))
+    
+    def use_archive(self, archive: Optional[FetchArchive]):
+        """
+        Record fetches into, or replay them from, a fetch archive.
+        
+        Replayed crawls bypass the HTTP cache so every page is parsed from
+        the archived body.
+        """
+        self.archive = archive
+        if archive is not None and archive.replaying:
+            self.http_cache = None
+    
     def _create_session(self) -> requests.Session:
-        """Create requests session with retry strategy."""
+        """
+        Create the pooled requests session shared by every fetch.
+        
+        Connections are kept alive per host, and retries with bounded
+        exponential backoff are handled by urllib3 according to config.
+        """
+        crawler_config = self.config.get('crawler', {})
         session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=2,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
+        retry_strategy = BoundedRetry(
+            total=crawler_config.get('max_retries', 3),
+            backoff_factor=crawler_config.get('backoff_factor', 2),
+            backoff_max=crawler_config.get('backoff_max', 30),
+            status_forcelist=crawler_config.get('retry_statuses', [403, 429, 500, 502, 503, 504]),
+            allowed_methods=["HEAD", "GET", "OPTIONS"],
+            respect_retry_after_header=True,
+            # Hand back the final response so callers see the real status
+            raise_on_status=False
+        )
+        self.adapter = TimingAdapter(
+            pool_connections=crawler_config.get('pool_connections', 10),
+            pool_maxsize=crawler_config.get('pool_maxsize', 10),
+            max_retries=retry_strategy
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+        session.mount("http://", self.adapter)
+        session.mount("https://", self.adapter)
+        session.headers.update(BROWSER_HEADERS)
         return session
     
     def _generate_id(self, url: str, title: str) -> str:
@@ -56,256 +140,145 @@ class Crawler:
     
     def _clean_html(self, html_text: str) -> str:
         """Remove HTML tags from text and clean up whitespace."""
-        if not html_text:
-            return ''
-        
-        # Parse HTML and extract text
-        soup = BeautifulSoup(html_text, 'html.parser')
-        text = soup.get_text(separator=' ', strip=True)
-        
-        # Clean up excessive whitespace
-        text = ' '.join(text.split())
-        
-        return text
+        # Feed snippets are stripped from parser events, without building a tree
+        return html_to_text(html_text)
     
+    @timed('extract_content')
     def _extract_article_content(self, article_elem) -> str:
         """Extract clean content from article element, excluding UI elements."""
-        if not article_elem:
-            return ''
-        
-        # Clone to avoid modifying original
-        article = BeautifulSoup(str(article_elem), 'html.parser')
-        
-        # Remove common UI elements
-        for selector in ['nav', 'button', '.button', 'footer', 'header', 
-                        '.nav', '.navigation', '.menu', '.sidebar',
-                        '.cookie', '.banner', '.ad', '.advertisement',
-                        'script', 'style', 'iframe', 'noscript']:
-            for elem in article.select(selector):
-                elem.decompose()
-        
-        # Remove elements with common UI text patterns
-        ui_text_patterns = [
-            'learn more', 'read more', 'continue reading',
-            'share', 'tweet', 'like', 'subscribe', 'follow',
-            'previous', 'next', 'back', 'home',
-            'your browser does not support the video tag',
-            'your browser does not support',
-            'models', 'research', 'announcements'
-        ]
-        
-        # Collect elements to remove (don't remove during iteration)
-        elements_to_remove = []
-        for elem in article.find_all(string=True):
-            text = elem.strip().lower()
-            # Check if text contains any of the patterns
-            for pattern in ui_text_patterns:
-                if pattern in text or text == pattern:
-                    parent = elem.parent
-                    if parent and parent not in elements_to_remove:
-                        elements_to_remove.append(parent)
-                    break
-        
-        # Now remove collected elements
-        for elem in elements_to_remove:
-            elem.decompose()
-        
-        # Prioritize main content areas
-        content = None
-        for selector in ['article', 'main', '[role="main"]', '.content', 
-                        '.article-content', '.post-content', '.entry-content',
-                        'p']:
-            elements = article.select(selector)
-            if elements:
-                # Get paragraphs for better content quality
-                paragraphs = []
-                for elem in elements:
-                    if elem.name == 'p':
-                        text = elem.get_text(strip=True)
-                        if len(text) > 20:  # Only meaningful paragraphs
-                            paragraphs.append(text)
-                    else:
-                        # Extract paragraphs from within the element
-                        for p in elem.find_all('p'):
-                            text = p.get_text(strip=True)
-                            if len(text) > 20:
-                                paragraphs.append(text)
-                
-                if paragraphs:
-                    content = ' '.join(paragraphs[:5])  # First 5 paragraphs
-                    break
-        
-        # Fallback to cleaned full text if no paragraphs found
-        if not content:
-            content = article.get_text(separator=' ', strip=True)
-        
-        # Clean up whitespace and limit length
-        content = ' '.join(content.split())
-        content = content[:800]  # Increased from 500 for better context
-        
-        # Remove common UI patterns from final content using regex
-        import re
-        ui_patterns = [
-            r'january \d{4}',
-            r'february \d{4}',
-            r'march \d{4}',
-            r'april \d{4}',
-            r'may \d{4}',
-            r'june \d{4}',
-            r'july \d{4}',
-            r'august \d{4}',
-            r'september \d{4}',
-            r'october \d{4}',
-            r'november \d{4}',
-            r'december \d{4}',
-            r'learn more',
-            r'read more',
-            r'models',
-            r'research',
-            r'announcements',
-            r'your browser does not support the video tag\.?'
-        ]
-        
-        for pattern in ui_patterns:
-            content = re.sub(pattern, '', content, flags=re.IGNORECASE)
-        
-        # Clean whitespace again after removals
-        content = ' '.join(content.split())
+        from extraction import extract_article_content
+        return extract_article_content(article_elem)
+    
+    @timed('fetch')
+    def _fetch_text(self, url: str) -> Tuple[Optional[str], bool]:
+        """
+        Fetch a URL as text through the pooled session.
         
-        # Ensure it ends with proper punctuation
-        if content and content[-1] not in '.!?':
-            # Try to find last sentence ending
-            for i in range(len(content)-1, max(len(content)-100, 0), -1):
-                if content[i] in '.!?':
-                    content = content[:i+1]
-                    break
-            else:
-                content = content + '.'
+        Retries and backoff are handled by the session's retry policy.
+        When the HTTP cache is enabled the request is conditional, and a
+        304 Not Modified response is answered from the cached body.
         
-        return content
-    
-    def _fetch_page(self, url: str, retry_count: int = 0, max_retries: int = None) -> Optional[BeautifulSoup]:
-        """Fetch and parse a web page with retry logic for 403 errors."""
-        if max_retries is None:
-            max_retries = self.config.get('crawler', {}).get('max_retries', 3)
+        Returns:
+            Tuple of (body text or None on failure, True if unchanged since the cached copy)
+        """
+        if self.archive is not None and self.archive.replaying:
+            return self._replay_text(url)
         
         try:
-            # Enhanced headers to mimic real browser behavior
-            # Note: Removed 'Accept-Encoding' to let requests handle compression automatically
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'Cache-Control': 'max-age=0'
-            }
+            cached = self.http_cache.get(url) if self.http_cache else None
+            headers = self.http_cache.conditional_headers(cached) if cached else {}
             
             # Add delay between requests to be respectful
-            if retry_count > 0:
-                delay = 2 ** retry_count  # Exponential backoff
-                print(f"  Waiting {delay}s before retry...")
-                time.sleep(delay)
-            else:
-                base_delay = self.config.get('crawler', {}).get('delay_between_requests', 1)
-                time.sleep(base_delay)
+            self.profile.add('throttle', self.throttle.wait(url))
             
             timeout = self.config.get('crawler', {}).get('timeout', 30)
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = self.session.get(url, headers=headers, timeout=timeout)
+            self.profile.count('requests')
+            
+            if response.status_code == 304 and cached:
+                self.http_cache.record_hit()
+                self.profile.count('not_modified')
+                if self.archive is not None:
+                    self.archive.record(url, 200, cached['body'])
+                return cached['body'], True
+            
+            if self.archive is not None:
+                self.archive.record(url, response.status_code, response.text)
             response.raise_for_status()
             
             # Ensure we get text content (handles decompression automatically)
-            html_content = response.text
-            return BeautifulSoup(html_content, 'html.parser')
+            text = response.text
+            if self.http_cache:
+                self.http_cache.store(
+                    url,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                    body=text
+                )
+            return text, False
             
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 403:
-                if retry_count < max_retries:
-                    print(f"  403 Forbidden on attempt {retry_count + 1}/{max_retries + 1}, retrying...")
-                    return self._fetch_page(url, retry_count + 1, max_retries)
-                else:
-                    print(f"Error fetching {url}: 403 Forbidden - Site may require authentication or block automated access")
-                    print(f"  Suggestion: Try using RSS feed or API if available")
+                print(f"Error fetching {url}: 403 Forbidden - Site may require authentication or block automated access")
+                print(f"  Suggestion: Try using RSS feed or API if available")
             else:
                 print(f"Error fetching {url}: {e}")
-            return None
+            self.profile.count('fetch_errors')
+            return None, False
         except Exception as e:
             print(f"Error fetching {url}: {e}")
-            return None
+            self.profile.count('fetch_errors')
+            return None, False
+    
+    def _replay_text(self, url: str) -> Tuple[Optional[str], bool]:
+        """Serve a fetch from the archive, without network access or throttle delays."""
+        archived = self.archive.lookup(url)
+        if archived is None:
+            print(f"Error fetching {url}: not in fetch archive {self.archive.path}")
+        elif archived['status'] >= 400:
+            print(f"Error fetching {url}: {archived['status']} (archived response)")
+        else:
+            return archived['body'], False
+        self.profile.count('fetch_errors')
+        return None, False
     
+    @timed('fetch_rss')
     def _fetch_rss(self, rss_url: str) -> list:
-        """Fetch and parse RSS feed."""
-        try:
-            feed = feedparser.parse(rss_url)
-            entries = []
-            for entry in feed.entries:
-                # Get raw content and clean HTML tags
-                raw_content = entry.get('summary', entry.get('description', ''))
-                clean_content = self._clean_html(raw_content)
-                
-                # Apply same cleaning as article extraction
-                if clean_content:
-                    # Remove common UI patterns (case-insensitive)
-                    ui_patterns = ['learn more', 'read more', 'continue reading',
-                                 'share', 'tweet', 'subscribe', 'follow',
-                                 'your browser does not support the video tag']
-                    for pattern in ui_patterns:
-                        # Case-insensitive replacement
-                        import re
-                        clean_content = re.sub(re.escape(pattern), '', clean_content, flags=re.IGNORECASE)
-                    
-                    # Clean whitespace
-                    clean_content = ' '.join(clean_content.split())
-                    
-                    # Limit length and ensure proper ending
-                    clean_content = clean_content[:800]
-                    if clean_content and clean_content[-1] not in '.!?':
-                        for i in range(len(clean_content)-1, max(len(clean_content)-100, 0), -1):
-                            if clean_content[i] in '.!?':
-                                clean_content = clean_content[:i+1]
-                                break
-                        else:
-                            clean_content = clean_content + '.'
-                
-                entries.append({
-                    'title': entry.get('title', ''),
-                    'url': entry.get('link', ''),
-                    'date': entry.get('published', entry.get('updated', '')),
-                    'content': clean_content
-                })
-            return entries
-        except Exception as e:
-            print(f"Error fetching RSS {rss_url}: {e}")
-            return []
+        """Fetch and parse RSS feed, reusing the cached result if unchanged."""
+        return self._adapter('rss').fetch(rss_url)
     
     def _parse_date(self, date_str: str) -> Optional[str]:
         """Parse date string to ISO format."""
-        if not date_str:
-            return None
-        try:
-            parsed = date_parser.parse(date_str)
-            return parsed.strftime('%Y-%m-%d')
-        except Exception:
-            return None
+        return parse_date(date_str)
     
     def _is_within_backfill_range(self, date_str: Optional[str]) -> bool:
         """Check if date is within backfill range."""
-        if not date_str:
-            return True  # Include if no date
-        if not self.config.get('backfill', {}).get('enabled', False):
-            return True
-            
-        start_date = self.config['backfill'].get('start_date', '2024-01-01')
-        try:
-            entry_date = datetime.strptime(date_str, '%Y-%m-%d')
-            backfill_start = datetime.strptime(start_date, '%Y-%m-%d')
-            return entry_date >= backfill_start
-        except Exception:
+        # The cutoff is computed once from config; undated entries are included
+        return is_on_or_after(date_str, self.backfill_start)
+    
+    def _make_entry(self, entry_id: str, title: str, source_name: str, url: str,
+                    date: Optional[str], content: str) -> dict:
+        """Build an entry dict with its content fingerprint."""
+        entry = {
+            'id': entry_id,
+            'title': title,
+            'source': source_name,
+            'url': url,
+            'date': date,
+            'content': content,
+            'contentHash': None,
+            'summary': None,
+            'category': '',
+            'tags': []
+        }
+        entry['contentHash'] = content_fingerprint(entry)
+        return entry
+    
+    def _reached_known_entries(self, known_streak: int) -> bool:
+        """Check whether an incremental crawl has caught up with stored entries."""
+        limit = self.config.get('crawler', {}).get('known_streak', 3)
+        if self.known_entries and known_streak >= limit:
+            print(f"  Reached {known_streak} already-known entries, stopping")
             return True
+        return False
+    
+    def _source_plan(self, source: dict):
+        """Get the compiled plan for a listing source, rebuilding it if its selectors changed."""
+        from source_plan import SourcePlan
+        return self._plan(source, SourcePlan)
+    
+    def _pagination_plan(self, source: dict):
+        """Get the pagination plan for a feed, sitemap or API source, without compiling selectors."""
+        from pagination import PaginationPlan
+        return self._plan(source, PaginationPlan)
+    
+    def _plan(self, source: dict, plan_class: type):
+        """Get the cached plan of a class for a source, rebuilding it if its config changed."""
+        plan = self.plans.get(source['name'])
+        if not isinstance(plan, plan_class) or not plan.matches(source):
+            plan = plan_class(source)
+            self.plans[source['name']] = plan
+        return plan
     
     def crawl_source(self, source: dict) -> list:
         """Crawl a single source for articles."""
@@ -315,96 +288,42 @@ class Crawler:
             return []
         
         print(f"Crawling {source['name']}...")
-        entries = []
-        
-        # Try RSS first if available
-        if source.get('rss_url'):
-            rss_entries = self._fetch_rss(source['rss_url'])
-            for entry in rss_entries:
-                date = self._parse_date(entry['date'])
-                if not self._is_within_backfill_range(date):
-                    continue
-                    
-                entries.append({
-                    'id': self._generate_id(entry['url'], entry['title']),
-                    'title': entry['title'],
-                    'source': source['name'],
-                    'url': entry['url'],
-                    'date': date,
-                    'content': entry['content'],
-                    'summary': None,
-                    'category': '',
-                    'tags': []
-                })
-        else:
-            # Fall back to HTML scraping
-            soup = self._fetch_page(source['url'])
-            if soup:
-                selectors = source.get('selectors', {})
-                articles = soup.select(selectors.get('article_list', 'article'))
-                
-                for article in articles[:20]:  # Limit to 20 per source
-                    title_elem = article.select_one(selectors.get('title', 'h2'))
-                    date_elem = article.select_one(selectors.get('date', 'time'))
-                    
-                    # Handle link: if selector is None/null, the article element itself is the link
-                    link_selector = selectors.get('link', 'a')
-                    if link_selector is None:
-                        # Article element itself is the link
-                        link_elem = article if article.name == 'a' else None
-                    else:
-                        link_elem = article.select_one(link_selector)
-                    
-                    if not title_elem:
-                        continue
-                    
-                    title = title_elem.get_text(strip=True)
-                    url = link_elem.get('href', '') if link_elem else ''
-                    
-                    # Handle relative URLs
-                    if url and not url.startswith('http'):
-                        from urllib.parse import urlparse
-                        parsed = urlparse(source['url'])
-                        
-                        # If URL starts with '/', it's an absolute path from domain root
-                        if url.startswith('/'):
-                            url = f"{parsed.scheme}://{parsed.netloc}{url}"
-                        else:
-                            # Otherwise, it's relative to the source URL
-                            base_url = source['url'].rstrip('/')
-                            url = f"{base_url}/{url.lstrip('/')}"
-                    
-                    date_str = date_elem.get('datetime', date_elem.get_text(strip=True)) if date_elem else None
-                    date = self._parse_date(date_str)
-                    
-                    if not self._is_within_backfill_range(date):
-                        continue
-                    
-                    # Extract clean content
-                    content = self._extract_article_content(article)
-                    
-                    entries.append({
-                        'id': self._generate_id(url, title),
-                        'title': title,
-                        'source': source['name'],
-                        'url': url,
-                        'date': date,
-                        'content': content,
-                        'summary': None,
-                        'category': '',
-                        'tags': []
-                    })
+        with self.profile.source(source['name']):
+            entries = self._crawl_entries(source)
+            self.profile.count('entries', len(entries))
         
         print(f"  Found {len(entries)} entries from {source['name']}")
         return entries
     
+    def _adapter(self, type_name: str) -> SourceAdapter:
+        """Get the adapter for a source type, importing it on first use."""
+        adapter = self.adapters.get(type_name)
+        if adapter is None:
+            adapter = self.adapters[type_name] = load_adapter(type_name)(self)
+        return adapter
+    
+    def _crawl_entries(self, source: dict) -> list:
+        """Fetch and extract the entries of an enabled source."""
+        return self._adapter(source_type(source)).crawl(source)
+    
+    @timed('crawl_all')
     def crawl_all(self) -> list:
         """Crawl all configured sources."""
         all_entries = []
-        
-        for source in self.config.get('sources', []):
-            entries = self.crawl_source(source)
-            all_entries.extend(entries)
+        sources = self.config.get('sources', [])
+        max_workers = self.config.get('crawler', {}).get('max_workers', 1)
+        
+        if max_workers > 1 and len(sources) > 1:
+            # Crawl sources in parallel; the host throttle keeps the
+            # per-site delay, and map() preserves config order so the
+            # dedup below keeps the same entry as a sequential run
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for entries in executor.map(self.crawl_source, sources):
+                    all_entries.extend(entries)
+        else:
+            for source in sources:
+                entries = self.crawl_source(source)
+                all_entries.extend(entries)
         
         # Remove duplicates by ID
         seen_ids = set()
@@ -414,61 +333,274 @@ class Crawler:
                 seen_ids.add(entry['id'])
                 unique_entries.append(entry)
         
+        print(self.adapter.summary())
+        if self.http_cache:
+            print(self.http_cache.stats())
+        
         # Sort by date (newest first)
         unique_entries.sort(key=lambda x: x['date'] or '1900-01-01', reverse=True)
         
         return unique_entries
     
+    @timed('generate_summaries')
     def generate_summaries(self, entries: list) -> list:
         """Generate summaries and categorize entries using Copilot SDK."""
         print("Generating summaries and categories...")
         for entry in entries:
-            if not entry.get('summary') and entry.get('content'):
+            needs_summary = not entry.get('summary') and entry.get('content')
+            needs_category = not entry.get('category') and entry.get('content')
+            
+            if needs_summary or needs_category:
+                self.profile.count('enriched')
+            
+            if needs_summary and needs_category:
+                # One round trip for both fields
+                result = self.summarizer.enrich(
+                    title=entry['title'],
+                    content=entry['content'],
+                    source=entry['source']
+                )
+                entry['summary'] = result['summary']
+                entry['category'] = result['category']
+                if result.get('confidence') is not None:
+                    entry['categoryConfidence'] = result['confidence']
+            elif needs_summary:
                 entry['summary'] = self.summarizer.summarize(
                     title=entry['title'],
                     content=entry['content'],
                     source=entry['source']
                 )
             # Categorize entry (only if Copilot SDK available)
-            if not entry.get('category') and entry.get('content'):
+            elif needs_category:
                 entry['category'] = self.summarizer.categorize(
                     title=entry['title'],
                     content=entry['content']
                 )
         return entries
     
+    def _timestamp(self) -> str:
+        """Current UTC time as recorded in last_updated."""
+        return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+    
+    @timed('save_entries')
     def save_entries(self, entries: list):
         """Save entries to JSON file."""
         output_path = Path(self.config['output']['path'])
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        metadata = {'last_updated': self._timestamp()}
         
-        data = {
-            'last_updated': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
-            'entries': entries
-        }
+        # Streamed to a temporary file and renamed, so a crash never leaves a truncated output
+        count = write_entries(output_path, entries, metadata)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        print(f"Saved {count} entries to {output_path}")
+    
+    def load_previous_entries(self) -> list:
+        """Load entries from the previous run's output, if any."""
+        output_path = Path(self.config['output']['path'])
+        if not output_path.exists():
+            return []
+        try:
+            return list(iter_entries(output_path))
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read previous entries from {output_path}: {e}")
+            return []
+    
+    def seed_entry_store(self):
+        """Import the existing output into an empty entry store."""
+        output_path = Path(self.config['output']['path'])
+        if len(self.entry_store) == 0 and output_path.exists():
+            count = self.entry_store.import_json(output_path)
+            print(f"Imported {count} entries from {output_path} into the entry store")
+    
+    @timed('save_entries')
+    def export_entry_store(self) -> list:
+        """Write the output file from the entry store and return its entries."""
+        output_path = Path(self.config['output']['path'])
+        count = self.entry_store.export_json(output_path, self._timestamp())
+        print(f"Saved {count} entries from the entry store to {output_path}")
+        return list(self.entry_store.iter_entries())
+    
+    def merge_entries(self, previous: list, crawled: list) -> Tuple[list, list]:
+        """
+        Merge freshly crawled entries into the previous output.
         
-        print(f"Saved {len(entries)} entries to {output_path}")
+        Stored entries keep any enrichment added since they were first
+        crawled; only new or changed entries are returned for processing.
+        
+        Args:
+            previous: Entries from the previous output, newest first
+            crawled: Entries from this crawl
+            
+        Returns:
+            Tuple of (merged entries sorted newest first, new or changed entries)
+        """
+        existing_by_id = {entry['id']: entry for entry in previous}
+        fresh = [
+            entry for entry in crawled
+            if has_changed(entry, existing_by_id.get(entry['id']))
+        ]
+        fresh_ids = {entry['id'] for entry in fresh}
+        kept = [entry for entry in previous if entry['id'] not in fresh_ids]
+        
+        # Both lists are already date-sorted, so Timsort merges the two runs
+        # in linear time; fresh entries go first among equal dates
+        merged = fresh + kept
+        merged.sort(key=lambda x: x['date'] or '1900-01-01', reverse=True)
+        return merged, fresh
+    
+    @timed('dedup')
+    def fold_near_duplicates(self, entries: list, previous: list) -> list:
+        """
+        Drop crawled entries that near-duplicate a stored or earlier entry.
+        
+        Duplicates never reach the summarizer; each is listed under its
+        canonical entry's `duplicates` instead.
+        
+        Args:
+            entries: Crawled entries, newest first
+            previous: Entries from the previous output (incremental runs
+                without the entry store)
+            
+        Returns:
+            Crawled entries without near-duplicates
+        """
+        max_distance = self.config.get('dedup', {}).get('max_distance', MAX_DISTANCE)
+        unfingerprinted = []
+        
+        def stored_entries():
+            for entry in self.entry_store.iter_entries():
+                if not entry.get('simhash'):
+                    unfingerprinted.append(entry)
+                yield entry
+        
+        archive = stored_entries() if self.entry_store is not None else previous
+        kept, clusters = deduplicate(entries, archive, max_distance)
+        
+        # Save fingerprints computed for stored entries (such as those imported
+        # from entries.json) so later runs index them without recomputing
+        fingerprinted = [entry for entry in unfingerprinted if entry.get('simhash')]
+        if fingerprinted:
+            self.entry_store.upsert(fingerprinted)
+            print(f"Saved SimHash fingerprints of {len(fingerprinted)} stored entries")
+        
+        kept_by_id = {entry['id']: entry for entry in kept}
+        previous_by_id = {entry['id']: entry for entry in previous} if clusters else {}
+        for canonical_id, duplicates in clusters.items():
+            if canonical_id in kept_by_id:
+                add_duplicates(kept_by_id[canonical_id], duplicates)
+            if self.entry_store is not None:
+                stored = self.entry_store.get(canonical_id)
+                if stored is not None and add_duplicates(stored, duplicates):
+                    self.entry_store.upsert([stored])
+            elif canonical_id in previous_by_id:
+                add_duplicates(previous_by_id[canonical_id], duplicates)
+        
+        folded = len(entries) - len(kept)
+        self.profile.count('near_duplicates', folded)
+        print(f"Folded {folded} near-duplicate entries")
+        return kept
     
-    def run(self):
-        """Run the full crawl pipeline."""
-        print("Starting crawler...")
+    def write_run_report(self, incremental: bool, total_entries: int):
+        """Write the JSON run report next to the output file."""
+        path = report_path(self.config['output']['path'])
+        write_report(path, self.profile.report(
+            incremental=incremental,
+            total_entries=total_entries,
+            http=self.adapter.totals(),
+        ))
+        print(f"Saved run report to {path}")
+    
+    def run(self, incremental: Optional[bool] = None):
+        """
+        Run the full crawl pipeline.
+        
+        Args:
+            incremental: Merge into the previous output instead of rebuilding it
+                (defaults to the crawler.incremental config setting)
+        """
+        if incremental is None:
+            incremental = self.config.get('crawler', {}).get('incremental', False)
+        print(f"Starting crawler{' (incremental)' if incremental else ''}...")
+        self.profile = RunProfile()
+        
+        previous = []
+        if self.entry_store is not None:
+            self.seed_entry_store()
+            if incremental:
+                # Indexed id lookups instead of loading the previous output
+                self.known_entries = self.entry_store
+        elif incremental:
+            previous = self.load_previous_entries()
+            self.known_entries = {entry['id']: entry for entry in previous}
+            print(f"Loaded {len(previous)} previous entries")
         
         # Crawl all sources
         entries = self.crawl_all()
         
-        # Generate summaries
-        entries = self.generate_summaries(entries)
+        if self.config.get('dedup', {}).get('enabled', False):
+            entries = self.fold_near_duplicates(entries, previous)
+        
+        if self.entry_store is not None:
+            # The store is the source of truth: every run merges into it,
+            # writing new and changed entries only once they are enriched
+            fresh = self.entry_store.diff(entries)
+            print(f"{len(fresh)} new or changed entries")
+            self.generate_summaries(fresh)
+            self.entry_store.upsert(fresh)
+            entries = self.export_entry_store()
+        elif incremental:
+            entries, fresh = self.merge_entries(previous, entries)
+            print(f"{len(fresh)} new or changed entries")
+            # Only new or changed entries need summaries
+            self.generate_summaries(fresh)
+            self.save_entries(entries)
+        else:
+            # Generate summaries
+            entries = self.generate_summaries(entries)
+            self.save_entries(entries)
+        
+        if self.llm_cache is not None:
+            print(self.llm_cache.stats())
+        if self.entry_store is not None:
+            print(self.entry_store.stats())
+        if self.archive is not None:
+            print(self.archive.stats())
         
-        # Save to file
-        self.save_entries(entries)
+        print(self.profile.summary())
+        if self.config.get('profiling', {}).get('report', False):
+            self.write_run_report(incremental, len(entries))
         
         print("Crawl complete!")
         return entries
 
 
 if __name__ == '__main__':
-    crawler = Crawler()
-    crawler.run()
+    import argparse
+    from profiling import PROFILERS, profile_call, profile_path
+    
+    arg_parser = argparse.ArgumentParser(description="Crawl AI news sources")
+    arg_parser.add_argument('--config', default="../config.yaml", help="Path to config.yaml")
+    arg_parser.add_argument('--incremental', action='store_true', default=None,
+                            help="Merge new entries into the existing output instead of rebuilding it")
+    arg_parser.add_argument('--profile', nargs='?', const='cprofile', choices=PROFILERS,
+                            help="Profile the run with cProfile (default) or pyinstrument")
+    archive_group = arg_parser.add_mutually_exclusive_group()
+    archive_group.add_argument('--record', nargs='?', const='', metavar='ARCHIVE',
+                               help="Save every fetched page and feed to a fetch archive")
+    archive_group.add_argument('--replay', nargs='?', const='', metavar='ARCHIVE',
+                               help="Serve every fetch from a fetch archive, without network access")
+    args = arg_parser.parse_args()
+    
+    crawler = Crawler(args.config)
+    for mode in ('record', 'replay'):
+        archive_path = getattr(args, mode)
+        if archive_path is not None:
+            default_path = crawler.config.get('fetch_archive', {}).get('path', '../data/fetch_archive')
+            crawler.use_archive(FetchArchive(archive_path or default_path, mode))
+    if args.profile:
+        # Profilers only see the calling thread, so crawl sources sequentially
+        crawler.config.setdefault('crawler', {})['max_workers'] = 1
+        print("Profiling: crawling sources sequentially (max_workers = 1)")
+        output = profile_path(crawler.config['output']['path'], args.profile)
+        profile_call(lambda: crawler.run(incremental=args.incremental), args.profile, output)
+    else:
+        crawler.run(incremental=args.incremental)
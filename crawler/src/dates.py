@@ -0,0 +1,133 @@
+"""
+Agentic AI Landscape Tracker - Date Normalization
+Turns the date strings sources publish into ISO dates (YYYY-MM-DD), with
+fast paths for ISO-8601, RFC-822 and "Month D, YYYY" strings, an LRU cache
+for repeated values, and ordinal comparison against the backfill cutoff.
+
+Results match dateutil.parser.parse(value).strftime('%Y-%m-%d'): the date
+is taken as written, without converting between time zones. Anything the
+fast paths do not fully recognise falls back to dateutil.
+"""
+
+import re
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+
+CACHE_SIZE = 4096
+
+ISO_RE = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.\d{1,6})?)?(?:Z|[+-](?:[01]\d|2[0-3]):?[0-5]\d)?)?',
+    re.ASCII
+)
+
+MONTHS = {
+    name: number
+    for number, names in enumerate((
+        ('jan', 'january'), ('feb', 'february'), ('mar', 'march'), ('apr', 'april'),
+        ('may',), ('jun', 'june'), ('jul', 'july'), ('aug', 'august'),
+        ('sep', 'september'), ('oct', 'october'), ('nov', 'november'), ('dec', 'december'),
+    ), start=1)
+    for name in names
+}
+_MONTH = '|'.join(sorted(MONTHS, key=len, reverse=True))
+_WEEKDAY = r'(?:mon|tue|wed|thu|fri|sat|sun)'
+
+# "Mon, 01 Jan 2024 08:00:00 GMT" as in RSS pubDate
+RFC822_RE = re.compile(
+    rf'(?:{_WEEKDAY},\s*)?(\d{{1,2}})\s+({_MONTH})\s+(\d{{4}})'
+    r'\s+(\d{2}):(\d{2})(?::(\d{2}))?(?:\s*(?:GMT|UTC|UT|Z|[+-](?:[01]\d|2[0-3])[0-5]\d))?',
+    re.IGNORECASE | re.ASCII
+)
+
+# "Jan 5, 2024" / "January 05 2024" as on listing pages
+MONTH_DAY_YEAR_RE = re.compile(rf'({_MONTH})\s+(\d{{1,2}}),?\s+(\d{{4}})', re.IGNORECASE | re.ASCII)
+
+
+def _iso(year: int, month: int, day: int, hour: int = 0, minute: int = 0, second: int = 0) -> Optional[str]:
+    """ISO date for valid components, or None so the caller falls back to dateutil."""
+    try:
+        return datetime(year, month, day, hour, minute, second).strftime('%Y-%m-%d')
+    except ValueError:
+        return None
+
+
+def _fast_path(value: str) -> Optional[str]:
+    match = ISO_RE.fullmatch(value)
+    if match:
+        year, month, day, hour, minute, second = (int(g or 0) for g in match.groups())
+        return _iso(year, month, day, hour, minute, second)
+
+    match = RFC822_RE.fullmatch(value)
+    if match:
+        day, month, year, hour, minute, second = match.groups()
+        return _iso(int(year), MONTHS[month.lower()], int(day), int(hour), int(minute), int(second or 0))
+
+    match = MONTH_DAY_YEAR_RE.fullmatch(value)
+    if match:
+        month, day, year = match.groups()
+        return _iso(int(year), MONTHS[month.lower()], int(day))
+    return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_string(value: str) -> Optional[str]:
+    result = _fast_path(value.strip())
+    if result is not None:
+        return result
+    from dateutil import parser as date_parser
+    try:
+        return date_parser.parse(value).strftime('%Y-%m-%d')
+    except Exception:
+        return None
+
+
+def parse_date(value) -> Optional[str]:
+    """
+    Normalize a date to an ISO date string.
+
+    Args:
+        value: Date string, or a time.struct_time such as feedparser's
+            published_parsed (already in UTC)
+
+    Returns:
+        'YYYY-MM-DD', or None if the value is empty or unparseable
+    """
+    if not value:
+        return None
+    if isinstance(value, time.struct_time):
+        return _iso(value.tm_year, value.tm_mon, value.tm_mday)
+    return _parse_string(value)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def date_ordinal(iso_date: str) -> Optional[int]:
+    """Proleptic Gregorian ordinal of a 'YYYY-MM-DD' date, or None if invalid."""
+    try:
+        return datetime.strptime(iso_date, '%Y-%m-%d').toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+def backfill_cutoff(backfill: Optional[dict]) -> Optional[int]:
+    """
+    Ordinal of the backfill start date from a `backfill` config section.
+
+    Returns:
+        Ordinal to compare entry dates against, or None if backfill is
+        disabled or its start_date is invalid (nothing is filtered out)
+    """
+    if not backfill or not backfill.get('enabled', False):
+        return None
+    return date_ordinal(str(backfill.get('start_date', '2024-01-01')))
+
+
+def is_on_or_after(iso_date: Optional[str], cutoff: Optional[int]) -> bool:
+    """Whether an entry date passes the cutoff; undated and unparseable dates pass."""
+    if cutoff is None or not iso_date:
+        return True
+    ordinal = date_ordinal(iso_date)
+    return ordinal is None or ordinal >= cutoff
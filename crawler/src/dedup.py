@@ -0,0 +1,194 @@
+"""
+Agentic AI Landscape Tracker - Near-Duplicate Detection
+SimHash fingerprints of an entry's cleaned content, indexed with
+locality-sensitive banding so each new entry is compared with a small
+fraction of the archive instead of every entry in it.
+
+Two fingerprints within MAX_DISTANCE bits of each other are near-duplicates.
+The 64 bits are split into MAX_DISTANCE // 2 + 1 bands, so by the pigeonhole
+principle any such pair differs in at most one bit of some band. A lookup
+probes each band's value and its single-bit flips: with the default 4 bands
+of 16 bits that is 68 dictionary lookups, and for evenly spread fingerprints
+about n / 960 candidates to compare (about 100 at 100k entries). The work
+still grows linearly with the archive, but with that small a constant.
+"""
+
+import hashlib
+import re
+from typing import Iterable, Optional, Tuple
+
+
+SIMHASH_BITS = 64
+# Light edits to a few paragraphs move a fingerprint by up to ~10 bits,
+# unrelated entries differ by 20 or more
+MAX_DISTANCE = 6
+
+# Entries with fewer shingles than this (e.g. title only) are only deduplicated by id
+MIN_FEATURES = 8
+SHINGLE_SIZE = 2
+
+WORD_RE = re.compile(r'[^\W_]+')
+
+
+def features(entry: dict) -> list:
+    """
+    Word shingles of an entry's lowercased content.
+
+    The title is left out so re-titled copies still match.
+    """
+    words = WORD_RE.findall((entry.get('content') or '').lower())
+    return [' '.join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+
+
+def _feature_bits(feature: str) -> str:
+    digest = hashlib.blake2b(feature.encode('utf-8'), digest_size=SIMHASH_BITS // 8).digest()
+    return format(int.from_bytes(digest, 'big'), f'0{SIMHASH_BITS}b')
+
+
+def simhash(entry: dict) -> Optional[int]:
+    """
+    64-bit SimHash of an entry.
+
+    Returns:
+        Fingerprint, or None if the entry has too little text to compare
+    """
+    shingles = features(entry)
+    if len(shingles) < MIN_FEATURES:
+        return None
+    # Each bit is set when most shingle hashes have it set; every column of
+    # the joined bit strings is a stride slice, counted in C
+    rows = ''.join([_feature_bits(shingle) for shingle in shingles])
+    majority = len(shingles) / 2
+    column_bits = ['1' if rows[i::SIMHASH_BITS].count('1') > majority else '0' for i in range(SIMHASH_BITS)]
+    return int(''.join(column_bits), 2)
+
+
+def entry_simhash(entry: dict) -> Optional[int]:
+    """An entry's fingerprint, from its stored simhash field if present."""
+    stored = entry.get('simhash')
+    if stored:
+        return int(stored, 16)
+    return simhash(entry)
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class NearDuplicateIndex:
+    """Banded, multi-probe SimHash index mapping fingerprints to entry ids."""
+
+    def __init__(self, max_distance: int = MAX_DISTANCE):
+        self.max_distance = max_distance
+        # Wide bands keep buckets small; a pair within max_distance then
+        # differs in at most one bit of some band, which find() probes for
+        bands = max_distance // 2 + 1
+        widths = [SIMHASH_BITS // bands + (1 if i < SIMHASH_BITS % bands else 0) for i in range(bands)]
+        self._bands = []
+        shift = SIMHASH_BITS
+        for width in widths:
+            shift -= width
+            self._bands.append((shift, (1 << width) - 1, [1 << bit for bit in range(width)]))
+        self._buckets = [{} for _ in self._bands]
+        # entry id -> (fingerprint, insertion order)
+        self._fingerprints = {}
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def __contains__(self, entry_id) -> bool:
+        return entry_id in self._fingerprints
+
+    def _keys(self, fingerprint: int):
+        return [(fingerprint >> shift) & mask for shift, mask, _ in self._bands]
+
+    def add(self, entry_id: str, fingerprint: int):
+        """Index an entry's fingerprint."""
+        self._fingerprints[entry_id] = (fingerprint, len(self._fingerprints))
+        for buckets, key in zip(self._buckets, self._keys(fingerprint)):
+            buckets.setdefault(key, []).append(entry_id)
+
+    def find(self, fingerprint: int) -> Optional[str]:
+        """
+        Find the closest indexed entry within max_distance bits.
+
+        Returns:
+            Entry id (the earliest indexed on ties), or None
+        """
+        best = None
+        best_rank = (self.max_distance + 1, 0)
+        for (_, _, flips), buckets, key in zip(self._bands, self._buckets, self._keys(fingerprint)):
+            for probe in (key, *(key ^ flip for flip in flips)):
+                for entry_id in buckets.get(probe, ()):
+                    indexed, order = self._fingerprints[entry_id]
+                    rank = (hamming(fingerprint, indexed), order)
+                    if rank < best_rank:
+                        best, best_rank = entry_id, rank
+        return best
+
+
+def deduplicate(entries: list, archive: Iterable[dict] = (),
+                max_distance: int = MAX_DISTANCE) -> Tuple[list, dict]:
+    """
+    Drop crawled entries that near-duplicate an archived or earlier entry.
+
+    Archived entries are always canonical. Crawled entries are checked
+    oldest first, so a syndicated copy is folded into the original
+    announcement. Entries whose id is already archived are re-crawls, not
+    duplicates, and are kept. Kept entries get a `simhash` field so later
+    runs can index them without recomputing it.
+
+    Args:
+        entries: Crawled entries, newest first
+        archive: Previously stored entries
+        max_distance: Largest Hamming distance treated as a duplicate
+
+    Returns:
+        Tuple of (kept entries in their original order, dict of canonical
+        id -> list of duplicate entries)
+    """
+    index = NearDuplicateIndex(max_distance)
+    for entry in archive:
+        fingerprint = entry_simhash(entry)
+        if fingerprint is not None:
+            entry.setdefault('simhash', format(fingerprint, '016x'))
+            index.add(entry['id'], fingerprint)
+
+    duplicate_ids = set()
+    clusters = {}
+    # Oldest first, so the original becomes canonical
+    for entry in reversed(entries):
+        fingerprint = entry_simhash(entry)
+        if fingerprint is None:
+            continue
+        if entry['id'] in index:
+            continue
+        canonical = index.find(fingerprint)
+        if canonical is None:
+            entry['simhash'] = format(fingerprint, '016x')
+            index.add(entry['id'], fingerprint)
+        else:
+            clusters.setdefault(canonical, []).append(entry)
+            duplicate_ids.add(entry['id'])
+
+    kept = [entry for entry in entries if entry['id'] not in duplicate_ids]
+    return kept, clusters
+
+
+def add_duplicates(canonical: dict, duplicates: list) -> bool:
+    """
+    Record duplicates on their canonical entry.
+
+    Returns:
+        True if the canonical entry's duplicates list changed
+    """
+    recorded = canonical.setdefault('duplicates', [])
+    known = {item['id'] for item in recorded}
+    changed = False
+    for duplicate in duplicates:
+        if duplicate['id'] not in known:
+            recorded.append({'id': duplicate['id'], 'source': duplicate.get('source'),
+                             'url': duplicate.get('url')})
+            known.add(duplicate['id'])
+            changed = True
+    return changed
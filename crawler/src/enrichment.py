@@ -0,0 +1,230 @@
+"""
+Agentic AI Landscape Tracker - LLM Enrichment Helpers
+Prompt building, response parsing and checkpointing shared by the
+entry enrichment pipeline.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+
+CATEGORIES = ('Agentic AI', 'Other')
+
+# Bump when the enrichment prompt wording changes so cached results
+# produced by the old prompt are no longer reused
+PROMPT_VERSION = 1
+
+CATEGORY_GUIDE = """   - "Agentic AI" = AI systems that can take actions, make decisions, use tools, plan, or operate autonomously
+   - "Other" = General AI models, applications, partnerships, policy, infrastructure, etc."""
+
+
+def build_prompt(entry: dict) -> str:
+    """Build the summary + category prompt for a single entry."""
+    return f"""Analyze this AI news entry and provide:
+1. A concise 1-2 sentence summary of the content
+2. Choose the best category: "Agentic AI" or "Other"
+{CATEGORY_GUIDE}
+3. Your confidence level (0-100) in the category choice
+
+Entry:
+Title: {entry.get('title', '')}
+Source: {entry.get('source', '')}
+Content: {entry.get('content', '')}
+
+Respond in this exact JSON format:
+{{
+  "summary": "your summary here",
+  "category": "Agentic AI" or "Other",
+  "confidence": 85
+}}"""
+
+
+def build_batch_prompt(entries: list) -> str:
+    """Build one prompt asking for summary + category of several entries."""
+    blocks = []
+    for entry in entries:
+        blocks.append(f"""ID: {entry.get('id', '')}
+Title: {entry.get('title', '')}
+Source: {entry.get('source', '')}
+Content: {entry.get('content', '')}""")
+    joined = '\n\n'.join(blocks)
+    return f"""Analyze each of these {len(entries)} AI news entries and provide for each:
+1. A concise 1-2 sentence summary of the content
+2. Choose the best category: "Agentic AI" or "Other"
+{CATEGORY_GUIDE}
+3. Your confidence level (0-100) in the category choice
+
+Entries:
+
+{joined}
+
+Respond with ONLY a JSON array containing one object per entry, in the same order:
+[
+  {{"id": "entry id", "summary": "your summary here", "category": "Agentic AI" or "Other", "confidence": 85}}
+]"""
+
+
+def fallback_result(entry: dict, confidence: int = 0) -> dict:
+    """Result used when the model response is missing or unusable."""
+    return {
+        'summary': entry.get('content', '')[:200],
+        'category': 'Other',
+        'confidence': confidence
+    }
+
+
+def normalize_result(result: dict, fallback_summary: str, fallback_confidence: Optional[int] = 50) -> dict:
+    """
+    Coerce one parsed result into summary/category/confidence, field by field.
+
+    Args:
+        result: Parsed model response
+        fallback_summary: Summary used when the response has none
+        fallback_confidence: Confidence used when the response has no numeric one
+
+    Returns:
+        Dict with summary, category (one of CATEGORIES) and confidence (0-100)
+    """
+    summary = result.get('summary')
+    if not isinstance(summary, str) or not summary.strip():
+        summary = fallback_summary
+
+    category = result.get('category')
+    if category not in CATEGORIES:
+        category = 'Agentic AI' if isinstance(category, str) and 'agentic' in category.lower() else 'Other'
+
+    try:
+        confidence = int(float(result.get('confidence')))
+        confidence = max(0, min(100, confidence))
+    except (TypeError, ValueError):
+        confidence = fallback_confidence
+
+    return {'summary': summary.strip(), 'category': category, 'confidence': confidence}
+
+
+def extract_json_object(response_text: str) -> Optional[dict]:
+    """
+    Find the first JSON object in a model response.
+
+    Tolerates prose, markdown code fences and stray braces around the
+    object by trying to decode from every opening brace in turn.
+    """
+    text = response_text or ''
+    decoder = json.JSONDecoder()
+    start = text.find('{')
+    while start != -1:
+        try:
+            value, _ = decoder.raw_decode(text, start)
+            if isinstance(value, dict):
+                return value
+        except ValueError:
+            pass
+        start = text.find('{', start + 1)
+    return None
+
+
+def parse_result(response_text: str, entry: dict) -> Optional[dict]:
+    """
+    Parse a single-entry JSON response.
+
+    Returns:
+        Normalized result dict, or None if no JSON object could be found
+    """
+    result = extract_json_object(response_text)
+    if result is None:
+        return None
+    return normalize_result(result, fallback_result(entry)['summary'])
+
+
+def parse_batch_result(response_text: str, entries: list) -> dict:
+    """
+    Parse a JSON array response for a batch of entries.
+
+    Results are matched by id, falling back to position when the model
+    drops or mangles ids.
+
+    Returns:
+        Dict of entry id -> normalized result, for the entries that were answered
+    """
+    match = re.search(r'\[[\s\S]*\]', response_text or '')
+    if not match:
+        return {}
+    try:
+        items = json.loads(match.group())
+    except ValueError:
+        return {}
+    if not isinstance(items, list):
+        return {}
+
+    by_id = {entry.get('id'): entry for entry in entries}
+    results = {}
+    for position, item in enumerate(items):
+        if not isinstance(item, dict):
+            continue
+        entry = by_id.get(item.get('id'))
+        if entry is None and position < len(entries) and len(items) == len(entries):
+            entry = entries[position]
+        if entry is not None and entry.get('id') not in results:
+            results[entry.get('id')] = normalize_result(item, fallback_result(entry)['summary'])
+    return results
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Check whether an LLM call failed because of rate limiting."""
+    message = str(error).lower()
+    return '429' in message or 'rate limit' in message or 'too many requests' in message
+
+
+class Checkpoint:
+    """Append-only JSON Lines record of completed enrichment results."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._file = None
+
+    def load(self) -> dict:
+        """
+        Load completed results from a previous, interrupted run.
+
+        Returns:
+            Dict of entry id -> {'contentHash': ..., 'result': ...}
+        """
+        completed = {}
+        if not self.path.exists():
+            return completed
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Torn final line from a crash
+                completed[record['id']] = record
+        return completed
+
+    def record(self, entry: dict, result: dict):
+        """Durably append one completed result."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps({
+            'id': entry.get('id'),
+            'contentHash': entry.get('contentHash'),
+            'result': result
+        }, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        """Close the checkpoint file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def clear(self):
+        """Remove the checkpoint once the run's output has been written."""
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
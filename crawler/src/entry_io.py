@@ -0,0 +1,220 @@
+"""
+Agentic AI Landscape Tracker - Streaming Entry Files
+Writes entry files incrementally to a temporary file that is fsynced and
+atomically renamed into place, and reads them back lazily, so memory use
+does not grow with the archive and readers never see a half-written file.
+
+Two formats are supported, chosen by file suffix:
+- .json: {"last_updated": ..., "entries": [...]} pretty-printed exactly as
+  json.dump(data, indent=2, ensure_ascii=False) would
+- .jsonl: one entry per line, no metadata
+"""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _is_jsonl(path: Path) -> bool:
+    return path.suffix.lower() == '.jsonl'
+
+
+@contextmanager
+def atomic_writer(path, mode: str = 'w'):
+    """
+    Open a temporary file next to path that replaces it on success.
+
+    The data is fsynced before the rename, and the temporary file is
+    removed if writing fails, leaving any previous file untouched.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # mkstemp creates owner-only files; keep the permissions of the file being replaced
+    permissions = path.stat().st_mode & 0o777 if path.exists() else 0o644
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        encoding = None if 'b' in mode else 'utf-8'
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, permissions)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    if os.name == 'posix':
+        # Persist the rename itself
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def atomic_write_bytes(path, payload: bytes):
+    """Atomically replace a file with payload."""
+    with atomic_writer(path, 'wb') as f:
+        f.write(payload)
+
+
+def _indented(value, depth: int) -> str:
+    """json.dumps(value, indent=2) as it appears nested `depth` spaces deep."""
+    text = json.dumps(value, indent=2, ensure_ascii=False)
+    return text.replace('\n', '\n' + ' ' * depth)
+
+
+def write_entries(path, entries: Iterable[dict], metadata: Optional[dict] = None) -> int:
+    """
+    Stream entries to a file and atomically move it into place.
+
+    Args:
+        path: Output file; a .jsonl suffix writes JSON Lines
+        entries: Entries to write, consumed one at a time
+        metadata: Top-level keys written before "entries" (ignored for .jsonl)
+
+    Returns:
+        Number of entries written
+    """
+    path = Path(path)
+    count = 0
+    with atomic_writer(path) as f:
+        if _is_jsonl(path):
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False))
+                f.write('\n')
+                count += 1
+            return count
+
+        f.write('{\n')
+        for key, value in (metadata or {}).items():
+            f.write(f'  {json.dumps(key, ensure_ascii=False)}: {_indented(value, 2)},\n')
+        f.write('  "entries": [')
+        for entry in entries:
+            f.write(',\n    ' if count else '\n    ')
+            f.write(_indented(entry, 4))
+            count += 1
+        f.write('\n  ]\n}' if count else ']\n}')
+    return count
+
+
+class _StreamDecoder:
+    """Decodes consecutive JSON values from a text file, reading it in chunks."""
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Read another chunk, dropping what has been consumed. False at end of file."""
+        if self.eof:
+            return False
+        chunk = self.f.read(CHUNK_SIZE)
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        self.eof = not chunk
+        return bool(chunk)
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or '' at end of file."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of chars."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} but found {char or 'end of file'!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number cut off by the end of the buffer ("12", "1." or "1e")
+            # may continue in the next chunk
+            truncated = end == len(self.buf) or (
+                isinstance(value, (int, float)) and self.buf[end] in '.eE+-'
+            )
+            if truncated and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_json(f, metadata: Optional[dict]) -> Iterator[dict]:
+    stream = _StreamDecoder(f)
+    if stream.expect('{[') == '[':
+        # A bare array of entries
+        if stream.peek() == ']':
+            return
+        while True:
+            yield stream.value()
+            if stream.expect(',]') == ']':
+                return
+
+    if stream.peek() == '}':
+        return
+    while True:
+        key = stream.value()
+        stream.expect(':')
+        if key == 'entries':
+            stream.expect('[')
+            if stream.peek() == ']':
+                stream.pos += 1
+            else:
+                while True:
+                    yield stream.value()
+                    if stream.expect(',]') == ']':
+                        break
+        else:
+            value = stream.value()
+            if metadata is not None:
+                metadata[key] = value
+        if stream.expect(',}') == '}':
+            return
+
+
+def iter_entries(path, metadata: Optional[dict] = None) -> Iterator[dict]:
+    """
+    Lazily read entries from a .json or .jsonl entries file.
+
+    Args:
+        path: Entries file
+        metadata: Optional dict that receives the other top-level keys of a
+            .json file (such as last_updated) as they are read
+
+    Yields:
+        Entry dicts in file order
+
+    Raises:
+        ValueError: If the file is not valid JSON
+    """
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        if _is_jsonl(path):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from _iter_json(f, metadata)
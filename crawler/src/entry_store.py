@@ -0,0 +1,265 @@
+"""
+Agentic AI Landscape Tracker - SQLite Entry Store
+Single source of truth for crawled and enriched entries, with indexed
+lookups by id, source, date and category, upserts, and export to the
+entries.json format the site and scripts read.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from changes import stored_fingerprint
+from entry_io import iter_entries, write_entries
+
+
+# Stored in PRAGMA user_version; bump and add a migration when the schema changes
+SCHEMA_VERSION = 1
+
+# Undated entries sort last, as in the crawler's date sort
+UNDATED_SORT_KEY = '1900-01-01'
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        id TEXT PRIMARY KEY,
+        source TEXT,
+        date TEXT,
+        sort_date TEXT NOT NULL,
+        category TEXT,
+        category_confidence REAL,
+        content_hash TEXT,
+        data TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_entries_source ON entries (source)",
+    "CREATE INDEX IF NOT EXISTS idx_entries_sort_date ON entries (sort_date DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_entries_category ON entries (category)",
+    "CREATE INDEX IF NOT EXISTS idx_entries_confidence ON entries (category_confidence)",
+]
+
+
+def _confidence(entry: dict) -> Optional[float]:
+    """Numeric categoryConfidence, or None when missing or blank."""
+    value = entry.get('categoryConfidence')
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _row(entry: dict) -> tuple:
+    return (
+        entry['id'],
+        entry.get('source'),
+        entry.get('date'),
+        entry.get('date') or UNDATED_SORT_KEY,
+        entry.get('category'),
+        _confidence(entry),
+        stored_fingerprint(entry),
+        json.dumps(entry, ensure_ascii=False),
+    )
+
+
+class EntryStore:
+    """Indexed SQLite store of entries keyed by id."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._migrate()
+
+    def _migrate(self):
+        """Create the schema, refusing stores written by a newer version."""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise ValueError(
+                f"Entry store {self.path} has schema version {version}; "
+                f"this version of the crawler supports up to {SCHEMA_VERSION}"
+            )
+        for statement in SCHEMA:
+            self._conn.execute(statement)
+        self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.commit()
+
+    def get(self, entry_id: str) -> Optional[dict]:
+        """Get one entry by id."""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM entries WHERE id = ?", (entry_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def __contains__(self, entry_id) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM entries WHERE id = ?", (entry_id,)
+            ).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def upsert(self, entries: Iterable[dict]) -> int:
+        """
+        Insert entries, replacing any stored entry with the same id.
+
+        Returns:
+            Number of entries written
+        """
+        count = 0
+        with self._lock:
+            for entry in entries:
+                self._conn.execute("""
+                    INSERT INTO entries (id, source, date, sort_date, category,
+                                         category_confidence, content_hash, data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (id) DO UPDATE SET
+                        source = excluded.source,
+                        date = excluded.date,
+                        sort_date = excluded.sort_date,
+                        category = excluded.category,
+                        category_confidence = excluded.category_confidence,
+                        content_hash = excluded.content_hash,
+                        data = excluded.data
+                """, _row(entry))
+                count += 1
+            self._conn.commit()
+        return count
+
+    def diff(self, crawled: Iterable[dict]) -> list:
+        """
+        Find the freshly crawled entries that are new or changed.
+
+        Nothing is written: callers upsert the returned entries once they
+        are enriched, so an interrupted run leaves them to be found again.
+
+        Returns:
+            The new or changed entries, which still need processing
+        """
+        fresh = []
+        with self._lock:
+            for entry in crawled:
+                row = self._conn.execute(
+                    "SELECT content_hash FROM entries WHERE id = ?", (entry['id'],)
+                ).fetchone()
+                if row is None or row[0] != stored_fingerprint(entry):
+                    fresh.append(entry)
+        return fresh
+
+    def needing_processing(self, min_confidence: int = 75) -> list:
+        """
+        Entries that must go back through summarization and categorization.
+
+        Uses the confidence index: entries categorized below min_confidence
+        or never scored are selected. A changed entry is upserted as crawled,
+        without its old enrichment, so changed content is selected too.
+
+        Returns:
+            Entry dicts, newest first
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM entries WHERE category_confidence IS NULL OR category_confidence < ? "
+                "ORDER BY sort_date DESC, rowid",
+                (min_confidence,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def iter_entries(self, source: Optional[str] = None, category: Optional[str] = None,
+                     since: Optional[str] = None) -> Iterator[dict]:
+        """
+        Iterate over stored entries, newest first.
+
+        Args:
+            source: Only entries from this source
+            category: Only entries in this category
+            since: Only entries dated on or after this ISO date
+
+        Yields:
+            Entry dicts
+        """
+        clauses, params = [], []
+        if source is not None:
+            clauses.append("source = ?")
+            params.append(source)
+        if category is not None:
+            clauses.append("category = ?")
+            params.append(category)
+        if since is not None:
+            clauses.append("sort_date >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = f"SELECT data FROM entries {where} ORDER BY sort_date DESC, rowid"
+
+        # A separate cursor keeps the lock free while the caller consumes rows
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+            rows = cursor.fetchmany(500)
+        while rows:
+            for row in rows:
+                yield json.loads(row[0])
+            with self._lock:
+                rows = cursor.fetchmany(500)
+
+    def import_json(self, path: str) -> int:
+        """Load an entries.json (or .jsonl) file into the store."""
+        return self.upsert(iter_entries(path))
+
+    def merge_json(self, path: str) -> int:
+        """
+        Upsert the new and changed entries of an entries.json (or .jsonl) file.
+
+        Unchanged stored entries keep their enrichment; changed ones lose it,
+        so needing_processing selects them.
+
+        Returns:
+            Number of entries written
+        """
+        return self.upsert(self.diff(iter_entries(path)))
+
+    def export_json(self, path: str, last_updated: str, **filters) -> int:
+        """
+        Write the store as an entries.json file, streamed and atomically replaced.
+
+        Args:
+            path: Output file
+            last_updated: Timestamp recorded in the file
+            **filters: source, category or since, as for iter_entries
+
+        Returns:
+            Number of entries written
+        """
+        return write_entries(path, self.iter_entries(**filters), {'last_updated': last_updated})
+
+    def stats(self) -> str:
+        """Human-readable size of the store for the end-of-run report."""
+        return f"Entry store: {len(self)} entries ({self.path})"
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+
+def open_store(config: Optional[dict], base_dir: Optional[Path] = None) -> Optional[EntryStore]:
+    """
+    Create the entry store described by an `entry_store` config section.
+
+    Args:
+        config: Dict with enabled and path
+        base_dir: Directory relative paths are resolved against
+
+    Returns:
+        EntryStore, or None if the store is disabled
+    """
+    if not config or not config.get('enabled', False):
+        return None
+    path = Path(config.get('path', '../data/entries.sqlite'))
+    if base_dir is not None and not path.is_absolute():
+        path = base_dir / path
+    return EntryStore(str(path))
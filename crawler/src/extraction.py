@@ -0,0 +1,252 @@
+"""
+Agentic AI Landscape Tracker - Article Content Extraction
+Single-pass extraction of clean article text from a parsed page element.
+
+The element is flattened once, in document order, skipping UI chrome;
+the rest of the extraction works on that flat list instead of cloning
+and re-parsing the element. Output matches the clone-and-decompose
+extraction the crawler used before exactly.
+"""
+
+import re
+
+from bs4 import CData, NavigableString
+
+
+# Tags and classes whose whole subtree is UI chrome
+UI_TAGS = frozenset({'nav', 'button', 'footer', 'header', 'script', 'style', 'iframe', 'noscript'})
+UI_CLASSES = frozenset({'button', 'nav', 'navigation', 'menu', 'sidebar',
+                        'cookie', 'banner', 'ad', 'advertisement'})
+
+# Any text node containing one of these removes its parent element
+UI_TEXT_PATTERNS = (
+    'learn more', 'read more', 'continue reading',
+    'share', 'tweet', 'like', 'subscribe', 'follow',
+    'previous', 'next', 'back', 'home',
+    'your browser does not support the video tag',
+    'your browser does not support',
+    'models', 'research', 'announcements'
+)
+UI_TEXT_RE = re.compile('|'.join(re.escape(pattern) for pattern in UI_TEXT_PATTERNS))
+
+# Content containers, most specific first; matched against (name, class, role)
+CONTENT_SELECTORS = (
+    ('article', None, None),
+    ('main', None, None),
+    (None, None, 'main'),
+    (None, 'content', None),
+    (None, 'article-content', None),
+    (None, 'post-content', None),
+    (None, 'entry-content', None),
+    ('p', None, None),
+)
+
+# Removed from the final text in this order; removing one can expose the
+# next, so they stay separate passes behind a combined pre-check
+CONTENT_UI_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'january \d{4}',
+        r'february \d{4}',
+        r'march \d{4}',
+        r'april \d{4}',
+        r'may \d{4}',
+        r'june \d{4}',
+        r'july \d{4}',
+        r'august \d{4}',
+        r'september \d{4}',
+        r'october \d{4}',
+        r'november \d{4}',
+        r'december \d{4}',
+        r'learn more',
+        r'read more',
+        r'models',
+        r'research',
+        r'announcements',
+        r'your browser does not support the video tag\.?'
+    )
+]
+CONTENT_UI_RE = re.compile('|'.join(p.pattern for p in CONTENT_UI_PATTERNS), re.IGNORECASE)
+
+# String types get_text() returns; comments, scripts and templates are skipped
+TEXT_TYPES = (NavigableString, CData)
+
+MAX_CONTENT_LENGTH = 800
+MAX_PARAGRAPHS = 5
+MIN_PARAGRAPH_LENGTH = 20
+
+
+def _classes(tag) -> list:
+    classes = tag.get('class') or []
+    return classes.split() if isinstance(classes, str) else classes
+
+
+def _is_ui_element(tag) -> bool:
+    return tag.name in UI_TAGS or not UI_CLASSES.isdisjoint(_classes(tag))
+
+
+class _FlatTree:
+    """
+    An element's subtree in document order, with UI chrome left out.
+
+    Node i spans nodes[i:ends[i]]; strings span only themselves.
+    """
+
+    def __init__(self, root):
+        self.nodes = []
+        self.parents = []
+        self.ends = []
+        stack = [(root, -1)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, int):
+                # Closing marker: every descendant of node `item` is in place
+                self.ends[item] = len(self.nodes)
+                continue
+            node, parent = item
+            if isinstance(node, NavigableString):
+                self.nodes.append(node)
+                self.parents.append(parent)
+                self.ends.append(len(self.nodes))
+                continue
+            if _is_ui_element(node):
+                continue
+            index = len(self.nodes)
+            self.nodes.append(node)
+            self.parents.append(parent)
+            self.ends.append(0)
+            stack.append(index)
+            stack.extend((child, index) for child in reversed(node.contents))
+
+    def _signature(self, i: int):
+        node = self.nodes[i]
+        if isinstance(node, NavigableString):
+            return str(node)
+        return (node.name, node.attrs, self.ends[i] - i)
+
+    def same_subtree(self, a: int, b: int) -> bool:
+        """Tag equality (name, attrs and contents) of two nodes, ignoring removed UI chrome."""
+        size = self.ends[a] - a
+        if size != self.ends[b] - b:
+            return False
+        for offset in range(size):
+            if self._signature(a + offset) != self._signature(b + offset):
+                return False
+        return True
+
+
+def _drop_ui_text_parents(tree: _FlatTree) -> list:
+    """
+    Mark the parents of UI text nodes as removed.
+
+    Parents equal (as Tags compare) to one already marked are kept, as
+    they were when parents were collected into a list before removal.
+
+    Returns:
+        Per-node flags, True for nodes that are gone
+    """
+    removed = [False] * len(tree.nodes)
+    marked = []
+    for i, node in enumerate(tree.nodes):
+        if not isinstance(node, NavigableString):
+            continue
+        if not UI_TEXT_RE.search(node.strip().lower()):
+            continue
+        parent = tree.parents[i]
+        if parent < 0 or any(parent == m or tree.same_subtree(parent, m) for m in marked):
+            continue
+        marked.append(parent)
+    for parent in marked:
+        for j in range(parent, tree.ends[parent]):
+            removed[j] = True
+    return removed
+
+
+def _strings(tree: _FlatTree, removed: list, start: int, end: int):
+    """Stripped, non-empty text strings of nodes[start:end] that were not removed."""
+    for j in range(start, end):
+        node = tree.nodes[j]
+        if removed[j] or type(node) not in TEXT_TYPES:
+            continue
+        text = node.strip()
+        if text:
+            yield text
+
+
+def _matches(tag, name, cls, role) -> bool:
+    if name is not None:
+        return tag.name == name
+    if cls is not None:
+        return cls in _classes(tag)
+    return tag.get('role') == role
+
+
+def _select_paragraphs(tree: _FlatTree, removed: list) -> list:
+    """Meaningful paragraph texts from the first content container that has any."""
+    tags = [i for i, node in enumerate(tree.nodes)
+            if not removed[i] and not isinstance(node, NavigableString)]
+    for name, cls, role in CONTENT_SELECTORS:
+        paragraphs = []
+        for i in tags:
+            if not _matches(tree.nodes[i], name, cls, role):
+                continue
+            if tree.nodes[i].name == 'p':
+                candidates = [i]
+            else:
+                candidates = [j for j in range(i + 1, tree.ends[i])
+                              if not removed[j] and tree.nodes[j].name == 'p']
+            for j in candidates:
+                text = ''.join(_strings(tree, removed, j, tree.ends[j]))
+                if len(text) > MIN_PARAGRAPH_LENGTH:
+                    paragraphs.append(text)
+        if paragraphs:
+            return paragraphs
+    return []
+
+
+def ensure_sentence_end(text: str) -> str:
+    """
+    End text on sentence punctuation.
+
+    Cuts back to the last '.', '!' or '?' within the final 100 characters,
+    or appends a period if there is none.
+    """
+    if text and text[-1] not in '.!?':
+        for i in range(len(text)-1, max(len(text)-100, 0), -1):
+            if text[i] in '.!?':
+                return text[:i+1]
+        return text + '.'
+    return text
+
+
+def extract_article_content(article_elem) -> str:
+    """
+    Extract clean content from an article element, excluding UI elements.
+
+    The element is left unmodified.
+
+    Args:
+        article_elem: BeautifulSoup Tag for one article
+
+    Returns:
+        Up to 800 characters of article text, ending on punctuation
+    """
+    if not article_elem:
+        return ''
+
+    tree = _FlatTree(article_elem)
+    removed = _drop_ui_text_parents(tree)
+
+    paragraphs = _select_paragraphs(tree, removed)
+    if paragraphs:
+        content = ' '.join(paragraphs[:MAX_PARAGRAPHS])
+    else:
+        content = ' '.join(_strings(tree, removed, 0, len(tree.nodes)))
+
+    content = ' '.join(content.split())[:MAX_CONTENT_LENGTH]
+
+    if CONTENT_UI_RE.search(content):
+        for pattern in CONTENT_UI_PATTERNS:
+            content = pattern.sub('', content)
+        content = ' '.join(content.split())
+
+    return ensure_sentence_end(content)
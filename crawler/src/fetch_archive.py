@@ -0,0 +1,113 @@
+"""
+Agentic AI Landscape Tracker - Fetch Archive
+Records every page and feed the crawler fetches into a content-addressed
+local archive, and replays a crawl from it without touching the network.
+
+Layout:
+    <archive>/index.jsonl        one {"url", "status", "sha256"} record per fetch;
+                                 the last record for a URL wins
+    <archive>/bodies/<sha256>    response bodies, stored once per distinct content
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Optional
+
+from entry_io import atomic_write_bytes
+
+
+MODES = ('record', 'replay')
+
+
+class FetchArchive:
+    """Content-addressed store of fetched bodies keyed by URL."""
+
+    def __init__(self, path: str, mode: str):
+        if mode not in MODES:
+            raise ValueError(f"Unknown fetch archive mode {mode!r}; expected one of {', '.join(MODES)}")
+        self.path = Path(path)
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+        if mode == 'replay' and not self._index:
+            raise ValueError(f"Fetch archive {self.path} is empty or missing; record a crawl first")
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    def _load_index(self) -> dict:
+        index_path = self.path / 'index.jsonl'
+        if not index_path.exists():
+            return {}
+        index = {}
+        with open(index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    index[record['url']] = record
+        return index
+
+    def _body_path(self, digest: str) -> Path:
+        return self.path / 'bodies' / digest
+
+    def record(self, url: str, status: int, body: str):
+        """Save the body served for a URL."""
+        payload = body.encode('utf-8')
+        digest = hashlib.sha256(payload).hexdigest()
+        record = {'url': url, 'status': status, 'sha256': digest}
+        with self._lock:
+            body_path = self._body_path(digest)
+            if not body_path.exists():
+                atomic_write_bytes(body_path, payload)
+            # Appending keeps earlier records intact if the crawl is interrupted
+            self.path.mkdir(parents=True, exist_ok=True)
+            with open(self.path / 'index.jsonl', 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + '\n')
+            self._index[url] = record
+
+    def lookup(self, url: str) -> Optional[dict]:
+        """
+        Get the archived response for a URL.
+
+        Returns:
+            Dict with status and body, or None if the URL was never recorded
+        """
+        with self._lock:
+            record = self._index.get(url)
+            if record is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        body = self._body_path(record['sha256']).read_text(encoding='utf-8')
+        return {'status': record['status'], 'body': body}
+
+    def stats(self) -> str:
+        """Human-readable summary for the crawl log."""
+        if self.recording:
+            bodies = len({record['sha256'] for record in self._index.values()})
+            return f"Fetch archive: {len(self._index)} URLs recorded ({bodies} distinct bodies) in {self.path}"
+        return f"Fetch archive: {self.hits} replayed, {self.misses} not in archive ({self.path})"
+
+
+def open_archive(config: Optional[dict]) -> Optional[FetchArchive]:
+    """
+    Create the fetch archive described by a `fetch_archive` config section.
+
+    Args:
+        config: Dict with mode (off, record or replay) and path
+
+    Returns:
+        FetchArchive, or None if the archive is off
+    """
+    if not config or config.get('mode', 'off') in (None, False, 'off'):
+        return None
+    return FetchArchive(config.get('path', '../data/fetch_archive'), config['mode'])
@@ -0,0 +1,133 @@
+"""
+Agentic AI Landscape Tracker - HTML Listing Source Adapter
+Scrapes listing pages with the source's compiled selectors, following
+pagination when configured.
+"""
+
+import hashlib
+import json
+from typing import Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from source_adapters import SourceAdapter
+from source_plan import SourcePlan
+
+
+# Bump when extraction changes the entries built from a page
+HTML_RESULT_KEY = 'html-v1'
+
+class HtmlListingAdapter(SourceAdapter):
+    """Sources scraped from HTML listing pages."""
+
+    def prepare(self, source: dict):
+        self.crawler._source_plan(source)
+
+    def result_key(self, source: dict) -> str:
+        """Key for cached HTML results; changes with extraction code, selectors or backfill."""
+        settings = json.dumps([source, self.crawler.config.get('backfill', {})], sort_keys=True, default=str)
+        return f"{HTML_RESULT_KEY}:{hashlib.md5(settings.encode()).hexdigest()[:12]}"
+
+    def _parse(self, html_content: str) -> BeautifulSoup:
+        with self.crawler.profile.stage('parse'):
+            return BeautifulSoup(html_content, self.crawler.parser)
+
+    def crawl(self, source: dict) -> list:
+        """
+        Scrape a source's listing pages, following pagination if configured.
+
+        Stops at a streak of already-known entries, after a page with an
+        entry older than the backfill cutoff, or when there is no next page.
+        """
+        crawler = self.crawler
+        plan = crawler._source_plan(source)
+        paginated = plan.max_pages > 1
+        result_key = self.result_key(source)
+        cutoff_key = f"{result_key}:cutoff"
+        entries = []
+        known_streak = 0
+        visited = set()
+        page, page_url = 1, source['url']
+        while page_url and page_url not in visited:
+            visited.add(page_url)
+            if page > 1:
+                print(f"  Page {page}: {page_url}")
+            html_content, not_modified = crawler._fetch_text(page_url)
+            cached_entries = None
+            if not_modified:
+                cached_entries = crawler.http_cache.get_result(page_url, result_key)
+
+            soup = None
+            if cached_entries is not None:
+                # Page unchanged since last crawl: skip parsing entirely
+                print("  Page not modified, reusing cached entries")
+                entries.extend(cached_entries)
+                stop = paginated and bool(crawler.http_cache.get_result(page_url, cutoff_key))
+                for entry in cached_entries:
+                    known_streak = known_streak + 1 if entry['id'] in crawler.known_entries else 0
+                    if crawler._reached_known_entries(known_streak):
+                        stop = True
+                        break
+            elif html_content is not None:
+                soup = self._parse(html_content)
+                page_entries, known_streak, stop_reason = self.scrape_page(
+                    source, plan, soup, known_streak
+                )
+                entries.extend(page_entries)
+                stop = stop_reason is not None
+
+                # A partial listing must not be replayed to a full crawl later
+                if crawler.http_cache and stop_reason != 'known':
+                    crawler.http_cache.store_result(page_url, result_key, page_entries)
+                    if paginated:
+                        crawler.http_cache.store_result(page_url, cutoff_key, stop_reason == 'cutoff')
+            else:
+                break
+
+            if stop:
+                break
+            if soup is None and plan.next_page is not None and page < plan.max_pages:
+                soup = self._parse(html_content)
+            page_url = plan.next_page_url(page, page_url, soup)
+            page += 1
+        return entries
+
+    def scrape_page(self, source: dict, plan: SourcePlan, soup,
+                    known_streak: int) -> Tuple[list, int, Optional[str]]:
+        """
+        Extract the entries of one parsed listing page.
+
+        Returns:
+            Tuple of (entries, known streak so far, stop reason): 'known' if
+            a streak of already-known entries was reached, 'cutoff' if the
+            page has entries older than the backfill cutoff, else None
+        """
+        crawler = self.crawler
+        entries = []
+        stop_reason = None
+        for article in plan.articles(soup, limit=20):  # Limit to 20 per page
+            title = plan.title_text(article)
+            if title is None:
+                continue
+            url = plan.link_url(article)
+
+            entry_id = crawler._generate_id(url, title)
+            known_streak = known_streak + 1 if entry_id in crawler.known_entries else 0
+            if crawler._reached_known_entries(known_streak):
+                return entries, known_streak, 'known'
+
+            date = crawler._parse_date(plan.date_text(article))
+
+            if not crawler._is_within_backfill_range(date):
+                # Listings are newest first (bar pinned posts), so older pages
+                # are not needed; the rest of this page is still checked
+                stop_reason = 'cutoff'
+                continue
+
+            # Extract clean content
+            content = crawler._extract_article_content(article)
+
+            entries.append(crawler._make_entry(
+                entry_id, title, source['name'], url, date, content
+            ))
+        return entries, known_streak, stop_reason
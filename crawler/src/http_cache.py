@@ -0,0 +1,102 @@
+"""
+Agentic AI Landscape Tracker - HTTP Response Cache
+Persists validators, bodies and parsed results per URL so unchanged
+pages can be revalidated with a conditional request and reused.
+"""
+
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+class HttpCache:
+    """On-disk cache of HTTP responses keyed by URL."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> Path:
+        """Get the cache file path for a URL."""
+        return self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()[:32]}.json"
+
+    def get(self, url: str) -> Optional[dict]:
+        """Load the cached record for a URL, if any."""
+        path = self._path(url)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+            return record if record.get('url') == url else None
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, url: str, record: dict):
+        """Write a record, replacing any previous one for the URL."""
+        path = self._path(url)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False)
+        tmp_path.replace(path)
+
+    def conditional_headers(self, record: Optional[dict]) -> dict:
+        """Build If-None-Match / If-Modified-Since headers from a record."""
+        headers = {}
+        if not record:
+            return headers
+        if record.get('etag'):
+            headers['If-None-Match'] = record['etag']
+        if record.get('last_modified'):
+            headers['If-Modified-Since'] = record['last_modified']
+        return headers
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str], body: str):
+        """Store a freshly downloaded body and its validators."""
+        with self._lock:
+            self.misses += 1
+        if not etag and not last_modified:
+            return  # Nothing to revalidate with next time
+        self._write(url, {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'body': body,
+            'results': {}
+        })
+
+    def record_hit(self):
+        """Count a 304 Not Modified response served from the cache."""
+        with self._lock:
+            self.hits += 1
+
+    def get_result(self, url: str, key: str):
+        """Get a parsed result previously derived from the cached body."""
+        record = self.get(url)
+        if not record:
+            return None
+        return record.get('results', {}).get(key)
+
+    def store_result(self, url: str, key: str, result):
+        """
+        Attach a parsed result to the cached body for a URL.
+
+        Args:
+            url: URL the body was fetched from
+            key: Identifies how the result was derived (e.g. parser settings)
+            result: JSON-serializable parse result
+        """
+        record = self.get(url)
+        if not record:
+            return
+        record.setdefault('results', {})[key] = result
+        self._write(url, record)
+
+    def stats(self) -> str:
+        """Human-readable hit/miss summary for the crawl log."""
+        return f"HTTP cache: {self.hits} hits, {self.misses} misses"
@@ -0,0 +1,131 @@
+"""
+Agentic AI Landscape Tracker - HTTP Request Timing
+Transport adapter that records where each request spends its time
+(connection setup, TLS, time to first byte, body download).
+"""
+
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+# Connection setup happens deep inside urllib3 on the calling thread, so
+# the timed connections report back through thread-local counters
+_local = threading.local()
+
+
+def _add(name: str, seconds: float):
+    """Accumulate a timing for the request in flight on this thread."""
+    setattr(_local, name, getattr(_local, name, 0.0) + seconds)
+
+
+class _TimedConnectionMixin:
+    """Time socket setup (DNS + TCP) and the full connect (incl. TLS)."""
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            _add('tcp', time.perf_counter() - start)
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _add('connect', time.perf_counter() - start)
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimingAdapter(HTTPAdapter):
+    """HTTPAdapter that keeps a timing record for every request it sends."""
+
+    def __init__(self, *args, **kwargs):
+        self.timings = []
+        self._timings_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+    def send(self, request, stream=False, **kwargs):
+        _local.tcp = 0.0
+        _local.connect = 0.0
+        start = time.perf_counter()
+        response = super().send(request, stream=stream, **kwargs)
+        ttfb = time.perf_counter() - start
+
+        download = 0.0
+        if not stream:
+            # Session.send would read the body next anyway; doing it here
+            # lets us attribute the time to the download phase
+            download_start = time.perf_counter()
+            response.content
+            download = time.perf_counter() - download_start
+
+        # ttfb runs from the start of the request, so it includes connect/tls
+        # (and any retry backoff); download covers reading the body only
+        retries = getattr(getattr(response.raw, 'retries', None), 'history', ()) or ()
+        timing = {
+            'url': request.url,
+            'status': response.status_code,
+            'connect': round(_local.tcp, 4),
+            'tls': round(max(0.0, _local.connect - _local.tcp), 4),
+            'ttfb': round(ttfb, 4),
+            'download': round(download, 4),
+            'total': round(ttfb + download, 4),
+            'reused_connection': _local.connect == 0.0,
+            'retries': len(retries),
+        }
+        response.timing = timing
+        with self._timings_lock:
+            self.timings.append(timing)
+        return response
+
+    def totals(self) -> dict:
+        """Request count and summed phase timings, as recorded in the run report."""
+        with self._timings_lock:
+            timings = list(self.timings)
+        totals = {
+            key: round(sum(t[key] for t in timings), 4)
+            for key in ('connect', 'tls', 'ttfb', 'download')
+        }
+        totals['requests'] = len(timings)
+        totals['reused_connections'] = sum(1 for t in timings if t['reused_connection'])
+        totals['retries'] = sum(t['retries'] for t in timings)
+        return totals
+
+    def summary(self) -> str:
+        """Human-readable totals for the crawl log."""
+        totals = self.totals()
+        if not totals['requests']:
+            return "Fetch timing: no requests"
+        return (
+            f"Fetch timing: {totals['requests']} requests "
+            f"({totals['reused_connections']} on reused connections), "
+            f"connect {totals['connect']:.2f}s, tls {totals['tls']:.2f}s, "
+            f"ttfb {totals['ttfb']:.2f}s, download {totals['download']:.2f}s"
+        )
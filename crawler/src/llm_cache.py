@@ -0,0 +1,140 @@
+"""
+Agentic AI Landscape Tracker - Persistent LLM Result Cache
+SQLite-backed cache of LLM responses keyed by model, prompt template
+version and prompt inputs, with LRU and TTL eviction.
+"""
+
+import json
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class LLMCache:
+    """Size-bounded persistent cache for LLM results."""
+
+    # How many writes between eviction passes
+    EVICT_EVERY = 100
+
+    def __init__(self, path: str, max_entries: int = 10000, ttl_days: float = 90):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.ttl = ttl_days * 86400 if ttl_days else None
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, template: str, version: int, prompt: str, **params) -> str:
+        """
+        Build a cache key for one LLM call.
+
+        Args:
+            model: Model name the prompt is sent to
+            template: Name of the prompt template
+            version: Template version; bump it when the prompt wording changes
+            prompt: Fully rendered prompt (covers all inputs)
+            **params: Generation parameters such as max_tokens or temperature
+
+        Returns:
+            Hex digest identifying the call
+        """
+        material = json.dumps([model, template, version, prompt, params], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, key: str):
+        """Get a cached result, or None on a miss or expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (self.ttl and now - row[1] > self.ttl):
+                if row is not None:
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return json.loads(row[0])
+
+    def set(self, key: str, value):
+        """Store a JSON-serializable result."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created, last_used) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now, now)
+            )
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop expired entries, then the least recently used beyond max_entries."""
+        if self.ttl:
+            self._conn.execute("DELETE FROM llm_cache WHERE created < ?", (time.time() - self.ttl,))
+        self._conn.execute("""
+            DELETE FROM llm_cache WHERE key IN (
+                SELECT key FROM llm_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.max_entries,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def stats(self) -> str:
+        """Human-readable hit rate for the end-of-run report."""
+        lookups = self.hits + self.misses
+        rate = (self.hits / lookups * 100) if lookups else 0.0
+        return f"LLM cache: {self.hits} hits, {self.misses} misses ({rate:.1f}% hit rate)"
+
+    def close(self):
+        """Run a final eviction pass and close the database."""
+        with self._lock:
+            self._evict()
+            self._conn.commit()
+            self._conn.close()
+
+
+def open_cache(config: Optional[dict], base_dir: Optional[Path] = None) -> Optional[LLMCache]:
+    """
+    Create the LLM cache described by an `llm_cache` config section.
+
+    Args:
+        config: Dict with enabled, path, max_entries and ttl_days
+        base_dir: Directory relative paths are resolved against
+
+    Returns:
+        LLMCache, or None if caching is disabled
+    """
+    if not config or not config.get('enabled', False):
+        return None
+    path = Path(config.get('path', '../data/llm_cache.sqlite'))
+    if base_dir is not None and not path.is_absolute():
+        path = base_dir / path
+    return LLMCache(
+        str(path),
+        max_entries=config.get('max_entries', 10000),
+        ttl_days=config.get('ttl_days', 90)
+    )
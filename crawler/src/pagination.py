@@ -0,0 +1,66 @@
+"""
+Agentic AI Landscape Tracker - Pagination Plans
+Per-source pagination resolved once from config. Feeds, sitemaps and JSON
+APIs only follow page-numbered URL templates, so their plans need none of
+the selector machinery (and parsing libraries) of listing pages.
+"""
+
+from typing import Optional
+from urllib.parse import urljoin
+
+
+# Pages followed when a source has a pagination section without max_pages
+DEFAULT_MAX_PAGES = 10
+
+
+class PaginationPlan:
+    """Resolved pagination strategy for one source."""
+
+    def __init__(self, source: dict):
+        name = source.get('name', '')
+        self.url = source.get('url') or ''
+
+        # Older pages come from a next-page link or a page-numbered URL template
+        self.pagination = dict(source.get('pagination') or {})
+        self.page_template = self.pagination.get('url_template')
+        self.next_page = self._compile_next(name)
+        if self.pagination and self.next_page is None and not self.page_template:
+            raise ValueError(f"Source '{name}': pagination needs a next selector or a url_template")
+        if self.page_template and '{page}' not in self.page_template:
+            raise ValueError(f"Source '{name}': pagination url_template must contain {{page}}")
+        self.max_pages = int(self.pagination.get('max_pages', DEFAULT_MAX_PAGES)) if self.pagination else 1
+
+    def _compile_next(self, source_name: str):
+        """Next-page link selector; only listing pages have links to follow."""
+        if self.pagination.get('next') is not None:
+            raise ValueError(
+                f"Source '{source_name}': pagination next is only supported by html-listing sources; "
+                f"use url_template"
+            )
+        return None
+
+    def matches(self, source: dict) -> bool:
+        """Check whether this plan was built from the source's current URL and pagination."""
+        return (
+            self.url == (source.get('url') or '')
+            and self.pagination == (source.get('pagination') or {})
+        )
+
+    def next_page_url(self, page: int, page_url: str, soup=None) -> Optional[str]:
+        """
+        URL of the page after `page`, or None if there is none.
+
+        Args:
+            page: Number of the current page (the configured URL is page 1)
+            page_url: URL of the current page, for resolving relative links
+            soup: Parsed current page; only needed for a next selector
+        """
+        if page >= self.max_pages:
+            return None
+        if self.page_template:
+            return self.page_template.format(page=page + 1)
+        if soup is None or self.next_page is None:
+            return None
+        link_elem = self.next_page.select_one(soup)
+        href = link_elem.get('href') if link_elem else None
+        return urljoin(page_url, href) if href else None
@@ -0,0 +1,108 @@
+"""
+Agentic AI Landscape Tracker - HTML Parser Backends
+Chooses the fastest installed BeautifulSoup tree builder so source
+selectors run unchanged on every backend, and strips HTML snippets to
+text without building a tree.
+"""
+
+import importlib.util
+from html.parser import HTMLParser
+
+
+# Fastest first; 'auto' picks the first one that is installed
+PARSER_BACKENDS = ('lxml', 'html.parser')
+
+
+def _is_available(parser: str) -> bool:
+    """Check whether BeautifulSoup can build trees with a parser, without importing either."""
+    return parser == 'html.parser' or importlib.util.find_spec(parser) is not None
+
+
+def resolve_parser(name: str = 'auto') -> str:
+    """
+    Resolve the configured parser backend to one that is installed.
+
+    Args:
+        name: 'auto' or one of PARSER_BACKENDS
+
+    Returns:
+        BeautifulSoup features string to parse with
+
+    Raises:
+        ValueError: If the name is not a known backend
+    """
+    name = name or 'auto'
+    if name != 'auto' and name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown HTML parser '{name}'; expected 'auto' or one of {', '.join(PARSER_BACKENDS)}")
+
+    if name != 'auto':
+        if _is_available(name):
+            return name
+        print(f"Warning: HTML parser '{name}' not installed, falling back to html.parser")
+        return 'html.parser'
+
+    for backend in PARSER_BACKENDS:
+        if _is_available(backend):
+            return backend
+    return 'html.parser'
+
+
+# Elements whose contents are not text, as for BeautifulSoup's get_text()
+NON_TEXT_TAGS = ('script', 'style', 'template')
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the text of an HTML fragment from parser events."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skipped = 0
+
+    # Markup separates text nodes, which get_text() joins with a space
+    def handle_starttag(self, tag, attrs):
+        self.parts.append(' ')
+        if tag in NON_TEXT_TAGS:
+            self._skipped += 1
+
+    def handle_endtag(self, tag):
+        self.parts.append(' ')
+        if tag in NON_TEXT_TAGS and self._skipped:
+            self._skipped -= 1
+
+    def handle_data(self, data):
+        if not self._skipped:
+            self.parts.append(data)
+
+    def handle_comment(self, data):
+        self.parts.append(' ')
+
+    def handle_decl(self, decl):
+        self.parts.append(' ')
+
+    def handle_pi(self, data):
+        self.parts.append(' ')
+
+    def unknown_decl(self, data):
+        self.parts.append(' ')
+        if data.startswith('CDATA[') and not self._skipped:
+            self.parts.append(data[6:] + ' ')
+
+
+def html_to_text(html_text: str) -> str:
+    """
+    Text of an HTML snippet with tags removed, entities decoded and whitespace collapsed.
+
+    Gives the same text as BeautifulSoup's get_text(separator=' ', strip=True)
+    with html.parser, from the parser's events alone: separate text nodes
+    are joined by a space and script, style and template contents are
+    dropped. Snippets without markup or entities are not parsed at all.
+    """
+    if not html_text:
+        return ''
+    if '<' not in html_text and '&' not in html_text:
+        return ' '.join(html_text.split())
+    parser = _TextExtractor()
+    parser.feed(html_text)
+    parser.close()
+    return ' '.join(''.join(parser.parts).split())
@@ -0,0 +1,208 @@
+"""
+Agentic AI Landscape Tracker - Crawl Profiling
+Per-stage and per-source timers and counters for a crawl run, written as a
+JSON run report, plus an optional cProfile/pyinstrument wrapper for a run.
+"""
+
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from entry_io import atomic_write_bytes
+
+
+REPORT_VERSION = 1
+PROFILERS = ('cprofile', 'pyinstrument')
+
+
+def timed(stage: str):
+    """Decorator recording a method's wall time under `stage` in self.profile."""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.profile.stage(stage):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class RunProfile:
+    """
+    Timers and counters for one crawl run.
+
+    Stage times are inclusive wall-clock seconds, so nested stages (such as
+    fetch inside fetch_rss) are counted in both. Sources are crawled on
+    worker threads; whatever a thread records inside `source()` is also
+    attributed to that source.
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.stages = {}
+        self.counters = {}
+        self.sources = {}
+
+    def _current_source(self) -> Optional[dict]:
+        name = getattr(self._local, 'source', None)
+        return self.sources[name] if name is not None else None
+
+    def add(self, stage: str, seconds: float, calls: int = 1):
+        """Record time spent in a stage."""
+        with self._lock:
+            targets = [self.stages]
+            source = self._current_source()
+            if source is not None:
+                targets.append(source['stages'])
+            for stages in targets:
+                totals = stages.setdefault(stage, {'calls': 0, 'seconds': 0.0})
+                totals['calls'] += calls
+                totals['seconds'] += seconds
+
+    def count(self, name: str, n: int = 1):
+        """Increment a counter."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+            source = self._current_source()
+            if source is not None:
+                source['counters'][name] = source['counters'].get(name, 0) + n
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as one call of a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    @contextmanager
+    def source(self, name: str):
+        """Attribute everything recorded on this thread to a source."""
+        with self._lock:
+            self.sources.setdefault(name, {'seconds': 0.0, 'stages': {}, 'counters': {}})
+        previous = getattr(self._local, 'source', None)
+        self._local.source = name
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._local.source = previous
+            with self._lock:
+                self.sources[name]['seconds'] += elapsed
+
+    def report(self, **extra) -> dict:
+        """
+        Build the run report.
+
+        Args:
+            **extra: Additional top-level fields (e.g. HTTP timing totals)
+
+        Returns:
+            JSON-serializable dict
+        """
+        def rounded(stages):
+            return {
+                name: {'calls': totals['calls'], 'seconds': round(totals['seconds'], 4)}
+                for name, totals in sorted(stages.items(), key=lambda item: -item[1]['seconds'])
+            }
+
+        with self._lock:
+            return {
+                'version': REPORT_VERSION,
+                'started_at': self.started_at.isoformat().replace('+00:00', 'Z'),
+                'duration_seconds': round(time.perf_counter() - self._start, 4),
+                'stages': rounded(self.stages),
+                'counters': dict(sorted(self.counters.items())),
+                'sources': {
+                    name: {
+                        'seconds': round(source['seconds'], 4),
+                        'stages': rounded(source['stages']),
+                        'counters': dict(sorted(source['counters'].items())),
+                    }
+                    for name, source in self.sources.items()
+                },
+                **extra,
+            }
+
+    def summary(self) -> str:
+        """Human-readable stage totals for the crawl log."""
+        with self._lock:
+            stages = sorted(self.stages.items(), key=lambda item: -item[1]['seconds'])
+        parts = [f"{name} {totals['seconds']:.2f}s" for name, totals in stages]
+        return f"Stage timing: {', '.join(parts) if parts else 'nothing recorded'}"
+
+
+def report_path(output_path) -> Path:
+    """Run report location next to the output file (entries.json -> entries.report.json)."""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}.report.json")
+
+
+def profile_path(output_path, profiler: str) -> Path:
+    """Profile location next to the output file (entries.prof or entries.profile.html)."""
+    output_path = Path(output_path)
+    suffix = 'profile.html' if profiler == 'pyinstrument' else 'prof'
+    return output_path.with_name(f"{output_path.stem}.{suffix}")
+
+
+def write_report(path, report: dict):
+    """Atomically write a run report."""
+    atomic_write_bytes(path, json.dumps(report, indent=2).encode('utf-8'))
+
+
+def profile_call(func, profiler: str, output_path):
+    """
+    Run func under a profiler and save the profile.
+
+    cProfile writes pstats data (open with `python -m pstats` or snakeviz);
+    pyinstrument, if installed, writes an HTML report.
+
+    Args:
+        func: Callable taking no arguments
+        profiler: 'cprofile' or 'pyinstrument'
+        output_path: Where to save the profile
+
+    Returns:
+        Whatever func returns
+
+    Raises:
+        ValueError: If the profiler is unknown
+        ImportError: If pyinstrument is requested but not installed
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if profiler == 'cprofile':
+        import cProfile
+        import pstats
+
+        profile = cProfile.Profile()
+        try:
+            return profile.runcall(func)
+        finally:
+            profile.dump_stats(str(output_path))
+            pstats.Stats(profile).sort_stats('cumulative').print_stats(20)
+            print(f"Saved cProfile stats to {output_path}")
+
+    if profiler == 'pyinstrument':
+        from pyinstrument import Profiler
+
+        profile = Profiler()
+        profile.start()
+        try:
+            return func()
+        finally:
+            profile.stop()
+            output_path.write_text(profile.output_html(), encoding='utf-8')
+            print(f"Saved pyinstrument report to {output_path}")
+
+    raise ValueError(f"Unknown profiler {profiler!r}; expected one of {', '.join(PROFILERS)}")
@@ -0,0 +1,240 @@
+"""
+Agentic AI Landscape Tracker - RSS Source Adapter
+Reads RSS and Atom feeds with feedparser, following a pagination
+url_template when configured. With crawler.stream_feeds set, feeds are
+instead parsed one item at a time and reading stops at old or known items.
+"""
+
+from typing import Iterator
+from urllib.parse import urljoin
+from xml.etree import ElementTree
+
+import feedparser
+from feedparser.datetimes import _parse_date as feedparser_date
+
+from dates import parse_date
+from source_adapters import SourceAdapter
+
+
+# Bump when fetch() changes how feed items are cleaned
+RSS_RESULT_KEY = 'rss-v3'
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+RSS1_NS = '{http://purl.org/rss/1.0/}'
+DC_DATE = '{http://purl.org/dc/elements/1.1/}date'
+CONTENT_ENCODED = '{http://purl.org/rss/1.0/modules/content/}encoded'
+XML_BASE = '{http://www.w3.org/XML/1998/namespace}base'
+
+# RSS 2.0, RSS 1.0 (RDF) and Atom items
+ITEM_TAGS = ('item', f'{RSS1_NS}item', f'{ATOM_NS}entry')
+
+CHUNK_SIZE = 64 * 1024
+
+
+def feed_url(source: dict) -> str:
+    """A feed source's first page: its rss_url, or its url for sources of type rss."""
+    return source.get('rss_url') or source.get('url') or ''
+
+
+def feed_date(feed_entry) -> str:
+    """
+    Date string of a feed item.
+
+    When the published/updated string is in a format we cannot parse,
+    feedparser's own parsed date (published_parsed/updated_parsed) is
+    used instead, as an ISO date.
+    """
+    date_str = feed_entry.get('published', feed_entry.get('updated', ''))
+    if date_str and parse_date(date_str) is None:
+        parsed = feed_entry.get('published_parsed') or feed_entry.get('updated_parsed')
+        if parsed:
+            return parse_date(parsed)
+    return date_str
+
+
+def entry_item(feed_entry) -> dict:
+    """Item of a feedparser entry, with its description still in HTML."""
+    return {
+        'title': feed_entry.get('title', ''),
+        'url': feed_entry.get('link', ''),
+        'date': feed_date(feed_entry),
+        'description': feed_entry.get('summary', feed_entry.get('description', ''))
+    }
+
+
+def _child_text(item, tags) -> str:
+    """Stripped text of the first of `tags` present and non-empty in an item."""
+    for tag in tags:
+        child = item.find(tag)
+        if child is not None:
+            text = ''.join(child.itertext()).strip()
+            if text:
+                return text
+    return ''
+
+
+def _resolve(elem, base: str, url: str) -> str:
+    """Resolve a link against the element's own xml:base and the inherited base."""
+    url = url.strip()
+    if not url:
+        return ''
+    return urljoin(urljoin(base, elem.get(XML_BASE) or ''), url)
+
+
+def _item_link(item, ns: str, base: str) -> str:
+    if ns == ATOM_NS:
+        for link in item.findall(f'{ATOM_NS}link'):
+            if link.get('rel', 'alternate') == 'alternate' and link.get('href'):
+                return _resolve(link, base, link.get('href'))
+        return ''
+    link = item.find(f'{ns}link')
+    if link is not None and ''.join(link.itertext()).strip():
+        return _resolve(link, base, ''.join(link.itertext()))
+    guid = item.find(f'{ns}guid')
+    if guid is not None and guid.get('isPermaLink', 'true') != 'false':
+        return _resolve(guid, base, guid.text or '')
+    return ''
+
+
+def _item_date(date_str: str) -> str:
+    # As feed_date: fall back to feedparser's date parser for unusual formats
+    if date_str and parse_date(date_str) is None:
+        parsed = feedparser_date(date_str)
+        if parsed:
+            return parse_date(parsed)
+    return date_str
+
+
+def iter_feed_items(text: str, base_url: str = '') -> Iterator[dict]:
+    """
+    Stream the items of an RSS or Atom feed.
+
+    The document is fed to a pull parser in chunks and each item is read
+    and discarded before the next is parsed, so a consumer that stops
+    early leaves the rest of the feed unparsed. Fields are chosen as
+    feedparser chooses them, and relative links are resolved against
+    xml:base and base_url as feedparser resolves them, so entry ids
+    match those from fetch().
+
+    Args:
+        text: Feed document
+        base_url: URL the feed was fetched from
+
+    Yields:
+        Dicts with title, url, date and description (HTML, not yet cleaned)
+
+    Raises:
+        ElementTree.ParseError: If the feed is not well-formed XML
+    """
+    parser = ElementTree.XMLPullParser(events=('start', 'end'))
+    # xml:base of each open element, inherited from its parent
+    bases = [base_url]
+    for start in range(0, len(text), CHUNK_SIZE):
+        parser.feed(text[start:start + CHUNK_SIZE])
+        yield from _read_items(parser, bases)
+    parser.close()
+    yield from _read_items(parser, bases)
+
+
+def _read_items(parser, bases: list) -> Iterator[dict]:
+    for event, elem in parser.read_events():
+        if event == 'start':
+            bases.append(urljoin(bases[-1], elem.get(XML_BASE) or ''))
+            continue
+        base = bases.pop()
+        if elem.tag not in ITEM_TAGS:
+            continue
+        ns = elem.tag[:elem.tag.index('}') + 1] if elem.tag.startswith('{') else ''
+        item = {
+            'title': _child_text(elem, [f'{ns}title']),
+            'url': _item_link(elem, ns, base),
+            'date': _item_date(
+                _child_text(elem, [f'{ns}pubDate', f'{ns}published', f'{ns}issued'])
+                or _child_text(elem, [f'{ns}updated', f'{ns}modified', DC_DATE])
+            ),
+            'description': _child_text(elem, [f'{ns}description', f'{ns}summary',
+                                              CONTENT_ENCODED, f'{ns}content'])
+        }
+        elem.clear()
+        yield item
+
+
+def parse_feed(feed_text: str, rss_url: str):
+    """Parse a whole feed with feedparser, resolving relative links against its URL."""
+    return feedparser.parse(feed_text, response_headers={'content-location': rss_url})
+
+
+class RssAdapter(SourceAdapter):
+    """Feed sources."""
+
+    def prepare(self, source: dict):
+        if not feed_url(source):
+            raise ValueError(f"Source '{source.get('name', '')}': rss sources need an rss_url or url")
+        self.crawler._pagination_plan(source)
+
+    def crawl(self, source: dict) -> list:
+        """Read a source's feed, following its pagination url_template if configured."""
+        crawler = self.crawler
+        stream = crawler.config.get('crawler', {}).get('stream_feeds', False)
+        return self.crawl_pages(source, feed_url(source), self.stream if stream else crawler._fetch_rss)
+
+    def stream(self, rss_url: str) -> Iterator[dict]:
+        """
+        Fetch a feed and yield its items as they are parsed.
+
+        Descriptions are left as HTML, so only items that become entries
+        are cleaned, and parsing stops when the caller stops iterating.
+        Feeds that are not well-formed XML are read with feedparser from
+        the first item not yet yielded.
+        """
+        crawler = self.crawler
+        feed_text, _ = crawler._fetch_text(rss_url)
+        if feed_text is None:
+            return
+        items = iter_feed_items(feed_text, rss_url)
+        read = 0
+        try:
+            while True:
+                with crawler.profile.stage('parse'):
+                    item = next(items, None)
+                if item is None:
+                    return
+                read += 1
+                yield item
+        except ElementTree.ParseError as e:
+            print(f"  Feed {rss_url} is not well-formed XML ({e}), reading it with feedparser")
+        with crawler.profile.stage('parse'):
+            feed = parse_feed(feed_text, rss_url)
+        for entry in feed.entries[read:]:
+            yield entry_item(entry)
+
+    def fetch(self, rss_url: str) -> list:
+        """Fetch and parse RSS feed, reusing the cached result if unchanged."""
+        crawler = self.crawler
+        try:
+            feed_text, not_modified = crawler._fetch_text(rss_url)
+            if feed_text is None:
+                return []
+            if not_modified:
+                cached_entries = crawler.http_cache.get_result(rss_url, RSS_RESULT_KEY)
+                if cached_entries is not None:
+                    print(f"  Feed not modified, reusing {len(cached_entries)} cached items")
+                    return cached_entries
+
+            with crawler.profile.stage('parse'):
+                feed = parse_feed(feed_text, rss_url)
+            entries = []
+            for entry in feed.entries:
+                item = entry_item(entry)
+                entries.append({
+                    'title': item['title'],
+                    'url': item['url'],
+                    'date': item['date'],
+                    'content': self.clean_description(item['description'])
+                })
+            if crawler.http_cache:
+                crawler.http_cache.store_result(rss_url, RSS_RESULT_KEY, entries)
+            return entries
+        except Exception as e:
+            print(f"Error fetching RSS {rss_url}: {e}")
+            return []
@@ -0,0 +1,122 @@
+"""
+Agentic AI Landscape Tracker - Site Search Index
+Inverted index over the exported entries: sorted tokens with delta-encoded
+postings for prefix search, plus per-source and per-category bitsets, so
+the site answers searches and filters without rescanning entry text.
+"""
+
+import base64
+import bisect
+import re
+from typing import Optional
+
+
+INDEX_VERSION = 1
+
+# Entry fields the site search covers
+SEARCH_FIELDS = ('title', 'summary', 'source')
+
+# Letters and digits; app.js tokenizes queries with the same rule
+TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def tokenize(text: str) -> list:
+    """Lowercase word tokens of a text."""
+    return TOKEN_RE.findall((text or '').lower())
+
+
+def entry_tokens(entry: dict) -> set:
+    """Distinct search tokens of an entry's title, summary, source and tags."""
+    tokens = set()
+    for field in SEARCH_FIELDS:
+        tokens.update(tokenize(entry.get(field) or ''))
+    for tag in entry.get('tags') or []:
+        tokens.update(tokenize(tag))
+    return tokens
+
+
+def encode_bitset(docs, size: int) -> str:
+    """Base64 of a little-endian bitset with one bit per document number."""
+    bits = 0
+    for doc in docs:
+        bits |= 1 << doc
+    return base64.b64encode(bits.to_bytes((size + 7) // 8, 'little')).decode('ascii')
+
+
+def decode_bitset(encoded: str) -> int:
+    """Bitset as a Python int (bit n set for document n)."""
+    return int.from_bytes(base64.b64decode(encoded), 'little')
+
+
+def build_index(entries: list) -> dict:
+    """
+    Build the search index for entries in site order.
+
+    Document numbers are positions in `entries`; `ids` maps them back to
+    entry ids.
+
+    Returns:
+        Dict with ids, sorted tokens, delta-encoded postings per token and
+        source/category bitsets
+    """
+    postings = {}
+    sources = {}
+    categories = {}
+    for doc, entry in enumerate(entries):
+        for token in entry_tokens(entry):
+            postings.setdefault(token, []).append(doc)
+        if entry.get('source'):
+            sources.setdefault(entry['source'], []).append(doc)
+        if entry.get('category'):
+            categories.setdefault(entry['category'], []).append(doc)
+
+    tokens = sorted(postings)
+    encoded = []
+    for token in tokens:
+        docs = postings[token]
+        encoded.append([docs[0]] + [b - a for a, b in zip(docs, docs[1:])])
+
+    size = len(entries)
+    return {
+        'version': INDEX_VERSION,
+        'ids': [entry.get('id') for entry in entries],
+        'tokens': tokens,
+        'postings': encoded,
+        'sources': {name: encode_bitset(docs, size) for name, docs in sources.items()},
+        'categories': {name: encode_bitset(docs, size) for name, docs in categories.items()},
+    }
+
+
+def _prefix_docs(index: dict, prefix: str) -> int:
+    """Bitset of documents containing any token starting with prefix."""
+    tokens = index['tokens']
+    bits = 0
+    position = bisect.bisect_left(tokens, prefix)
+    while position < len(tokens) and tokens[position].startswith(prefix):
+        doc = 0
+        for delta in index['postings'][position]:
+            doc += delta
+            bits |= 1 << doc
+        position += 1
+    return bits
+
+
+def search(index: dict, query: str = '', source: Optional[str] = None,
+           category: Optional[str] = None) -> list:
+    """
+    Answer a site search from the index, as app.js does.
+
+    Every query token must prefix-match a token of the entry.
+
+    Returns:
+        Matching entry ids in site order
+    """
+    size = len(index['ids'])
+    bits = (1 << size) - 1
+    if source is not None:
+        bits &= decode_bitset(index['sources'].get(source, ''))
+    if category is not None:
+        bits &= decode_bitset(index['categories'].get(category, ''))
+    for token in tokenize(query):
+        bits &= _prefix_docs(index, token)
+    return [entry_id for doc, entry_id in enumerate(index['ids']) if bits >> doc & 1]
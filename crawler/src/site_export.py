@@ -0,0 +1,143 @@
+"""
+Agentic AI Landscape Tracker - Static Site Data Export
+Splits entries.json into a small manifest plus minified, content-hashed
+monthly shards so the site can render the newest month first and cache
+every shard indefinitely, plus a prebuilt search index over all shards.
+
+Usage:
+    python site_export.py <entries.json> <output data dir>
+"""
+
+import hashlib
+import json
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+from entry_io import atomic_write_bytes, iter_entries
+from search_index import build_index
+
+
+MANIFEST_VERSION = 1
+SHARD_DIR = 'shards'
+UNDATED = 'undated'
+
+# Fields the site renders, filters or searches on; full content stays in entries.json
+SITE_FIELDS = ('id', 'title', 'source', 'url', 'date', 'summary', 'category', 'tags')
+
+# Files written by export_site_data, e.g. entries-2026-01.3f9a1c0b2d.json
+SHARD_NAME_RE = re.compile(r'^(entries-(\d{4}-\d{2}|undated)|search-index)\.[0-9a-f]{10}\.json$')
+MONTH_RE = re.compile(r'^(\d{4}-\d{2})')
+
+
+def _minify(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _write_hashed(directory: Path, stem: str, value) -> dict:
+    """Write minified JSON under a content-hashed name, unless it already exists."""
+    payload = _minify(value)
+    digest = hashlib.sha256(payload).hexdigest()[:10]
+    name = f"{stem}.{digest}.json"
+    target = directory / name
+    if not target.exists():
+        atomic_write_bytes(target, payload)
+    return {'file': f"{SHARD_DIR}/{name}", 'bytes': len(payload)}
+
+
+def shard_key(entry: dict) -> str:
+    """Month bucket ('YYYY-MM') of an entry, or 'undated'."""
+    match = MONTH_RE.match(entry.get('date') or '')
+    return match.group(1) if match else UNDATED
+
+
+def build_facets(entries: list) -> dict:
+    """Entry counts per source and per category, most common first."""
+    return {
+        'sources': dict(Counter(e.get('source') for e in entries if e.get('source')).most_common()),
+        'categories': dict(Counter(e.get('category') for e in entries if e.get('category')).most_common()),
+    }
+
+
+def build_shards(entries: list) -> list:
+    """
+    Group entries into monthly shards.
+
+    Returns:
+        List of (key, entries) tuples, newest month first and undated last,
+        each shard's entries newest first
+    """
+    buckets = {}
+    for entry in entries:
+        buckets.setdefault(shard_key(entry), []).append(
+            {field: entry[field] for field in SITE_FIELDS if field in entry}
+        )
+    months = sorted((k for k in buckets if k != UNDATED), reverse=True)
+    shards = [(month, sorted(buckets[month], key=lambda e: e['date'], reverse=True)) for month in months]
+    if UNDATED in buckets:
+        shards.append((UNDATED, buckets[UNDATED]))
+    return shards
+
+
+def export_site_data(data: dict, output_dir: str) -> dict:
+    """
+    Write manifest.json, the shard files and the search index for the site.
+
+    Shards whose content did not change keep their file name, so browsers
+    and the CDN keep serving them from cache. Shards no longer referenced
+    by the manifest are deleted.
+
+    Args:
+        data: Contents of entries.json ({'last_updated': ..., 'entries': [...]})
+        output_dir: Site data directory
+
+    Returns:
+        The manifest that was written
+    """
+    entries = data.get('entries', [])
+    output_path = Path(output_dir)
+    shard_path = output_path / SHARD_DIR
+    shard_path.mkdir(parents=True, exist_ok=True)
+
+    shards = []
+    site_entries = []
+    for key, shard_entries in build_shards(entries):
+        written = _write_hashed(shard_path, f"entries-{key}", shard_entries)
+        shards.append({'key': key, 'count': len(shard_entries), **written})
+        site_entries.extend(shard_entries)
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'last_updated': data.get('last_updated'),
+        'total': len(entries),
+        'facets': build_facets(entries),
+        'shards': shards,
+        # Document numbers in the index follow the shard order above
+        'index': _write_hashed(shard_path, 'search-index', build_index(site_entries)),
+    }
+    # Shards are written before the manifest that points at them, and old
+    # shards are only removed once nothing references them
+    atomic_write_bytes(output_path / 'manifest.json', _minify(manifest))
+
+    referenced = {Path(item['file']).name for item in shards + [manifest['index']]}
+    for stale in shard_path.iterdir():
+        if SHARD_NAME_RE.match(stale.name) and stale.name not in referenced:
+            stale.unlink()
+    return manifest
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print(__doc__.strip().splitlines()[-1].strip())
+        sys.exit(1)
+
+    metadata = {}
+    entries = list(iter_entries(sys.argv[1], metadata))
+    manifest = export_site_data({**metadata, 'entries': entries}, sys.argv[2])
+
+    newest = manifest['shards'][0] if manifest['shards'] else None
+    print(f"Exported {manifest['total']} entries in {len(manifest['shards'])} shards to {sys.argv[2]}")
+    if newest:
+        print(f"  First paint: {newest['file']} ({newest['count']} entries, {newest['bytes'] / 1024:.1f} KB)")
+    print(f"  Search index: {manifest['index']['file']} ({manifest['index']['bytes'] / 1024:.1f} KB)")
@@ -0,0 +1,238 @@
+"""
+Agentic AI Landscape Tracker - Sitemap Source Adapter
+Discovers articles from a site's sitemap.xml instead of its rendered
+listing pages. The XML is read with a pull parser, one <url> at a time,
+and URLs are filtered by pattern and by lastmod against the backfill
+cutoff; sitemap indexes are followed to their recently modified children.
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import Iterator, Optional, Tuple
+from urllib.parse import urlparse
+from xml.etree import ElementTree
+
+from source_adapters import SourceAdapter
+
+
+# Bump when the items built from a sitemap change
+SITEMAP_RESULT_KEY = 'sitemap-v1'
+
+NEWS_NS = '{http://www.google.com/schemas/sitemap-news/0.9}'
+
+DEFAULT_MAX_URLS = 200
+DEFAULT_MAX_SITEMAPS = 10
+
+CHUNK_SIZE = 64 * 1024
+
+
+def sitemap_url(source: dict) -> str:
+    """A sitemap source's sitemap: its sitemap_url, or /sitemap.xml on its site."""
+    if source.get('sitemap_url'):
+        return source['sitemap_url']
+    parsed = urlparse(source.get('url') or '')
+    return f"{parsed.scheme}://{parsed.netloc}/sitemap.xml" if parsed.netloc else ''
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def iter_sitemap(text: str) -> Iterator[Tuple[str, dict]]:
+    """
+    Stream the records of a sitemap or sitemap index.
+
+    Each <url> or <sitemap> element is read and discarded before the next
+    is parsed, so the document is never held as a tree.
+
+    Yields:
+        ('url' or 'sitemap', dict with loc and, when present, lastmod,
+        title and published from the Google News extension)
+    """
+    parser = ElementTree.XMLPullParser(events=('end',))
+    for start in range(0, len(text), CHUNK_SIZE):
+        parser.feed(text[start:start + CHUNK_SIZE])
+        yield from _read_records(parser)
+    parser.close()
+    yield from _read_records(parser)
+
+
+def _read_records(parser) -> Iterator[Tuple[str, dict]]:
+    for _, elem in parser.read_events():
+        kind = _local_name(elem.tag)
+        if kind not in ('url', 'sitemap'):
+            continue
+        record = {}
+        for child in elem:
+            name = _local_name(child.tag)
+            if name in ('loc', 'lastmod') and child.text:
+                record[name] = child.text.strip()
+        title = elem.findtext(f'{NEWS_NS}news/{NEWS_NS}title')
+        published = elem.findtext(f'{NEWS_NS}news/{NEWS_NS}publication_date')
+        if title:
+            record['title'] = title.strip()
+        if published:
+            record['published'] = published.strip()
+        elem.clear()
+        if record.get('loc'):
+            yield kind, record
+
+
+def slug_title(url: str) -> str:
+    """Readable title from the last path segment of a URL, e.g. 'Introducing agent mode'."""
+    segments = [segment for segment in urlparse(url).path.split('/') if segment]
+    if not segments:
+        return url
+    words = re.sub(r'\.\w+$', '', segments[-1]).replace('-', ' ').replace('_', ' ').split()
+    title = ' '.join(words)
+    return title[:1].upper() + title[1:]
+
+
+class _PageMeta(HTMLParser):
+    """Title and description from a page's <head>."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta = {}
+        self._in_title = False
+        self._title = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'title':
+            self._in_title = True
+        elif tag == 'meta':
+            attrs = dict(attrs)
+            key = attrs.get('property') or attrs.get('name')
+            if key and attrs.get('content'):
+                self.meta.setdefault(key.lower(), attrs['content'])
+
+    def handle_endtag(self, tag):
+        if tag == 'title':
+            self._in_title = False
+
+    def handle_data(self, data):
+        if self._in_title:
+            self._title.append(data)
+
+    @property
+    def title(self) -> str:
+        return ' '.join(''.join(self._title).split())
+
+
+def page_metadata(html: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Title and description of an article page, read from its <head> only.
+
+    Returns:
+        Tuple of (og:title or <title>, og:description or meta description);
+        either may be None
+    """
+    head_end = html.find('</head>')
+    parser = _PageMeta()
+    parser.feed(html if head_end < 0 else html[:head_end])
+    title = parser.meta.get('og:title') or parser.title or None
+    description = parser.meta.get('og:description') or parser.meta.get('description')
+    return title, description
+
+
+class SitemapAdapter(SourceAdapter):
+    """Sources discovered from sitemap.xml."""
+
+    def _settings(self, source: dict) -> dict:
+        return source.get('sitemap') or {}
+
+    def prepare(self, source: dict):
+        name = source.get('name', '')
+        if not sitemap_url(source):
+            raise ValueError(f"Source '{name}': sitemap sources need a sitemap_url or url")
+        try:
+            re.compile(self._settings(source).get('include') or '')
+        except re.error as e:
+            raise ValueError(f"Source '{name}': invalid sitemap include pattern: {e}") from e
+        self.crawler._pagination_plan(source)
+
+    def crawl(self, source: dict) -> list:
+        """
+        Build entries from a source's sitemap, newest first.
+
+        Titles come from the Google News extension or the URL slug, and
+        content is empty unless sitemap.fetch_pages reads each new
+        article's title and description from its page.
+        """
+        entries = self.crawl_pages(source, sitemap_url(source), lambda url: self.items(source, url))
+        if self._settings(source).get('fetch_pages', False):
+            entries = [self._with_page_metadata(source, entry) for entry in entries]
+        return entries
+
+    def items(self, source: dict, url: str) -> list:
+        """
+        Article items of a sitemap and the children of a sitemap index.
+
+        Returns:
+            Items sorted by date, newest first and undated last, limited
+            to sitemap.max_urls
+        """
+        crawler = self.crawler
+        settings = self._settings(source)
+        include = re.compile(settings['include']) if settings.get('include') else None
+        max_sitemaps = settings.get('max_sitemaps', DEFAULT_MAX_SITEMAPS)
+
+        items = []
+        pending, fetched = [url], set()
+        while pending and len(fetched) < max_sitemaps:
+            url = pending.pop(0)
+            if url in fetched:
+                continue
+            fetched.add(url)
+            for kind, record in self.fetch(url):
+                # Child sitemaps and URLs last modified before the cutoff hold nothing new
+                lastmod = crawler._parse_date(record.get('lastmod'))
+                if not crawler._is_within_backfill_range(lastmod):
+                    continue
+                if kind == 'sitemap':
+                    pending.append(record['loc'])
+                elif include is None or include.search(record['loc']):
+                    items.append({
+                        'title': record.get('title') or slug_title(record['loc']),
+                        'url': record['loc'],
+                        'date': record.get('published') or record.get('lastmod'),
+                        'content': ''
+                    })
+
+        items.sort(key=lambda item: crawler._parse_date(item['date']) or '', reverse=True)
+        return items[:settings.get('max_urls', DEFAULT_MAX_URLS)]
+
+    def fetch(self, url: str) -> list:
+        """Fetch and parse one sitemap, reusing the cached records if unchanged."""
+        crawler = self.crawler
+        try:
+            text, not_modified = crawler._fetch_text(url)
+            if text is None:
+                return []
+            if not_modified:
+                cached = crawler.http_cache.get_result(url, SITEMAP_RESULT_KEY)
+                if cached is not None:
+                    print(f"  Sitemap not modified, reusing {len(cached)} cached records")
+                    return cached
+
+            with crawler.profile.stage('parse'):
+                records = list(iter_sitemap(text))
+            if crawler.http_cache:
+                crawler.http_cache.store_result(url, SITEMAP_RESULT_KEY, records)
+            return records
+        except ElementTree.ParseError as e:
+            print(f"Error parsing sitemap {url}: {e}")
+            return []
+
+    def _with_page_metadata(self, source: dict, entry: dict) -> dict:
+        """Rebuild an entry with its page's title and description, keeping its id."""
+        crawler = self.crawler
+        html, _ = crawler._fetch_text(entry['url'])
+        if html is None:
+            return entry
+        with crawler.profile.stage('parse'):
+            title, description = page_metadata(html)
+        return crawler._make_entry(
+            entry['id'], title or entry['title'], source['name'], entry['url'], entry['date'],
+            self.clean_description(description or '')
+        )
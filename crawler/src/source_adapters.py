@@ -0,0 +1,170 @@
+"""
+Agentic AI Landscape Tracker - Source Adapters
+Registry of source types, keyed on the `type` field of a source in
+config.yaml. Adapter modules, and the parsing libraries they need, are
+only imported once a source of their type is configured.
+"""
+
+import importlib
+import re
+from typing import Callable, Iterable, Union
+
+
+# Source type -> 'module:Class', imported on first use
+ADAPTERS = {
+    'rss': 'rss_adapter:RssAdapter',
+    'html-listing': 'html_adapter:HtmlListingAdapter',
+    'sitemap': 'sitemap_adapter:SitemapAdapter',
+    'json-api': 'json_api_adapter:JsonApiAdapter',
+}
+
+# Descriptive types used before adapters existed; these sources read their
+# rss_url if set, else scrape their url
+UNTYPED = (None, 'blog', 'changelog')
+
+# Removed from item descriptions (case-insensitive)
+DESCRIPTION_UI_PATTERNS = ['learn more', 'read more', 'continue reading',
+                           'share', 'tweet', 'subscribe', 'follow',
+                           'your browser does not support the video tag']
+
+MAX_DESCRIPTION_LENGTH = 800
+
+_loaded = {}
+
+
+class SourceAdapter:
+    """
+    Crawls the sources of one type.
+
+    One adapter instance is created per crawler and shared by every source
+    of its type, possibly from several worker threads. Fetching, caching,
+    known-entry tracking and entry building go through the crawler.
+    """
+
+    def __init__(self, crawler):
+        self.crawler = crawler
+
+    def prepare(self, source: dict):
+        """
+        Validate a source's config when the crawler starts.
+
+        Raises:
+            ValueError: If the source cannot be crawled as configured
+        """
+
+    def crawl(self, source: dict) -> list:
+        """Fetch and extract the entries of an enabled source."""
+        raise NotImplementedError
+
+    def crawl_pages(self, source: dict, first_url: str, fetch_items: Callable[[str], Iterable[dict]]) -> list:
+        """
+        Build entries from pages of items, following the source's pagination url_template.
+
+        Stops at a streak of already-known entries, after a page with an
+        entry older than the backfill cutoff, or at an empty page. A page
+        is read only until a streak of entries older than the cutoff, so
+        a lazy fetch_items never parses the rest of a long history.
+
+        Args:
+            source: Source config
+            first_url: URL of the first page
+            fetch_items: Returns the items of a page URL, newest first, as
+                dicts with title, url, date and either content or an HTML
+                description that is cleaned only if the item is kept
+        """
+        crawler = self.crawler
+        plan = crawler._pagination_plan(source)
+        entries = []
+        known_streak = 0
+        cutoff_streak = crawler.config.get('crawler', {}).get('cutoff_streak', 3)
+        page, page_url = 1, first_url
+        while page_url:
+            if page > 1:
+                print(f"  Page {page}: {page_url}")
+            read, old_streak = 0, 0
+            reached_cutoff = False
+            for item in fetch_items(page_url):
+                read += 1
+                entry_id = crawler._generate_id(item['url'], item['title'])
+                known_streak = known_streak + 1 if entry_id in crawler.known_entries else 0
+                if crawler._reached_known_entries(known_streak):
+                    return entries
+
+                date = crawler._parse_date(item['date'])
+                if not crawler._is_within_backfill_range(date):
+                    reached_cutoff = True
+                    old_streak += 1
+                    if old_streak >= cutoff_streak:
+                        break
+                    continue
+                old_streak = 0
+
+                entries.append(crawler._make_entry(
+                    entry_id, item['title'], source['name'], item['url'], date, self.item_content(item)
+                ))
+
+            if not read or reached_cutoff:
+                break
+            page_url = plan.next_page_url(page, page_url)
+            page += 1
+        return entries
+
+    def item_content(self, item: dict) -> str:
+        """An item's content, cleaning its HTML description if it has no content yet."""
+        if 'content' in item:
+            return item['content']
+        return self.clean_description(item.get('description') or '')
+
+    def clean_description(self, raw_html: str) -> str:
+        """Plain-text item description without UI phrases, cut to a sentence end."""
+        from extraction import ensure_sentence_end
+
+        text = self.crawler._clean_html(raw_html)
+        if not text:
+            return text
+        for pattern in DESCRIPTION_UI_PATTERNS:
+            text = re.sub(re.escape(pattern), '', text, flags=re.IGNORECASE)
+        text = ' '.join(text.split())
+        return ensure_sentence_end(text[:MAX_DESCRIPTION_LENGTH])
+
+
+def register_adapter(type_name: str, adapter: Union[str, type]):
+    """
+    Register an adapter for a source type, replacing any existing one.
+
+    Args:
+        type_name: Value of `type` in a source's config
+        adapter: SourceAdapter subclass, or 'module:Class' to import lazily
+    """
+    ADAPTERS[type_name] = adapter
+    _loaded.pop(type_name, None)
+
+
+def source_type(source: dict) -> str:
+    """
+    Adapter type of a source.
+
+    Raises:
+        ValueError: If the source's type has no registered adapter
+    """
+    type_name = source.get('type')
+    if type_name in UNTYPED:
+        return 'rss' if source.get('rss_url') else 'html-listing'
+    if type_name not in ADAPTERS:
+        raise ValueError(
+            f"Source '{source.get('name', '')}': unknown type '{type_name}'; "
+            f"expected one of {', '.join(ADAPTERS)}"
+        )
+    return type_name
+
+
+def load_adapter(type_name: str) -> type:
+    """Get the adapter class for a source type, importing its module on first use."""
+    adapter = _loaded.get(type_name)
+    if adapter is None:
+        adapter = ADAPTERS[type_name]
+        if isinstance(adapter, str):
+            module_name, class_name = adapter.split(':')
+            adapter = getattr(importlib.import_module(module_name), class_name)
+        _loaded[type_name] = adapter
+    return adapter
@@ -0,0 +1,93 @@
+"""
+Agentic AI Landscape Tracker - Compiled Source Plans
+Per-source extraction plans built once from config: compiled CSS
+selectors plus resolved link, date, URL and pagination strategies, so
+crawling a listing page does no selector parsing.
+"""
+
+from typing import Optional
+from urllib.parse import urlparse
+
+import soupsieve
+
+from pagination import PaginationPlan
+
+
+DEFAULT_SELECTORS = {
+    'article_list': 'article',
+    'title': 'h2',
+    'date': 'time',
+    'link': 'a',
+}
+
+
+def _compile(source_name: str, field: str, selector):
+    """Compile one CSS selector, naming the source and field on failure."""
+    try:
+        return soupsieve.compile(selector)
+    except (soupsieve.SelectorSyntaxError, TypeError) as e:
+        raise ValueError(f"Source '{source_name}': invalid {field} selector {selector!r}: {e}") from e
+
+
+class SourcePlan(PaginationPlan):
+    """Compiled selectors and resolved strategies for one HTML source."""
+
+    def __init__(self, source: dict):
+        name = source.get('name', '')
+        self.selectors = dict(source.get('selectors') or {})
+        selectors = {**DEFAULT_SELECTORS, **self.selectors}
+
+        self.article_list = _compile(name, 'article_list', selectors['article_list'])
+        self.title = _compile(name, 'title', selectors['title'])
+        self.date = _compile(name, 'date', selectors['date'])
+        # A null link selector means the article element itself is the link
+        self.link = None if selectors['link'] is None else _compile(name, 'link', selectors['link'])
+
+        super().__init__(source)
+
+        # Relative links resolve against the site root or the listing URL
+        parsed = urlparse(self.url)
+        self.origin = f"{parsed.scheme}://{parsed.netloc}"
+        self.base_url = self.url.rstrip('/')
+
+    def _compile_next(self, source_name: str):
+        if self.pagination.get('next') is None:
+            return None
+        return _compile(source_name, 'pagination next', self.pagination['next'])
+
+    def matches(self, source: dict) -> bool:
+        """Check whether this plan was built from the source's current selectors, URL and pagination."""
+        return self.selectors == (source.get('selectors') or {}) and super().matches(source)
+
+    def articles(self, soup, limit: int = 0) -> list:
+        """Article elements on a listing page, in document order."""
+        return self.article_list.select(soup, limit=limit)
+
+    def title_text(self, article) -> Optional[str]:
+        """Article title, or None if the article has no title element."""
+        title_elem = self.title.select_one(article)
+        return title_elem.get_text(strip=True) if title_elem else None
+
+    def date_text(self, article) -> Optional[str]:
+        """Raw article date: the datetime attribute if present, else the element text."""
+        date_elem = self.date.select_one(article)
+        if date_elem is None:
+            return None
+        if 'datetime' in date_elem.attrs:
+            return date_elem['datetime']
+        return date_elem.get_text(strip=True)
+
+    def link_url(self, article) -> str:
+        """Absolute article URL, or '' if the article has no link."""
+        if self.link is None:
+            link_elem = article if article.name == 'a' else None
+        else:
+            link_elem = self.link.select_one(article)
+        url = link_elem.get('href', '') if link_elem else ''
+
+        if url and not url.startswith('http'):
+            if url.startswith('/'):
+                url = f"{self.origin}{url}"
+            else:
+                url = f"{self.base_url}/{url.lstrip('/')}"
+        return url
@@ -3,14 +3,26 @@ Agentic AI Landscape Tracker - LLM Summarizer
 Uses GitHub Copilot SDK to generate brief summaries.
 """
 
-from typing import Optional
+from typing import Callable, Optional
+
+from llm_cache import LLMCache
+from enrichment import extract_json_object, normalize_result
+
+
+# Bump when the wording of the corresponding prompt changes so cached
+# results produced by the old prompt are no longer reused
+SUMMARY_PROMPT_VERSION = 1
+CATEGORY_PROMPT_VERSION = 1
+ENRICH_PROMPT_VERSION = 1
 
 
 class Summarizer:
     """Generate summaries using GitHub Copilot SDK."""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[LLMCache] = None, model: str = 'copilot'):
         self.client = None
+        self.cache = cache
+        self.model = model
         self._init_client()
     
     def _init_client(self):
@@ -65,6 +77,53 @@ class Summarizer:
         # Fallback: extract first meaningful sentences
         return self._fallback_summarize(title, content, source)
     
+    def enrich(self, title: str, content: str, source: str) -> dict:
+        """
+        Summarize and categorize an announcement with a single LLM call.
+        
+        Args:
+            title: Article title
+            content: Article content/excerpt
+            source: Source name (e.g., "Anthropic", "Cursor")
+            
+        Returns:
+            Dict with 'summary', 'category' ('Agentic AI', 'Other', or '' if
+            SDK unavailable) and 'confidence' (0-100, or None if unknown)
+        """
+        if not content or not self.client:
+            return {
+                'summary': self.summarize(title, content, source),
+                'category': '',
+                'confidence': None
+            }
+        
+        return self._enrich_with_copilot(title, content, source)
+    
+    def _complete(self, template: str, version: int, prompt: str, max_tokens: int, temperature: float,
+                  usable: Optional[Callable[[str], bool]] = None) -> str:
+        """
+        Call the Copilot SDK, answering from the LLM cache when possible.
+        
+        Only non-empty responses that pass `usable` are cached, so a reply
+        the caller cannot parse is asked for again on the next run.
+        """
+        key = None
+        if self.cache is not None:
+            key = LLMCache.make_key(self.model, template, version, prompt,
+                                    max_tokens=max_tokens, temperature=temperature)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        response = self.client.complete(
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        if self.cache is not None and response and response.strip() and (usable is None or usable(response)):
+            self.cache.set(key, response)
+        return response
+    
     def _categorize_with_copilot(self, title: str, content: str) -> str:
         """Categorize content using GitHub Copilot SDK."""
         prompt = f"""Categorize this AI/tech announcement as either 'Agentic AI' or 'Other'.
@@ -88,11 +147,8 @@ Content: {content[:800]}
 Respond with ONLY 'Agentic AI' or 'Other':"""
         
         try:
-            response = self.client.complete(
-                prompt=prompt,
-                max_tokens=10,
-                temperature=0.1
-            )
+            response = self._complete('categorize', CATEGORY_PROMPT_VERSION, prompt,
+                                      max_tokens=10, temperature=0.1)
             category = response.strip()
             # Validate response
             if category in ['Agentic AI', 'Other']:
@@ -117,17 +173,48 @@ Content: {content[:1000]}
 Summary:"""
         
         try:
-            response = self.client.complete(
-                prompt=prompt,
-                max_tokens=150,
-                temperature=0.3
-            )
+            response = self._complete('summarize', SUMMARY_PROMPT_VERSION, prompt,
+                                      max_tokens=150, temperature=0.3)
             summary = response.strip()
             return summary if summary else self._fallback_summarize(title, content, source)
         except Exception as e:
             print(f"Copilot summarization failed: {e}")
             return self._fallback_summarize(title, content, source)
     
+    def _enrich_with_copilot(self, title: str, content: str, source: str) -> dict:
+        """Generate summary, category and confidence in one Copilot SDK call."""
+        prompt = f"""Analyze this AI/tech announcement.
+
+1. Summarize it in 2-3 concise sentences.
+   Focus on: what was announced, key capabilities, and why it matters.
+2. Categorize it as either 'Agentic AI' or 'Other'.
+   Agentic AI refers to AI systems that can autonomously plan and execute multi-step
+   tasks, make decisions and take actions on behalf of users, use tools or APIs, or
+   work as AI agents or multi-agent systems.
+   Other covers general LLMs, image generators, simple chatbots, model updates without
+   agent capabilities, and infrastructure/platform news.
+3. Give your confidence (0-100) in the category.
+
+Source: {source}
+Title: {title}
+Content: {content[:1000]}
+
+Respond with ONLY this JSON:
+{{"summary": "...", "category": "Agentic AI" or "Other", "confidence": 85}}"""
+        
+        try:
+            response = self._complete('enrich', ENRICH_PROMPT_VERSION, prompt,
+                                      max_tokens=250, temperature=0.2,
+                                      usable=lambda text: extract_json_object(text) is not None)
+            result = extract_json_object(response) or {}
+        except Exception as e:
+            print(f"Copilot enrichment failed: {e}")
+            result = {}
+        
+        # Fall back field by field so one malformed value doesn't discard the rest
+        return normalize_result(result, self._fallback_summarize(title, content, source),
+                                fallback_confidence=None)
+    
     def _fallback_summarize(self, title: str, content: str, source: str) -> str:
         """Fallback summarization when Copilot SDK unavailable."""
         # Clean and truncate content
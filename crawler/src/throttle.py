@@ -0,0 +1,49 @@
+"""
+Agentic AI Landscape Tracker - Per-host request throttle
+Keeps the configured delay between requests to the same host while
+letting requests to different hosts proceed in parallel.
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class HostThrottle:
+    """Enforce a minimum interval between requests to the same host."""
+
+    def __init__(self, delay: float = 1.0):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._host_locks = {}
+        self._next_allowed = {}
+
+    def _host_lock(self, host: str) -> threading.Lock:
+        """Get (or create) the lock serializing requests to a host."""
+        with self._lock:
+            if host not in self._host_locks:
+                self._host_locks[host] = threading.Lock()
+            return self._host_locks[host]
+
+    def wait(self, url: str) -> float:
+        """
+        Block until a request to the URL's host is allowed.
+
+        The first request to a host waits the full delay, matching the
+        sequential crawler which always slept before fetching.
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            Seconds spent waiting
+        """
+        host = urlparse(url).netloc.lower()
+        with self._host_lock(host):
+            now = time.monotonic()
+            next_allowed = self._next_allowed.get(host, now + self.delay)
+            wait_time = max(0.0, next_allowed - now)
+            if wait_time:
+                time.sleep(wait_time)
+            self._next_allowed[host] = time.monotonic() + self.delay
+            return wait_time
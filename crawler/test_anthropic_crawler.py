@@ -5,6 +5,8 @@ Test Anthropic crawling specifically with debug output
 import sys
 sys.path.insert(0, 'src')
 
+from bs4 import BeautifulSoup
+
 from crawler import Crawler
 
 # Create crawler instance
@@ -28,7 +30,8 @@ print()
 
 # Crawl just Anthropic
 print("Fetching page...")
-soup = crawler._fetch_page(anthropic_source['url'])
+html, _ = crawler._fetch_text(anthropic_source['url'])
+soup = BeautifulSoup(html, crawler.parser) if html else None
 
 if not soup:
     print("ERROR: Failed to fetch page")
@@ -5,6 +5,8 @@ Test Cursor crawling specifically with updated selectors
 import sys
 sys.path.insert(0, 'src')
 
+from bs4 import BeautifulSoup
+
 from crawler import Crawler
 
 # Create crawler instance
@@ -41,7 +43,8 @@ if entries:
 else:
     print("\nNo entries found - debugging...")
     
-    soup = crawler._fetch_page(cursor_source['url'])
+    html, _ = crawler._fetch_text(cursor_source['url'])
+    soup = BeautifulSoup(html, crawler.parser) if html else None
     if soup:
         selectors = cursor_source['selectors']
         articles = soup.select(selectors['article_list'])
@@ -0,0 +1,50 @@
+"""
+Unit tests for entry change detection
+"""
+
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from changes import content_fingerprint, has_changed, needs_processing
+
+
+ENTRY = {'id': 'abc', 'title': 'New Agent SDK', 'content': 'Ships today with tool use.'}
+
+
+class TestChangeDetection:
+    """Test content fingerprints and change detection"""
+    
+    def test_fingerprint_is_stable(self):
+        """Test the same content always has the same fingerprint"""
+        assert content_fingerprint(ENTRY) == content_fingerprint(dict(ENTRY))
+        assert len(content_fingerprint(ENTRY)) == 16
+    
+    def test_fingerprint_ignores_whitespace_and_case(self):
+        """Test cosmetic differences do not change the fingerprint"""
+        reformatted = dict(ENTRY, content='  ships TODAY   with tool use. ')
+        assert content_fingerprint(reformatted) == content_fingerprint(ENTRY)
+    
+    def test_edited_content_changes_fingerprint(self):
+        """Test a real edit changes the fingerprint"""
+        edited = dict(ENTRY, content='Ships next week with tool use.')
+        assert content_fingerprint(edited) != content_fingerprint(ENTRY)
+    
+    def test_has_changed(self):
+        """Test new and edited entries are flagged"""
+        assert has_changed(ENTRY, None) is True
+        assert has_changed(ENTRY, dict(ENTRY)) is False
+        assert has_changed(ENTRY, dict(ENTRY, content='Old text.')) is True
+    
+    def test_stored_hash_is_used(self):
+        """Test a stored contentHash is compared instead of recomputed"""
+        existing = dict(ENTRY, contentHash=content_fingerprint(ENTRY), content='')
+        assert has_changed(ENTRY, existing) is False
+    
+    def test_needs_processing_low_confidence(self):
+        """Test unchanged entries are only reprocessed when confidence is low"""
+        assert needs_processing(ENTRY, dict(ENTRY, categoryConfidence=90)) is False
+        assert needs_processing(ENTRY, dict(ENTRY, categoryConfidence=50)) is True
+        assert needs_processing(ENTRY, dict(ENTRY)) is True
@@ -0,0 +1,104 @@
+"""
+Unit tests for date normalization and the backfill cutoff
+"""
+
+import time
+import pytest
+from pathlib import Path
+import sys
+
+import yaml
+from bs4 import BeautifulSoup
+from dateutil import parser as date_parser
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from dates import _fast_path, backfill_cutoff, date_ordinal, is_on_or_after, parse_date
+from source_plan import SourcePlan
+
+CRAWLER_DIR = Path(__file__).parent.parent
+
+
+def dateutil_date(value):
+    """The crawler's previous _parse_date"""
+    if not value:
+        return None
+    try:
+        return date_parser.parse(value).strftime('%Y-%m-%d')
+    except Exception:
+        return None
+
+
+class TestParseDate:
+    """Test parse_date function"""
+
+    @pytest.mark.parametrize('value, expected', [
+        ('2024-01-15', '2024-01-15'),
+        ('2024-01-15T10:30:00Z', '2024-01-15'),
+        ('2024-01-15T23:30:00.123456-05:00', '2024-01-15'),
+        ('Mon, 15 Jan 2024 23:30:00 -0500', '2024-01-15'),
+        ('Tue, 2 Jan 2024 08:00:00 GMT', '2024-01-02'),
+        ('Jan 5, 2024', '2024-01-05'),
+        ('January 05 2024', '2024-01-05'),
+    ])
+    def test_fast_paths(self, value, expected):
+        """Test common formats are parsed without dateutil, dates taken as written"""
+        assert _fast_path(value) == expected
+        assert parse_date(value) == expected == dateutil_date(value)
+
+    @pytest.mark.parametrize('value', [
+        '15 January 2024', '2024/01/15', 'Sept 5, 2024', '2024-01-15T10:30:00+25:00',
+        '2024-02-30', 'Mon, 15 Jan 2024 08:00:00 EST', 'invalid date', '',
+    ])
+    @pytest.mark.filterwarnings('ignore::dateutil.parser.UnknownTimezoneWarning')
+    def test_other_formats_match_dateutil(self, value):
+        """Test anything outside the fast paths behaves as dateutil does"""
+        assert parse_date(value) == dateutil_date(value)
+
+    def test_struct_time(self):
+        """Test feedparser's parsed tuples are accepted"""
+        assert parse_date(time.strptime('2024-03-09 22:00', '%Y-%m-%d %H:%M')) == '2024-03-09'
+
+    def test_empty(self):
+        """Test empty values are undated"""
+        assert parse_date(None) is None
+        assert parse_date('') is None
+
+    @pytest.mark.parametrize('fixture, source_name', [
+        ('anthropic_page.html', 'Anthropic'),
+        ('cursor_page.html', 'Cursor'),
+    ])
+    def test_fixture_dates_match_dateutil(self, fixture, source_name):
+        """Test every date on the fixture pages parses as before"""
+        with open(CRAWLER_DIR / 'config.yaml', 'r', encoding='utf-8') as f:
+            source = next(s for s in yaml.safe_load(f)['sources'] if s['name'] == source_name)
+        plan = SourcePlan(source)
+        soup = BeautifulSoup((CRAWLER_DIR / fixture).read_text(encoding='utf-8'), 'html.parser')
+
+        values = [plan.date_text(article) for article in plan.articles(soup)]
+        assert any(values)
+        for value in values:
+            assert parse_date(value) == dateutil_date(value)
+
+
+class TestBackfillCutoff:
+    """Test the precomputed backfill cutoff"""
+
+    def test_cutoff(self):
+        """Test dates are compared as ordinals against the start date"""
+        cutoff = backfill_cutoff({'enabled': True, 'start_date': '2024-01-01'})
+        assert cutoff == date_ordinal('2024-01-01')
+        assert is_on_or_after('2024-01-01', cutoff) is True
+        assert is_on_or_after('2023-12-31', cutoff) is False
+
+    def test_nothing_filtered(self):
+        """Test disabled backfill, invalid start dates and undated entries pass"""
+        assert backfill_cutoff({'enabled': False, 'start_date': '2024-01-01'}) is None
+        assert backfill_cutoff(None) is None
+        assert backfill_cutoff({'enabled': True, 'start_date': 'soon'}) is None
+        assert is_on_or_after('2000-01-01', None) is True
+
+        cutoff = backfill_cutoff({'enabled': True, 'start_date': '2024-01-01'})
+        assert is_on_or_after(None, cutoff) is True
+        assert is_on_or_after('not a date', cutoff) is True
@@ -0,0 +1,208 @@
+"""
+Unit tests for near-duplicate detection
+"""
+
+import json
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import Mock, patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from crawler import Crawler
+from entry_store import EntryStore
+from dedup import MAX_DISTANCE, NearDuplicateIndex, add_duplicates, deduplicate, hamming, simhash
+
+
+ANNOUNCEMENT = (
+    "Today we are releasing a new version of our agent framework with support for "
+    "long running tasks, tool use across multiple repositories and a redesigned "
+    "permission model that lets teams decide which actions an agent may take "
+    "without asking. The release also includes faster startup, lower memory use "
+    "and a plugin interface for custom tools."
+)
+
+
+def make_entry(n, title, content=ANNOUNCEMENT, date='2024-05-01', source='Test Source'):
+    return {'id': f"id-{n}", 'title': title, 'source': source,
+            'url': f"https://example.com/{n}", 'date': date, 'content': content}
+
+
+class TestSimHash:
+    """Test fingerprinting"""
+
+    def test_near_identical_texts_are_close(self):
+        """Test a re-titled, lightly edited copy stays within the distance"""
+        original = make_entry(1, 'Agent framework 2.0 released')
+        copy = make_entry(2, 'Agent framework 2.0 is out',
+                          ANNOUNCEMENT.replace('faster startup', 'quicker startup'))
+        assert hamming(simhash(original), simhash(copy)) <= MAX_DISTANCE
+
+    def test_different_texts_are_far(self):
+        """Test unrelated entries are not near-duplicates"""
+        other = make_entry(2, 'Quarterly results', (
+            "Revenue grew in every region this quarter as customers adopted the new "
+            "pricing plans, and the board approved a dividend increase alongside a "
+            "share buyback programme for the coming year."
+        ))
+        assert hamming(simhash(make_entry(1, 'Agent framework 2.0 released')), simhash(other)) > MAX_DISTANCE
+
+    def test_short_texts_have_no_fingerprint(self):
+        """Test title-only entries are not compared"""
+        assert simhash(make_entry(1, 'Agent framework 2.0 released', '')) is None
+
+
+class TestNearDuplicateIndex:
+    """Test NearDuplicateIndex class"""
+
+    def test_finds_within_distance(self):
+        """Test fingerprints differing in a few bits are found, others are not"""
+        index = NearDuplicateIndex(max_distance=3)
+        index.add('a', 0)
+        index.add('b', 0b1111)
+
+        assert index.find(0b1) == 'a'
+        assert index.find(0b1111) == 'b'
+        assert index.find(0xFF) is None
+        assert len(index) == 2
+        assert 'a' in index
+
+    def test_finds_differences_spread_over_every_band(self):
+        """Test a pair at max_distance is found even when no band matches exactly"""
+        index = NearDuplicateIndex()
+        index.add('a', 0)
+        spread = sum(1 << bit for bit in (0, 16, 17, 32, 33, 48, 49)[:MAX_DISTANCE])
+
+        assert hamming(0, spread) == MAX_DISTANCE
+        assert index.find(spread) == 'a'
+        assert index.find(spread | 1 << 63) is None
+
+    def test_ties_go_to_earliest(self):
+        """Test the first indexed entry wins at equal distance"""
+        index = NearDuplicateIndex(max_distance=3)
+        index.add('a', 0b01)
+        index.add('b', 0b10)
+        assert index.find(0b11) == 'a'
+
+
+class TestDeduplicate:
+    """Test deduplicate function"""
+
+    def test_oldest_crawled_entry_is_canonical(self):
+        """Test a syndicated copy is folded into the earlier original"""
+        entries = [
+            make_entry(2, 'Agent framework 2.0 is out', date='2024-05-02', source='Mirror'),
+            make_entry(1, 'Agent framework 2.0 released', date='2024-05-01'),
+        ]
+        kept, clusters = deduplicate(entries)
+
+        assert [e['id'] for e in kept] == ['id-1']
+        assert [e['id'] for e in clusters['id-1']] == ['id-2']
+        assert kept[0]['simhash']
+
+    def test_archive_is_canonical(self):
+        """Test crawled copies of an archived entry are folded into it"""
+        archive = [make_entry(1, 'Agent framework 2.0 released', date='2024-05-03')]
+        kept, clusters = deduplicate([make_entry(2, 'Agent framework 2.0 is out')], archive)
+
+        assert kept == []
+        assert list(clusters) == ['id-1']
+
+    def test_recrawled_entries_are_kept(self):
+        """Test an entry is never a duplicate of its own archived version"""
+        archive = [make_entry(1, 'Agent framework 2.0 released')]
+        entries = [make_entry(1, 'Agent framework 2.0 released')]
+        assert deduplicate(entries, archive) == (entries, {})
+
+    def test_stored_fingerprint_is_used(self):
+        """Test archived entries are indexed from their simhash field"""
+        crawled = make_entry(2, 'Agent framework 2.0 is out')
+        archive = [{'id': 'id-1', 'simhash': format(simhash(crawled), '016x')}]
+        kept, clusters = deduplicate([crawled], archive)
+
+        assert kept == []
+        assert list(clusters) == ['id-1']
+
+    def test_add_duplicates(self):
+        """Test duplicates are recorded once"""
+        canonical = make_entry(1, 'Agent framework 2.0 released')
+        duplicate = make_entry(2, 'Agent framework 2.0 is out', source='Mirror')
+
+        assert add_duplicates(canonical, [duplicate]) is True
+        assert add_duplicates(canonical, [duplicate]) is False
+        assert canonical['duplicates'] == [
+            {'id': 'id-2', 'source': 'Mirror', 'url': 'https://example.com/2'}
+        ]
+
+
+class TestCrawlerNearDuplicates:
+    """Test Crawler integration with near-duplicate detection"""
+
+    @pytest.fixture
+    def crawler(self, tmp_path):
+        """Create crawler with a mirror source and a previous output file"""
+        config_path = tmp_path / "test_config.yaml"
+        output_path = tmp_path / "output.json"
+        config_path.write_text(f"""
+output:
+  path: "{output_path}"
+
+backfill:
+  enabled: false
+
+crawler:
+  delay_between_requests: 0
+
+dedup:
+  enabled: true
+
+sources:
+  - name: "Mirror"
+    url: "https://mirror.example.com"
+    rss_url: "https://mirror.example.com/feed"
+""")
+        previous = [make_entry(1, 'Agent framework 2.0 released')]
+        output_path.write_text(json.dumps({'last_updated': '', 'entries': previous}))
+        crawler = Crawler(str(config_path))
+        crawler.summarizer = Mock()
+        crawler.summarizer.enrich.return_value = {'summary': "Summary", 'category': "Other"}
+        return crawler
+
+    def test_duplicates_skip_summarization(self, crawler):
+        """Test a copy of a previous entry is recorded on it and not summarized"""
+        items = [{'title': 'Agent framework 2.0 is out', 'url': 'https://mirror.example.com/agents',
+                  'date': '2024-05-02', 'content': ANNOUNCEMENT}]
+        with patch.object(crawler, '_fetch_rss', return_value=items):
+            result = crawler.run(incremental=True)
+
+        assert [e['id'] for e in result] == ['id-1']
+        assert result[0]['duplicates'][0]['url'] == 'https://mirror.example.com/agents'
+        crawler.summarizer.enrich.assert_not_called()
+        assert crawler.profile.counters['near_duplicates'] == 1
+
+    def test_duplicates_recorded_in_entry_store(self, crawler, tmp_path):
+        """Test a stored canonical entry is updated in place"""
+        crawler.entry_store = EntryStore(str(tmp_path / 'entries.sqlite'))
+        items = [{'title': 'Agent framework 2.0 is out', 'url': 'https://mirror.example.com/agents',
+                  'date': '2024-05-02', 'content': ANNOUNCEMENT}]
+        with patch.object(crawler, '_fetch_rss', return_value=items):
+            result = crawler.run()
+        crawler.entry_store.close()
+
+        assert [e['id'] for e in result] == ['id-1']
+        assert len(result[0]['duplicates']) == 1
+
+    def test_entry_store_fingerprints_are_saved(self, crawler, tmp_path):
+        """Test stored entries are fingerprinted once, not on every run"""
+        crawler.entry_store = EntryStore(str(tmp_path / 'entries.sqlite'))
+        crawler.entry_store.upsert([make_entry(1, 'Agent framework 2.0 released')])
+
+        crawler.fold_near_duplicates([], [])
+        assert crawler.entry_store.get('id-1')['simhash']
+
+        with patch('dedup.simhash') as mock_simhash:
+            crawler.fold_near_duplicates([], [])
+        crawler.entry_store.close()
+        mock_simhash.assert_not_called()
@@ -0,0 +1,93 @@
+"""
+Unit tests for LLM enrichment helpers
+"""
+
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from enrichment import (
+    Checkpoint, build_batch_prompt, is_rate_limit_error,
+    parse_batch_result, parse_result
+)
+
+
+ENTRIES = [
+    {'id': 'a1', 'title': 'Agent SDK', 'source': 'Test', 'content': 'An SDK for building agents.'},
+    {'id': 'b2', 'title': 'New Model', 'source': 'Test', 'content': 'A bigger language model.'},
+]
+
+
+class TestParsing:
+    """Test response parsing"""
+    
+    def test_parse_result(self):
+        """Test a JSON object embedded in prose is parsed"""
+        text = 'Sure!\n{"summary": "An SDK.", "category": "Agentic AI", "confidence": 91}\nDone.'
+        assert parse_result(text, ENTRIES[0]) == {
+            'summary': 'An SDK.', 'category': 'Agentic AI', 'confidence': 91
+        }
+    
+    def test_parse_result_field_fallbacks(self):
+        """Test bad fields fall back individually"""
+        text = '{"summary": "", "category": "agentic ai systems", "confidence": "high"}'
+        result = parse_result(text, ENTRIES[0])
+        assert result['summary'] == ENTRIES[0]['content']
+        assert result['category'] == 'Agentic AI'
+        assert result['confidence'] == 50
+    
+    def test_parse_result_no_json(self):
+        """Test unparseable responses return None"""
+        assert parse_result("I can't help with that", ENTRIES[0]) is None
+    
+    def test_parse_batch_result_by_id(self):
+        """Test batch results are matched by id"""
+        text = ('[{"id": "b2", "summary": "Model.", "category": "Other", "confidence": 80},'
+                ' {"id": "a1", "summary": "SDK.", "category": "Agentic AI", "confidence": 90}]')
+        results = parse_batch_result(text, ENTRIES)
+        assert results['a1']['summary'] == 'SDK.'
+        assert results['b2']['category'] == 'Other'
+    
+    def test_parse_batch_result_missing_entry(self):
+        """Test entries missing from the array are left out for retry"""
+        text = '[{"id": "a1", "summary": "SDK.", "category": "Agentic AI", "confidence": 90}]'
+        assert list(parse_batch_result(text, ENTRIES)) == ['a1']
+    
+    def test_batch_prompt_lists_every_entry(self):
+        """Test the batch prompt includes each entry id"""
+        prompt = build_batch_prompt(ENTRIES)
+        assert 'ID: a1' in prompt and 'ID: b2' in prompt
+    
+    def test_rate_limit_detection(self):
+        """Test rate-limit errors are recognized"""
+        assert is_rate_limit_error(Exception("HTTP 429 Too Many Requests"))
+        assert not is_rate_limit_error(Exception("connection reset"))
+
+
+class TestCheckpoint:
+    """Test Checkpoint class"""
+    
+    def test_record_and_load(self, tmp_path):
+        """Test recorded results survive a restart"""
+        checkpoint = Checkpoint(str(tmp_path / "cp.jsonl"))
+        checkpoint.record(dict(ENTRIES[0], contentHash='h1'), {'summary': 'S', 'category': 'Other', 'confidence': 80})
+        checkpoint.close()
+        
+        completed = Checkpoint(str(tmp_path / "cp.jsonl")).load()
+        assert completed['a1']['contentHash'] == 'h1'
+        assert completed['a1']['result']['summary'] == 'S'
+    
+    def test_torn_line_is_ignored(self, tmp_path):
+        """Test a partially written final line does not break loading"""
+        path = tmp_path / "cp.jsonl"
+        path.write_text('{"id": "a1", "contentHash": null, "result": {}}\n{"id": "b2", "res')
+        assert list(Checkpoint(str(path)).load()) == ['a1']
+    
+    def test_clear(self, tmp_path):
+        """Test clearing removes the checkpoint file"""
+        checkpoint = Checkpoint(str(tmp_path / "cp.jsonl"))
+        checkpoint.record(ENTRIES[0], {})
+        checkpoint.clear()
+        assert not (tmp_path / "cp.jsonl").exists()
@@ -0,0 +1,112 @@
+"""
+Unit tests for streaming entry files
+"""
+
+import json
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import entry_io
+from entry_io import atomic_write_bytes, iter_entries, write_entries
+
+
+ENTRIES = [
+    {'id': 'a', 'title': 'Agents é "quoted"', 'tags': [], 'summary': None, 'confidence': 85},
+    {'id': 'b', 'title': 'Line\nbreak', 'tags': ['x', 'y'], 'nested': {'k': [1, {}]}},
+]
+METADATA = {'last_updated': '2026-01-31T15:14:03Z'}
+
+
+class TestWriteEntries:
+    """Test write_entries function"""
+
+    @pytest.mark.parametrize("entries", [ENTRIES, []])
+    def test_matches_json_dump(self, tmp_path, entries):
+        """Test output is byte-identical to json.dump with indent=2"""
+        path = tmp_path / 'entries.json'
+        count = write_entries(path, iter(entries), METADATA)
+
+        expected = json.dumps({**METADATA, 'entries': entries}, indent=2, ensure_ascii=False)
+        assert path.read_text(encoding='utf-8') == expected
+        assert count == len(entries)
+
+    def test_jsonl(self, tmp_path):
+        """Test .jsonl files get one entry per line"""
+        path = tmp_path / 'entries.jsonl'
+        write_entries(path, ENTRIES)
+        lines = path.read_text(encoding='utf-8').splitlines()
+        assert [json.loads(line) for line in lines] == ENTRIES
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        """Test a crash mid-write leaves the old file and no temporary file"""
+        path = tmp_path / 'entries.json'
+        write_entries(path, ENTRIES, METADATA)
+        before = path.read_bytes()
+
+        def failing_entries():
+            yield ENTRIES[0]
+            raise RuntimeError("crawler crashed")
+
+        with pytest.raises(RuntimeError):
+            write_entries(path, failing_entries(), METADATA)
+
+        assert path.read_bytes() == before
+        assert [p.name for p in tmp_path.iterdir()] == ['entries.json']
+
+    def test_atomic_write_bytes(self, tmp_path):
+        path = tmp_path / 'sub' / 'file.bin'
+        atomic_write_bytes(path, b'payload')
+        assert path.read_bytes() == b'payload'
+
+
+class TestIterEntries:
+    """Test iter_entries function"""
+
+    def test_round_trip_with_metadata(self, tmp_path):
+        """Test entries and top-level keys are read back"""
+        path = tmp_path / 'entries.json'
+        write_entries(path, ENTRIES, METADATA)
+        metadata = {}
+        assert list(iter_entries(path, metadata)) == ENTRIES
+        assert metadata == METADATA
+
+    def test_small_chunks(self, tmp_path):
+        """Test values split across read chunks, including numbers"""
+        path = tmp_path / 'entries.json'
+        path.write_text(json.dumps({'count': 123456789, 'entries': ENTRIES, 'after': 1.5}), encoding='utf-8')
+        metadata = {}
+        with patch.object(entry_io, 'CHUNK_SIZE', 3):
+            assert list(iter_entries(path, metadata)) == ENTRIES
+        assert metadata == {'count': 123456789, 'after': 1.5}
+
+    def test_is_lazy(self, tmp_path):
+        """Test entries are yielded before the rest of the file is read"""
+        path = tmp_path / 'entries.json'
+        path.write_text('{"entries": [{"id": "a"}, {"id": "b"}, broken', encoding='utf-8')
+        entries = iter_entries(path)
+        assert next(entries) == {'id': 'a'}
+        assert next(entries) == {'id': 'b'}
+        with pytest.raises(ValueError):
+            next(entries)
+
+    def test_bare_array(self, tmp_path):
+        path = tmp_path / 'entries.json'
+        path.write_text(json.dumps(ENTRIES), encoding='utf-8')
+        assert list(iter_entries(path)) == ENTRIES
+
+    def test_jsonl(self, tmp_path):
+        path = tmp_path / 'entries.jsonl'
+        path.write_text('\n'.join(json.dumps(e) for e in ENTRIES) + '\n\n', encoding='utf-8')
+        assert list(iter_entries(path)) == ENTRIES
+
+    def test_truncated_file(self, tmp_path):
+        """Test half-written files are rejected"""
+        path = tmp_path / 'entries.json'
+        path.write_text('{"last_updated": "x", "entries": [{"id": "a"}', encoding='utf-8')
+        with pytest.raises(ValueError):
+            list(iter_entries(path))
@@ -0,0 +1,202 @@
+"""
+Unit tests for the SQLite entry store
+"""
+
+import json
+import sqlite3
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import Mock, patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from crawler import Crawler
+from entry_store import EntryStore, SCHEMA_VERSION, open_store
+
+
+def make_entry(n, date='2024-01-01', **fields):
+    entry = {'id': f"id-{n}", 'title': f"Entry {n}", 'source': 'Test Source',
+             'url': f"https://example.com/{n}", 'date': date, 'content': f"Body {n}."}
+    entry.update(fields)
+    return entry
+
+
+class TestEntryStore:
+    """Test EntryStore class"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create store in a temporary directory"""
+        store = EntryStore(str(tmp_path / "entries.sqlite"))
+        yield store
+        store.close()
+
+    def test_upsert_and_get(self, store):
+        """Test entries are inserted and replaced by id"""
+        store.upsert([make_entry(1), make_entry(2)])
+        store.upsert([make_entry(1, title='Renamed')])
+
+        assert len(store) == 2
+        assert 'id-1' in store
+        assert 'id-3' not in store
+        assert store.get('id-1')['title'] == 'Renamed'
+        assert store.get('id-3') is None
+
+    def test_iter_entries_newest_first_with_filters(self, store):
+        """Test queries are ordered by date, undated last, and filtered"""
+        store.upsert([
+            make_entry(1, '2024-01-01', category='Other'),
+            make_entry(2, None),
+            make_entry(3, '2024-03-01', source='Other Source', category='Agentic AI'),
+            make_entry(4, '2024-02-01', category='Agentic AI'),
+        ])
+
+        assert [e['id'] for e in store.iter_entries()] == ['id-3', 'id-4', 'id-1', 'id-2']
+        assert [e['id'] for e in store.iter_entries(source='Test Source')] == ['id-4', 'id-1', 'id-2']
+        assert [e['id'] for e in store.iter_entries(category='Agentic AI')] == ['id-3', 'id-4']
+        assert [e['id'] for e in store.iter_entries(since='2024-02-01')] == ['id-3', 'id-4']
+
+    def test_diff_finds_new_and_changed_entries(self, store):
+        """Test only new and changed entries are returned, without writing them"""
+        store.upsert([
+            make_entry(1, summary='Enriched.', categoryConfidence=90),
+            make_entry(2, summary='Enriched.', categoryConfidence=90),
+        ])
+        crawled = [make_entry(1), make_entry(2, content='Edited.'), make_entry(3)]
+
+        fresh = store.diff(crawled)
+
+        assert [e['id'] for e in fresh] == ['id-2', 'id-3']
+        assert store.get('id-2')['summary'] == 'Enriched.'
+        assert 'id-3' not in store
+        # Until they are upserted, an interrupted run finds them again
+        assert [e['id'] for e in store.diff(crawled)] == ['id-2', 'id-3']
+
+    def test_needing_processing(self, store, tmp_path):
+        """Test unscored, low-confidence and merged-in changed entries are selected"""
+        store.upsert([
+            make_entry(1, categoryConfidence=90),
+            make_entry(2, categoryConfidence=50),
+            make_entry(3),
+            make_entry(4, categoryConfidence=''),
+            make_entry(5, categoryConfidence=90),
+        ])
+        raw = tmp_path / "raw.json"
+        raw.write_text(json.dumps({'entries': [make_entry(1), make_entry(5, content='Edited.')]}))
+
+        assert store.merge_json(raw) == 1
+        assert store.get('id-1')['categoryConfidence'] == 90
+
+        assert sorted(e['id'] for e in store.needing_processing()) == ['id-2', 'id-3', 'id-4', 'id-5']
+        assert sorted(e['id'] for e in store.needing_processing(min_confidence=40)) == ['id-3', 'id-4', 'id-5']
+
+    def test_import_and_export_json(self, store, tmp_path):
+        """Test entries.json round-trips through the store"""
+        source = tmp_path / "entries.json"
+        entries = [make_entry(2, '2024-02-01'), make_entry(1, '2024-01-01')]
+        source.write_text(json.dumps({'last_updated': 'then', 'entries': entries}))
+
+        assert store.import_json(source) == 2
+        assert store.export_json(tmp_path / "out.json", 'now') == 2
+
+        with open(tmp_path / "out.json") as f:
+            exported = json.load(f)
+        assert exported == {'last_updated': 'now', 'entries': entries}
+
+    def test_reopen_keeps_entries(self, tmp_path):
+        """Test entries persist across connections"""
+        path = tmp_path / "entries.sqlite"
+        store = EntryStore(str(path))
+        store.upsert([make_entry(1)])
+        store.close()
+
+        store = EntryStore(str(path))
+        assert store.get('id-1')['title'] == 'Entry 1'
+        store.close()
+
+    def test_newer_schema_is_refused(self, tmp_path):
+        """Test a store written by a newer version is not opened"""
+        path = tmp_path / "entries.sqlite"
+        conn = sqlite3.connect(str(path))
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+        conn.close()
+
+        with pytest.raises(ValueError):
+            EntryStore(str(path))
+
+    def test_open_store(self, tmp_path):
+        """Test the config section is honoured"""
+        assert open_store(None) is None
+        assert open_store({'enabled': False}) is None
+
+        store = open_store({'enabled': True, 'path': 'entries.sqlite'}, base_dir=tmp_path)
+        assert store.path == tmp_path / 'entries.sqlite'
+        store.close()
+
+
+class TestCrawlerWithEntryStore:
+    """Integration tests for crawler runs backed by the entry store"""
+
+    @pytest.fixture
+    def crawler(self, tmp_path):
+        """Create crawler with an entry store and a previous output file"""
+        config_path = tmp_path / "test_config.yaml"
+        output_path = tmp_path / "output.json"
+        config_path.write_text(f"""
+output:
+  path: "{output_path}"
+
+backfill:
+  enabled: false
+
+crawler:
+  delay_between_requests: 0
+  known_streak: 2
+
+entry_store:
+  enabled: true
+  path: "{tmp_path / 'entries.sqlite'}"
+
+sources:
+  - name: "Test Source"
+    url: "https://example.com"
+    rss_url: "https://example.com/feed"
+""")
+        crawler = Crawler(str(config_path))
+
+        previous = [
+            {'id': crawler._generate_id('https://example.com/1', 'First'), 'title': 'First',
+             'source': 'Test Source', 'url': 'https://example.com/1', 'date': '2024-01-01',
+             'content': 'First body.', 'summary': 'Enriched.', 'category': 'Other',
+             'categoryConfidence': 80, 'tags': []},
+        ]
+        output_path.write_text(json.dumps({'last_updated': '', 'entries': previous}))
+        crawler.summarizer = Mock()
+        crawler.summarizer.enrich.return_value = {
+            'summary': "New summary", 'category': "Other", 'confidence': 80
+        }
+        yield crawler
+        crawler.entry_store.close()
+
+    def test_run_merges_into_store_and_exports(self, crawler):
+        """Test the previous output is imported and new entries are merged"""
+        items = [
+            {'title': 'Second', 'url': 'https://example.com/2', 'date': '2024-02-01',
+             'content': 'Second body.'},
+            {'title': 'First', 'url': 'https://example.com/1', 'date': '2024-01-01',
+             'content': 'First body.'},
+        ]
+        with patch.object(crawler, '_fetch_rss', return_value=items):
+            result = crawler.run(incremental=True)
+
+        assert [e['title'] for e in result] == ['Second', 'First']
+        assert crawler.summarizer.enrich.call_count == 1
+        assert result[0]['summary'] == 'New summary'
+        assert result[1]['summary'] == 'Enriched.'
+        assert len(crawler.entry_store) == 2
+
+        with open(crawler.config['output']['path']) as f:
+            saved = json.load(f)['entries']
+        assert saved == result
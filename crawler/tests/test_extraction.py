@@ -0,0 +1,104 @@
+"""
+Unit tests for single-pass article content extraction
+"""
+
+import json
+import pytest
+from pathlib import Path
+import sys
+
+from bs4 import BeautifulSoup
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from extraction import ensure_sentence_end, extract_article_content
+from parsing import PARSER_BACKENDS, _is_available
+
+FIXTURE_DIR = Path(__file__).parent.parent
+# Output of the previous clone-and-decompose extraction on the fixture pages
+GOLDEN_PATH = Path(__file__).parent / 'fixtures' / 'extraction_golden.json'
+INSTALLED = [b for b in PARSER_BACKENDS if _is_available(b)]
+
+
+def extract(html: str) -> str:
+    return extract_article_content(BeautifulSoup(html, 'html.parser').find())
+
+
+class TestGoldenOutput:
+    """Test extraction is byte-identical to the previous implementation"""
+
+    @pytest.mark.parametrize("backend", INSTALLED)
+    def test_fixture_pages(self, backend):
+        """Test every recorded element of the fixture pages extracts unchanged"""
+        golden = json.loads(GOLDEN_PATH.read_text(encoding='utf-8'))
+        soups = {}
+        for record in golden:
+            if record['fixture'] not in soups:
+                html = (FIXTURE_DIR / record['fixture']).read_text(encoding='utf-8')
+                soups[record['fixture']] = BeautifulSoup(html, backend)
+            element = soups[record['fixture']].select(record['selector'])[record['index']]
+            assert extract_article_content(element) == record['content'], record
+
+
+class TestExtractArticleContent:
+    """Test extract_article_content function"""
+
+    def test_prefers_paragraphs(self):
+        """Test meaningful paragraphs are used and short ones skipped"""
+        html = '<div><h2>Title</h2><p>Tiny</p><p>Agents can now plan multi-step tasks.</p></div>'
+        assert extract(html) == 'Agents can now plan multi-step tasks.'
+
+    def test_removes_ui_chrome(self):
+        """Test UI tags, UI classes and UI text parents are dropped"""
+        html = ('<article><nav>Menu text that is long</nav>'
+                '<p class="ad">Sponsored text that is long enough</p>'
+                '<p>Tool use arrives in the public API today.</p>'
+                '<p>Click here to share this post with friends</p></article>')
+        assert extract(html) == 'Tool use arrives in the public API today.'
+
+    def test_first_matching_container_wins(self):
+        """Test an article container is preferred over stray paragraphs"""
+        html = ('<div><p>Paragraph outside of the article body.</p>'
+                '<article><p>Paragraph inside of the article body.</p></article></div>')
+        assert extract(html) == 'Paragraph inside of the article body.'
+
+    def test_falls_back_to_full_text(self):
+        """Test elements without paragraphs use their whole text"""
+        assert extract('<a href="/x"><span>Short</span> <b>card</b></a>') == 'Short card.'
+
+    def test_strips_month_and_ui_words(self):
+        """Test date stamps and UI words are removed from the final text"""
+        html = '<div><p><b>Product</b><i>September 2025 brings agent memory!</i></p></div>'
+        assert extract(html) == 'Product brings agent memory!'
+
+    def test_identical_ui_parents_removed_once(self):
+        """Test equal UI text parents keep the previous extraction's behavior"""
+        html = '<div><span>Share</span><em>Agents</em><span>Share</span></div>'
+        assert extract(html) == 'Agents Share.'
+
+    def test_does_not_modify_element(self):
+        """Test the source tree is left intact"""
+        soup = BeautifulSoup('<div><nav>Nav</nav><p>Read more about it</p></div>', 'html.parser')
+        before = str(soup)
+        extract_article_content(soup.div)
+        assert str(soup) == before
+
+    def test_empty_element(self):
+        """Test missing elements give empty content"""
+        assert extract_article_content(None) == ''
+        assert extract('<nav><p>Navigation only paragraph text</p></nav>') == ''
+
+
+class TestEnsureSentenceEnd:
+    """Test ensure_sentence_end function"""
+
+    def test_keeps_punctuation(self):
+        assert ensure_sentence_end('Done!') == 'Done!'
+
+    def test_cuts_to_last_sentence(self):
+        assert ensure_sentence_end('First sentence. Trailing fragment') == 'First sentence.'
+
+    def test_appends_period(self):
+        assert ensure_sentence_end('No punctuation') == 'No punctuation.'
+        assert ensure_sentence_end('') == ''
@@ -0,0 +1,147 @@
+"""
+Unit tests for the record/replay fetch archive
+"""
+
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import Mock, patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from crawler import Crawler
+from fetch_archive import FetchArchive, open_archive
+
+
+LISTING_HTML = """
+<html><body>
+  <article><h2>First Post</h2><time datetime="2024-05-01">May 1</time>
+    <a href="/first">Link</a><p>This is the first post body with enough text.</p></article>
+  <article><h2>Second Post</h2><time datetime="2024-04-01">April 1</time>
+    <a href="/second">Link</a><p>This is the second post body with enough text.</p></article>
+</body></html>
+"""
+
+
+def make_response(status_code, text=''):
+    """Build a fake requests response"""
+    response = Mock()
+    response.status_code = status_code
+    response.text = text
+    response.headers = {}
+    response.raise_for_status = Mock()
+    return response
+
+
+class TestFetchArchive:
+    """Test FetchArchive class"""
+
+    def test_record_and_lookup(self, tmp_path):
+        """Test recorded bodies are served back by URL"""
+        archive = FetchArchive(str(tmp_path), 'record')
+        archive.record('https://example.com/a', 200, 'body a')
+        archive.record('https://example.com/b', 404, 'missing')
+
+        replay = FetchArchive(str(tmp_path), 'replay')
+        assert replay.lookup('https://example.com/a') == {'status': 200, 'body': 'body a'}
+        assert replay.lookup('https://example.com/b')['status'] == 404
+        assert replay.lookup('https://example.com/c') is None
+        assert (replay.hits, replay.misses) == (2, 1)
+
+    def test_bodies_are_content_addressed(self, tmp_path):
+        """Test identical bodies are stored once and the latest record wins"""
+        archive = FetchArchive(str(tmp_path), 'record')
+        archive.record('https://example.com/a', 200, 'same')
+        archive.record('https://example.com/b', 200, 'same')
+        archive.record('https://example.com/a', 200, 'newer')
+
+        assert len(list((tmp_path / 'bodies').iterdir())) == 2
+        assert FetchArchive(str(tmp_path), 'replay').lookup('https://example.com/a')['body'] == 'newer'
+
+    def test_replay_requires_recording(self, tmp_path):
+        """Test replaying an empty archive is refused"""
+        with pytest.raises(ValueError):
+            FetchArchive(str(tmp_path / 'missing'), 'replay')
+        with pytest.raises(ValueError):
+            FetchArchive(str(tmp_path), 'rewind')
+
+    def test_open_archive(self, tmp_path):
+        """Test the config section is honoured"""
+        assert open_archive(None) is None
+        assert open_archive({'mode': 'off'}) is None
+        assert open_archive({'mode': False}) is None
+
+        archive = open_archive({'mode': 'record', 'path': str(tmp_path / 'archive')})
+        assert archive.path == tmp_path / 'archive'
+        assert archive.recording
+
+
+class TestCrawlerRecordReplay:
+    """Test Crawler integration with the fetch archive"""
+
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        """Config with a throttle delay that replay must skip"""
+        config_path = tmp_path / "test_config.yaml"
+        config_path.write_text(f"""
+output:
+  path: "{tmp_path / 'output.json'}"
+
+backfill:
+  enabled: false
+
+crawler:
+  delay_between_requests: 5
+
+sources:
+  - name: "Test Source"
+    url: "https://example.com/blog"
+    selectors:
+      article_list: "article"
+      title: "h2"
+      date: "time"
+      link: "a"
+  - name: "Gone Source"
+    url: "https://example.com/gone"
+""")
+        return config_path
+
+    def test_replay_matches_recorded_crawl_without_network(self, config_path, tmp_path):
+        """Test a replayed crawl makes no requests, never sleeps and yields the same entries"""
+        archive_path = tmp_path / 'archive'
+        responses = {
+            'https://example.com/blog': make_response(200, LISTING_HTML),
+            'https://example.com/gone': make_response(404, 'Not found'),
+        }
+        responses['https://example.com/gone'].raise_for_status.side_effect = Exception("404")
+
+        recorder = Crawler(str(config_path))
+        recorder.use_archive(FetchArchive(str(archive_path), 'record'))
+        with patch.object(recorder.session, 'get', side_effect=lambda url, **kw: responses[url]), \
+             patch.object(recorder.throttle, 'wait', return_value=0.0):
+            recorded = recorder.crawl_all()
+
+        replayer = Crawler(str(config_path))
+        replayer.use_archive(FetchArchive(str(archive_path), 'replay'))
+        with patch.object(replayer.session, 'get') as mock_get, \
+             patch.object(replayer.throttle, 'wait') as mock_wait:
+            replayed = replayer.crawl_all()
+
+        assert [e['title'] for e in recorded] == ['First Post', 'Second Post']
+        assert replayed == recorded
+        mock_get.assert_not_called()
+        mock_wait.assert_not_called()
+        assert replayer.profile.counters['fetch_errors'] == 1
+
+    def test_replay_bypasses_http_cache(self, config_path, tmp_path):
+        """Test the HTTP cache is not consulted or written while replaying"""
+        archive = FetchArchive(str(tmp_path / 'archive'), 'record')
+        archive.record('https://example.com/blog', 200, LISTING_HTML)
+
+        crawler = Crawler(str(config_path))
+        crawler.http_cache = Mock()
+        crawler.use_archive(FetchArchive(str(tmp_path / 'archive'), 'replay'))
+
+        assert crawler.http_cache is None
+        assert crawler._fetch_text('https://example.com/blog') == (LISTING_HTML, False)
@@ -0,0 +1,143 @@
+"""
+Unit tests for the conditional HTTP cache
+"""
+
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import Mock, patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from crawler import Crawler
+from http_cache import HttpCache
+from source_adapters import source_type
+
+
+LISTING_HTML = """
+<html><body>
+  <article><h2>First Post</h2><time datetime="2024-05-01">May 1</time>
+    <a href="/first">Link</a><p>This is the first post body with enough text.</p></article>
+  <article><h2>Second Post</h2><time datetime="2024-04-01">April 1</time>
+    <a href="/second">Link</a><p>This is the second post body with enough text.</p></article>
+</body></html>
+"""
+
+
+def make_response(status_code, text='', headers=None):
+    """Build a fake requests response"""
+    response = Mock()
+    response.status_code = status_code
+    response.text = text
+    response.headers = headers or {}
+    response.raise_for_status = Mock()
+    return response
+
+
+class TestHttpCache:
+    """Test HttpCache class"""
+    
+    def test_conditional_headers(self, tmp_path):
+        """Test validators are turned into conditional request headers"""
+        cache = HttpCache(str(tmp_path))
+        cache.store("https://example.com", etag='"abc"', last_modified="Wed, 01 May 2024 00:00:00 GMT", body="x")
+        headers = cache.conditional_headers(cache.get("https://example.com"))
+        assert headers == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': "Wed, 01 May 2024 00:00:00 GMT"
+        }
+    
+    def test_no_validators_not_stored(self, tmp_path):
+        """Test responses without validators are counted but not stored"""
+        cache = HttpCache(str(tmp_path))
+        cache.store("https://example.com", etag=None, last_modified=None, body="x")
+        assert cache.get("https://example.com") is None
+        assert cache.misses == 1
+    
+    def test_store_result(self, tmp_path):
+        """Test parsed results are attached to the cached body"""
+        cache = HttpCache(str(tmp_path))
+        cache.store("https://example.com", etag='"abc"', last_modified=None, body="x")
+        cache.store_result("https://example.com", "key", [{'title': 'A'}])
+        assert cache.get_result("https://example.com", "key") == [{'title': 'A'}]
+        assert cache.get_result("https://example.com", "other") is None
+
+
+class TestCrawlerConditionalFetch:
+    """Test Crawler integration with the HTTP cache"""
+    
+    @pytest.fixture
+    def crawler(self, tmp_path):
+        """Create crawler instance with the cache enabled"""
+        config_path = tmp_path / "test_config.yaml"
+        config_path.write_text(f"""
+output:
+  path: "{tmp_path / 'output.json'}"
+
+backfill:
+  enabled: false
+
+crawler:
+  delay_between_requests: 0
+
+http_cache:
+  enabled: true
+  path: "{tmp_path / 'cache'}"
+
+sources:
+  - name: "Test Source"
+    url: "https://example.com/blog"
+    selectors:
+      article_list: "article"
+      title: "h2"
+      date: "time"
+      link: "a"
+""")
+        return Crawler(str(config_path))
+    
+    def test_not_modified_reuses_entries_without_parsing(self, crawler):
+        """Test a 304 response skips parsing and returns cached entries"""
+        source = crawler.config['sources'][0]
+        first = make_response(200, LISTING_HTML, {'ETag': '"v1"'})
+        with patch.object(crawler.session, 'get', return_value=first):
+            fresh_entries = crawler.crawl_source(source)
+        
+        with patch.object(crawler.session, 'get', return_value=make_response(304)) as mock_get, \
+             patch('html_adapter.BeautifulSoup') as mock_soup:
+            cached_entries = crawler.crawl_source(source)
+        
+        assert mock_get.call_args.kwargs['headers']['If-None-Match'] == '"v1"'
+        mock_soup.assert_not_called()
+        assert cached_entries == fresh_entries
+        assert len(cached_entries) == 2
+        assert crawler.http_cache.hits == 1
+        assert crawler.http_cache.misses == 1
+    
+    def test_extraction_version_change_reparses_cached_page(self, crawler):
+        """Test a 304 response is reparsed when cached entries came from older extraction code"""
+        source = crawler.config['sources'][0]
+        with patch.object(crawler.session, 'get', return_value=make_response(200, LISTING_HTML, {'ETag': '"v1"'})):
+            fresh_entries = crawler.crawl_source(source)
+        
+        with patch.object(crawler.session, 'get', return_value=make_response(304)), \
+             patch('html_adapter.HTML_RESULT_KEY', 'html-v0'), \
+             patch.object(crawler._adapter(source_type(source)), 'scrape_page',
+                          wraps=crawler._adapter(source_type(source)).scrape_page) as mock_scrape:
+            entries = crawler.crawl_source(source)
+        
+        mock_scrape.assert_called_once()
+        assert entries == fresh_entries
+    
+    def test_changed_page_is_reparsed(self, crawler):
+        """Test a 200 response replaces the cached body"""
+        source = crawler.config['sources'][0]
+        with patch.object(crawler.session, 'get', return_value=make_response(200, LISTING_HTML, {'ETag': '"v1"'})):
+            crawler.crawl_source(source)
+        
+        changed_html = LISTING_HTML.replace("Second Post", "Renamed Post")
+        with patch.object(crawler.session, 'get', return_value=make_response(200, changed_html, {'ETag': '"v2"'})):
+            entries = crawler.crawl_source(source)
+        
+        assert [e['title'] for e in entries] == ['First Post', 'Renamed Post']
+        assert crawler.http_cache.get(source['url'])['etag'] == '"v2"'
@@ -0,0 +1,126 @@
+"""
+Unit tests for the pooled, timed fetch layer
+"""
+
+import pytest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from crawler import BoundedRetry, Crawler
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serve a small page; /flaky fails once before succeeding"""
+    protocol_version = 'HTTP/1.1'
+    flaky_calls = 0
+    
+    def do_GET(self):
+        if self.path == '/flaky' and Handler.flaky_calls == 0:
+            Handler.flaky_calls += 1
+            self._reply(503, b'busy')
+            return
+        if self.path == '/slow-down' and Handler.flaky_calls == 1:
+            Handler.flaky_calls += 1
+            self.send_response(503)
+            self.send_header('Retry-After', '3600')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if self.path == '/forbidden':
+            self._reply(403, b'no')
+            return
+        self._reply(200, b'<html><body><p>hello</p></body></html>')
+    
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Run a local HTTP server for the duration of a test"""
+    Handler.flaky_calls = 0
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def crawler(tmp_path):
+    """Create crawler instance with fast retries"""
+    config_path = tmp_path / "test_config.yaml"
+    config_path.write_text("""
+output:
+  path: "test_output.json"
+
+crawler:
+  delay_between_requests: 0
+  max_retries: 2
+  backoff_factor: 0
+  pool_maxsize: 2
+
+sources: []
+""")
+    return Crawler(str(config_path))
+
+
+class TestTimedFetch:
+    """Test requests go through the pooled session with timing"""
+    
+    def test_connection_is_reused(self, crawler, server):
+        """Test keep-alive reuses one connection for the same host"""
+        crawler._fetch_text(f"{server}/a")
+        crawler._fetch_text(f"{server}/b")
+        
+        first, second = crawler.adapter.timings
+        assert first['reused_connection'] is False
+        assert second['reused_connection'] is True
+        assert second['connect'] == 0
+    
+    def test_timing_fields(self, crawler, server):
+        """Test each request records its phase timings"""
+        text, _ = crawler._fetch_text(f"{server}/page")
+        timing = crawler.adapter.timings[0]
+        
+        assert 'hello' in text
+        assert timing['status'] == 200
+        for key in ('connect', 'tls', 'ttfb', 'download', 'total'):
+            assert timing[key] >= 0
+        assert "1 requests" in crawler.adapter.summary()
+    
+    def test_retry_policy(self, crawler, server):
+        """Test retryable statuses are retried by the session"""
+        text, _ = crawler._fetch_text(f"{server}/flaky")
+        assert text is not None
+        assert crawler.adapter.timings[0]['retries'] == 1
+    
+    def test_retries_are_bounded(self, crawler, server):
+        """Test a persistent 403 gives up after max_retries"""
+        text, _ = crawler._fetch_text(f"{server}/forbidden")
+        assert text is None
+        assert crawler.adapter.timings[0]['retries'] == 2
+    
+    def test_retry_after_is_capped(self, crawler, server):
+        """Test a long Retry-After waits no longer than backoff_max"""
+        crawler.session.get_adapter(server).max_retries.backoff_max = 0.01
+        Handler.flaky_calls = 1
+        started = time.monotonic()
+        text, _ = crawler._fetch_text(f"{server}/slow-down")
+        assert text is not None
+        assert time.monotonic() - started < 5
+        assert isinstance(crawler.adapter.max_retries, BoundedRetry)
@@ -154,6 +154,35 @@ categories:
         assert result[0]['id'] == 'new123'
         assert result[1]['id'] == 'old123'
     
+    def test_crawl_all_concurrent_matches_sequential(self, test_config):
+        """Test concurrent crawling produces the same output as sequential"""
+        config_path, _ = test_config
+        crawler = Crawler(config_path)
+        crawler.config['sources'] = [
+            {'name': 'Source A', 'url': 'https://a.example.com'},
+            {'name': 'Source B', 'url': 'https://b.example.com'},
+            {'name': 'Source C', 'url': 'https://c.example.com'},
+        ]
+        
+        def fake_crawl_source(source):
+            # Every source reports a shared duplicate plus its own entry
+            return [
+                {'id': 'shared', 'title': 'Shared', 'source': source['name'],
+                 'url': 'https://example.com/shared', 'date': '2024-03-01'},
+                {'id': source['name'], 'title': source['name'], 'source': source['name'],
+                 'url': source['url'], 'date': '2024-02-15'},
+            ]
+        
+        with patch.object(crawler, 'crawl_source', side_effect=fake_crawl_source):
+            crawler.config['crawler'] = {'max_workers': 1}
+            sequential = crawler.crawl_all()
+            crawler.config['crawler'] = {'max_workers': 3}
+            concurrent = crawler.crawl_all()
+        
+        assert concurrent == sequential
+        assert [e['id'] for e in concurrent].count('shared') == 1
+        assert next(e for e in concurrent if e['id'] == 'shared')['source'] == 'Source A'
+    
     @patch('crawler.Summarizer')
     def test_generate_summaries(self, mock_summarizer_class, test_config):
         """Test summary generation for entries"""
@@ -186,3 +215,134 @@ categories:
         
         # Verify summary was added
         assert result[0]['summary'] == "Generated summary"
+    
+    def test_generate_summaries_single_call(self, test_config):
+        """Test entries needing summary and category use one enrich call"""
+        config_path, _ = test_config
+        crawler = Crawler(config_path)
+        
+        mock_summarizer = Mock()
+        mock_summarizer.enrich.return_value = {
+            'summary': "Generated summary", 'category': "Agentic AI", 'confidence': 88
+        }
+        crawler.summarizer = mock_summarizer
+        
+        entries = [
+            {
+                'id': 'test123',
+                'title': 'Test Article',
+                'source': 'Test Source',
+                'url': 'https://example.com/article',
+                'date': '2024-01-15',
+                'content': 'Article content here',
+                'summary': None,
+                'category': '',
+                'tags': []
+            }
+        ]
+        
+        result = crawler.generate_summaries(entries)
+        
+        mock_summarizer.enrich.assert_called_once()
+        mock_summarizer.summarize.assert_not_called()
+        mock_summarizer.categorize.assert_not_called()
+        assert result[0]['category'] == "Agentic AI"
+        assert result[0]['categoryConfidence'] == 88
+
+
+class TestIncrementalCrawl:
+    """Integration tests for incremental crawl mode"""
+    
+    @pytest.fixture
+    def crawler(self, tmp_path):
+        """Create crawler with a previous output file"""
+        config_path = tmp_path / "test_config.yaml"
+        output_path = tmp_path / "output.json"
+        config_path.write_text(f"""
+output:
+  path: "{output_path}"
+
+backfill:
+  enabled: false
+
+crawler:
+  delay_between_requests: 0
+  known_streak: 2
+
+sources:
+  - name: "Test Source"
+    url: "https://example.com"
+    rss_url: "https://example.com/feed"
+""")
+        crawler = Crawler(str(config_path))
+        
+        previous = [
+            {'id': crawler._generate_id('https://example.com/2', 'Second'), 'title': 'Second',
+             'source': 'Test Source', 'url': 'https://example.com/2', 'date': '2024-02-01',
+             'content': 'Second body.', 'summary': 'Enriched.', 'category': 'Agentic AI',
+             'categoryConfidence': 90, 'tags': []},
+            {'id': crawler._generate_id('https://example.com/1', 'First'), 'title': 'First',
+             'source': 'Test Source', 'url': 'https://example.com/1', 'date': '2024-01-01',
+             'content': 'First body.', 'summary': 'Enriched.', 'category': 'Other',
+             'categoryConfidence': 80, 'tags': []},
+        ]
+        output_path.write_text(json.dumps({'last_updated': '', 'entries': previous}))
+        crawler.summarizer = Mock()
+        crawler.summarizer.enrich.return_value = {
+            'summary': "New summary", 'category': "Other", 'confidence': 80
+        }
+        return crawler
+    
+    def feed(self, *items):
+        """Build _fetch_rss output newest first"""
+        return [
+            {'title': title, 'url': f"https://example.com/{n}", 'date': date, 'content': content}
+            for n, title, date, content in items
+        ]
+    
+    def test_merges_new_entries_and_keeps_enrichment(self, crawler):
+        """Test only new entries are processed and old enrichment is kept"""
+        items = self.feed(
+            (3, 'Third', '2024-03-01', 'Third body.'),
+            (2, 'Second', '2024-02-01', 'Second body.'),
+            (1, 'First', '2024-01-01', 'First body.'),
+        )
+        with patch.object(crawler, '_fetch_rss', return_value=items):
+            result = crawler.run(incremental=True)
+        
+        assert [e['title'] for e in result] == ['Third', 'Second', 'First']
+        assert crawler.summarizer.enrich.call_count == 1
+        assert result[0]['summary'] == 'New summary'
+        assert result[1]['categoryConfidence'] == 90
+        
+        with open(crawler.config['output']['path']) as f:
+            saved = json.load(f)['entries']
+        assert [e['title'] for e in saved] == ['Third', 'Second', 'First']
+    
+    def test_changed_entries_are_reprocessed(self, crawler):
+        """Test an edited entry is re-summarized"""
+        items = self.feed(
+            (2, 'Second', '2024-02-01', 'Second body, now edited.'),
+            (1, 'First', '2024-01-01', 'First body.'),
+        )
+        with patch.object(crawler, '_fetch_rss', return_value=items):
+            result = crawler.run(incremental=True)
+        
+        assert crawler.summarizer.enrich.call_count == 1
+        assert result[0]['content'] == 'Second body, now edited.'
+        assert result[0]['summary'] == 'New summary'
+        assert result[1]['summary'] == 'Enriched.'
+    
+    def test_stops_at_known_entries(self, crawler):
+        """Test a source stops once it reaches a streak of known entries"""
+        items = self.feed(
+            (3, 'Third', '2024-03-01', 'Third body.'),
+            (2, 'Second', '2024-02-01', 'Second body.'),
+            (1, 'First', '2024-01-01', 'First body.'),
+            (0, 'Zeroth', '2023-12-01', 'Never reached.'),
+        )
+        crawler.known_entries = {e['id']: e for e in crawler.load_previous_entries()}
+        with patch.object(crawler, '_fetch_rss', return_value=items):
+            entries = crawler.crawl_source(crawler.config['sources'][0])
+        
+        assert [e['title'] for e in entries] == ['Third', 'Second']
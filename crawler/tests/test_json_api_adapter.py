@@ -0,0 +1,126 @@
+"""
+Unit tests for JSON API sources
+"""
+
+import json
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from crawler import Crawler
+from json_api_adapter import field_value, iter_json_items
+
+
+POSTS = [
+    {'title': {'rendered': 'Agents &#8217; new planner'}, 'link': '/blog/planner',
+     'date': '2024-05-01T09:00:00', 'excerpt': {'rendered': '<p>Agents now plan tasks. Continue reading</p>'}},
+    {'title': {'rendered': 'Older post'}, 'link': 'https://example.com/blog/older',
+     'date': '2023-06-01T09:00:00', 'excerpt': {'rendered': '<p>Old news.</p>'}},
+]
+
+
+@pytest.fixture
+def crawler(tmp_path):
+    """Create crawler with a paginated JSON API source"""
+    config_path = tmp_path / "test_config.yaml"
+    config_path.write_text(f"""
+output:
+  path: "{tmp_path / 'output.json'}"
+
+backfill:
+  enabled: true
+  start_date: "2024-01-01"
+
+crawler:
+  delay_between_requests: 0
+
+sources:
+  - name: "Example API"
+    type: "json-api"
+    url: "https://example.com/blog/"
+    api_url: "https://example.com/api/posts"
+    json:
+      items: "data.posts"
+      fields:
+        title: "title.rendered"
+        url: "link"
+        content: "excerpt.rendered"
+    pagination:
+      url_template: "https://example.com/api/posts?page={{page}}"
+""")
+    return Crawler(str(config_path))
+
+
+class TestIterJsonItems:
+    """Test iter_json_items function"""
+
+    def test_top_level_array(self):
+        """Test items of a top-level array are decoded in order"""
+        assert list(iter_json_items(' [1, {"a": [2]} ,"x"] ')) == [1, {'a': [2]}, 'x']
+        assert list(iter_json_items('[]')) == []
+
+    def test_nested_path(self):
+        """Test keys before the path are skipped and missing paths yield nothing"""
+        text = json.dumps({'meta': {'items': ['skip']}, 'data': {'total': 2, 'posts': [{'id': 1}, {'id': 2}]}})
+        assert list(iter_json_items(text, 'data.posts')) == [{'id': 1}, {'id': 2}]
+        assert list(iter_json_items(text, 'data.missing')) == []
+        assert list(iter_json_items('{}', 'posts')) == []
+
+    def test_items_are_decoded_lazily(self):
+        """Test items after the ones consumed are never decoded"""
+        items = iter_json_items('[{"id": 1}, {"id": 2}, not json')
+        assert next(items) == {'id': 1}
+        assert next(items) == {'id': 2}
+        with pytest.raises(ValueError):
+            next(items)
+
+    def test_not_an_array(self):
+        """Test a path to a non-array value is rejected"""
+        with pytest.raises(ValueError):
+            list(iter_json_items('{"posts": {"id": 1}}', 'posts'))
+
+    def test_field_value(self):
+        """Test dotted paths into decoded items"""
+        assert field_value(POSTS[0], 'title.rendered') == 'Agents &#8217; new planner'
+        assert field_value(POSTS[0], 'title.missing') is None
+        assert field_value(POSTS[0], 'link.deeper') is None
+
+
+class TestJsonApiAdapter:
+    """Test crawling JSON API sources"""
+
+    def test_crawl_maps_fields_and_stops_at_cutoff(self, crawler):
+        """Test items are mapped and cleaned, and pages end at the backfill cutoff"""
+        pages = {'https://example.com/api/posts': json.dumps({'data': {'posts': POSTS}})}
+        with patch.object(crawler, '_fetch_text', side_effect=lambda url: (pages.get(url), False)) as mock_fetch:
+            entries = crawler.crawl_source(crawler.config['sources'][0])
+
+        assert len(entries) == 1
+        assert entries[0]['title'] == 'Agents ’ new planner'
+        assert entries[0]['url'] == 'https://example.com/blog/planner'
+        assert entries[0]['date'] == '2024-05-01'
+        assert entries[0]['content'] == 'Agents now plan tasks.'
+        assert mock_fetch.call_count == 1
+
+    def test_follows_pages_until_empty(self, crawler):
+        """Test the url_template is followed until a page has no items"""
+        recent = [{**POSTS[0], 'link': f"/blog/post-{n}"} for n in range(2)]
+        pages = {
+            'https://example.com/api/posts': json.dumps({'data': {'posts': recent[:1]}}),
+            'https://example.com/api/posts?page=2': json.dumps({'data': {'posts': recent[1:]}}),
+            'https://example.com/api/posts?page=3': json.dumps({'data': {'posts': []}}),
+        }
+        with patch.object(crawler, '_fetch_text', side_effect=lambda url: (pages.get(url), False)) as mock_fetch:
+            entries = crawler.crawl_source(crawler.config['sources'][0])
+
+        assert [e['url'] for e in entries] == ['https://example.com/blog/post-0', 'https://example.com/blog/post-1']
+        assert mock_fetch.call_count == 3
+
+    def test_malformed_response(self, crawler):
+        """Test a malformed response yields no entries"""
+        with patch.object(crawler, '_fetch_text', return_value=('{"data": {"posts": [', False)):
+            assert crawler.crawl_source(crawler.config['sources'][0]) == []
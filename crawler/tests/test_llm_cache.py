@@ -0,0 +1,122 @@
+"""
+Unit tests for the persistent LLM result cache
+"""
+
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import Mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from llm_cache import LLMCache, open_cache
+from summarizer import Summarizer
+
+
+class TestLLMCache:
+    """Test LLMCache class"""
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create cache in a temporary directory"""
+        cache = LLMCache(str(tmp_path / "cache.sqlite"))
+        yield cache
+        cache.close()
+    
+    def test_key_depends_on_all_inputs(self):
+        """Test model, template version, prompt and params all change the key"""
+        base = LLMCache.make_key('m', 'summarize', 1, 'prompt', max_tokens=10)
+        assert base == LLMCache.make_key('m', 'summarize', 1, 'prompt', max_tokens=10)
+        assert base != LLMCache.make_key('other', 'summarize', 1, 'prompt', max_tokens=10)
+        assert base != LLMCache.make_key('m', 'summarize', 2, 'prompt', max_tokens=10)
+        assert base != LLMCache.make_key('m', 'summarize', 1, 'prompt!', max_tokens=10)
+        assert base != LLMCache.make_key('m', 'summarize', 1, 'prompt', max_tokens=20)
+    
+    def test_get_and_set(self, cache):
+        """Test values round-trip and hits/misses are counted"""
+        assert cache.get('k') is None
+        cache.set('k', {'summary': 'S'})
+        assert cache.get('k') == {'summary': 'S'}
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert '50.0% hit rate' in cache.stats()
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Test results survive reopening the cache"""
+        first = LLMCache(str(tmp_path / "cache.sqlite"))
+        first.set('k', 'value')
+        first.close()
+        second = LLMCache(str(tmp_path / "cache.sqlite"))
+        assert second.get('k') == 'value'
+        second.close()
+    
+    def test_ttl_expiry(self, tmp_path):
+        """Test expired results are treated as misses"""
+        cache = LLMCache(str(tmp_path / "cache.sqlite"), ttl_days=-1)
+        cache.set('k', 'value')
+        assert cache.get('k') is None
+        cache.close()
+    
+    def test_lru_eviction(self, tmp_path):
+        """Test least recently used results are evicted beyond max_entries"""
+        cache = LLMCache(str(tmp_path / "cache.sqlite"), max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')  # 'b' is now least recently used
+        cache.set('c', 3)
+        cache._evict()
+        assert cache.get('b') is None
+        assert cache.get('a') == 1 and cache.get('c') == 3
+        cache.close()
+    
+    def test_open_cache_disabled(self):
+        """Test no cache is created unless enabled"""
+        assert open_cache(None) is None
+        assert open_cache({'enabled': False}) is None
+    
+    def test_open_cache_from_config(self, tmp_path):
+        """Test the config section's limits and relative path are honoured"""
+        cache = open_cache({'enabled': True, 'path': 'cache.sqlite', 'max_entries': 5, 'ttl_days': 1},
+                           base_dir=tmp_path)
+        assert cache.path == tmp_path / 'cache.sqlite'
+        assert cache.max_entries == 5
+        cache.close()
+
+
+class TestSummarizerCache:
+    """Test Summarizer reuses cached completions"""
+    
+    def test_repeat_calls_hit_cache(self, tmp_path):
+        """Test identical inputs call the SDK only once"""
+        cache = LLMCache(str(tmp_path / "cache.sqlite"))
+        summarizer = Summarizer(cache=cache)
+        summarizer.client = Mock()
+        summarizer.client.complete.return_value = "A short summary."
+        
+        first = summarizer.summarize("Title", "Some content.", "Source")
+        second = summarizer.summarize("Title", "Some content.", "Source")
+        
+        assert first == second == "A short summary."
+        summarizer.client.complete.assert_called_once()
+        assert cache.hits == 1
+        cache.close()
+    
+    def test_unparseable_enrichment_is_not_cached(self, tmp_path):
+        """Test an enrich reply without a JSON object is asked for again"""
+        cache = LLMCache(str(tmp_path / "cache.sqlite"))
+        summarizer = Summarizer(cache=cache)
+        summarizer.client = Mock()
+        summarizer.client.complete.side_effect = [
+            "Sorry, I can't help with that.",
+            '{"summary": "An agent SDK.", "category": "Agentic AI", "confidence": 90}',
+        ]
+        
+        first = summarizer.enrich("Title", "Some content.", "Source")
+        second = summarizer.enrich("Title", "Some content.", "Source")
+        third = summarizer.enrich("Title", "Some content.", "Source")
+        
+        assert first['confidence'] is None
+        assert second == third == {'summary': 'An agent SDK.', 'category': 'Agentic AI', 'confidence': 90}
+        assert summarizer.client.complete.call_count == 2
+        assert cache.hits == 1
+        cache.close()
@@ -0,0 +1,166 @@
+"""
+Unit tests for paginated source traversal with early termination
+"""
+
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from crawler import Crawler
+
+
+def listing(articles, next_href=None):
+    """Build a listing page from (slug, title, date) tuples"""
+    body = ''.join(
+        f'<article><h2>{title}</h2><time datetime="{date}">{date}</time>'
+        f'<a href="/blog/{slug}">Read</a><p>Body of {title}.</p></article>'
+        for slug, title, date in articles
+    )
+    if next_href:
+        body += f'<a rel="next" href="{next_href}">Older posts</a>'
+    return f'<html><body>{body}</body></html>'
+
+
+PAGES = {
+    'https://example.com/blog': listing(
+        [('e', 'E', '2024-05-01'), ('d', 'D', '2024-04-01')], '/blog?page=2'),
+    'https://example.com/blog?page=2': listing(
+        [('c', 'C', '2024-03-01'), ('b', 'B', '2023-12-01')], '/blog?page=3'),
+    'https://example.com/blog?page=3': listing(
+        [('a', 'A', '2023-06-01')]),
+}
+
+
+@pytest.fixture
+def crawler(tmp_path):
+    """Create crawler with a paginated HTML source and an RSS source"""
+    config_path = tmp_path / "test_config.yaml"
+    config_path.write_text(f"""
+output:
+  path: "{tmp_path / 'output.json'}"
+
+backfill:
+  enabled: true
+  start_date: "2024-01-01"
+
+crawler:
+  delay_between_requests: 0
+  known_streak: 2
+
+sources:
+  - name: "Paged Blog"
+    url: "https://example.com/blog"
+    selectors:
+      article_list: "article"
+      title: "h2"
+      date: "time"
+      link: "a"
+    pagination:
+      next: "a[rel=next]"
+      max_pages: 5
+  - name: "Paged Feed"
+    url: "https://example.com"
+    rss_url: "https://example.com/feed"
+    pagination:
+      url_template: "https://example.com/feed?paged={{page}}"
+""")
+    return Crawler(str(config_path))
+
+
+def fetch_pages(pages):
+    """Fake _fetch_text serving pages by URL"""
+    return lambda url: (pages.get(url), False)
+
+
+class TestListingPagination:
+    """Test HTML listing traversal"""
+
+    def test_follows_next_links_until_cutoff(self, crawler):
+        """Test pages are followed until one reaches the backfill cutoff"""
+        source = crawler.config['sources'][0]
+        with patch.object(crawler, '_fetch_text', side_effect=fetch_pages(PAGES)) as mock_fetch:
+            entries = crawler.crawl_source(source)
+
+        assert [e['title'] for e in entries] == ['E', 'D', 'C']
+        assert [c.args[0] for c in mock_fetch.call_args_list] == [
+            'https://example.com/blog', 'https://example.com/blog?page=2'
+        ]
+
+    def test_max_pages(self, crawler):
+        """Test traversal stops at max_pages"""
+        source = {**crawler.config['sources'][0], 'pagination': {'next': 'a[rel=next]', 'max_pages': 1}}
+        crawler.backfill_start = None
+        with patch.object(crawler, '_fetch_text', side_effect=fetch_pages(PAGES)) as mock_fetch:
+            entries = crawler.crawl_source(source)
+
+        assert [e['title'] for e in entries] == ['E', 'D']
+        assert mock_fetch.call_count == 1
+
+    def test_full_backfill_without_cutoff(self, crawler):
+        """Test every page is read when nothing is older than the cutoff"""
+        crawler.backfill_start = None
+        with patch.object(crawler, '_fetch_text', side_effect=fetch_pages(PAGES)) as mock_fetch:
+            entries = crawler.crawl_source(crawler.config['sources'][0])
+
+        assert [e['title'] for e in entries] == ['E', 'D', 'C', 'B', 'A']
+        assert mock_fetch.call_count == 3
+
+    def test_incremental_run_fetches_one_page(self, crawler):
+        """Test a streak of known entries ends the traversal on the first page"""
+        crawler.known_entries = {
+            crawler._generate_id('https://example.com/blog/e', 'E'): {},
+            crawler._generate_id('https://example.com/blog/d', 'D'): {},
+        }
+        with patch.object(crawler, '_fetch_text', side_effect=fetch_pages(PAGES)) as mock_fetch:
+            entries = crawler.crawl_source(crawler.config['sources'][0])
+
+        # Known entries before the streak completes are kept, as on a single page
+        assert [e['title'] for e in entries] == ['E']
+        assert mock_fetch.call_count == 1
+
+    def test_next_link_cycle(self, crawler):
+        """Test a page linking back to itself is not fetched twice"""
+        crawler.backfill_start = None
+        pages = {'https://example.com/blog': listing([('e', 'E', '2024-05-01')], '/blog')}
+        with patch.object(crawler, '_fetch_text', side_effect=fetch_pages(pages)) as mock_fetch:
+            crawler.crawl_source(crawler.config['sources'][0])
+
+        assert mock_fetch.call_count == 1
+
+
+class TestFeedPagination:
+    """Test RSS traversal with a URL template"""
+
+    def feed_page(self, *items):
+        return [
+            {'title': title, 'url': f"https://example.com/{title}", 'date': date, 'content': 'Body.'}
+            for title, date in items
+        ]
+
+    def test_follows_template_until_empty_page(self, crawler):
+        """Test feed pages are read until one is empty"""
+        pages = {
+            'https://example.com/feed': self.feed_page(('B', '2024-05-01')),
+            'https://example.com/feed?paged=2': self.feed_page(('A', '2024-04-01')),
+        }
+        with patch.object(crawler, '_fetch_rss', side_effect=lambda url: pages.get(url, [])) as mock_fetch:
+            entries = crawler.crawl_source(crawler.config['sources'][1])
+
+        assert [e['title'] for e in entries] == ['B', 'A']
+        assert mock_fetch.call_count == 3
+
+    def test_stops_after_cutoff(self, crawler):
+        """Test a feed page reaching the cutoff is the last one read"""
+        pages = {
+            'https://example.com/feed': self.feed_page(('B', '2024-05-01'), ('A', '2023-04-01')),
+            'https://example.com/feed?paged=2': self.feed_page(('Z', '2023-01-01')),
+        }
+        with patch.object(crawler, '_fetch_rss', side_effect=lambda url: pages.get(url, [])) as mock_fetch:
+            entries = crawler.crawl_source(crawler.config['sources'][1])
+
+        assert [e['title'] for e in entries] == ['B']
+        assert mock_fetch.call_count == 1
@@ -0,0 +1,114 @@
+"""
+Unit tests for HTML parser backend selection and text extraction
+"""
+
+import pytest
+import yaml
+from bs4 import BeautifulSoup
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from crawler import Crawler
+from parsing import PARSER_BACKENDS, _is_available, html_to_text, resolve_parser
+
+FIXTURE_DIR = Path(__file__).parent.parent
+INSTALLED = [b for b in PARSER_BACKENDS if _is_available(b)]
+
+
+class TestResolveParser:
+    """Test resolve_parser function"""
+    
+    def test_auto_picks_installed_backend(self):
+        """Test auto resolves to the fastest installed backend"""
+        assert resolve_parser('auto') == INSTALLED[0]
+    
+    def test_explicit_backend(self):
+        """Test html.parser is always available"""
+        assert resolve_parser('html.parser') == 'html.parser'
+    
+    def test_unknown_backend(self):
+        """Test unknown backends are rejected"""
+        with pytest.raises(ValueError):
+            resolve_parser('selectolax')
+    
+    def test_missing_backend_falls_back(self):
+        """Test a configured but missing backend falls back to html.parser"""
+        with patch('parsing._is_available', side_effect=lambda b: b == 'html.parser'):
+            assert resolve_parser('lxml') == 'html.parser'
+
+
+class TestBackendEquivalence:
+    """Test every backend extracts the same entries from fixture pages"""
+    
+    @pytest.mark.parametrize("fixture,source_name", [
+        ("anthropic_page.html", "Anthropic"),
+        ("cursor_page.html", "Cursor"),
+    ])
+    def test_fixture_entries_match(self, tmp_path, fixture, source_name):
+        """Test source selectors give identical entries on each backend"""
+        if len(INSTALLED) < 2:
+            pytest.skip("only one parser backend installed")
+        
+        with open(FIXTURE_DIR / "config.yaml", 'r', encoding='utf-8') as f:
+            sources = yaml.safe_load(f)['sources']
+        source = next(s for s in sources if s['name'] == source_name)
+        config_path = tmp_path / "test_config.yaml"
+        config_path.write_text(yaml.safe_dump({
+            'output': {'path': str(tmp_path / 'output.json')},
+            'backfill': {'enabled': False},
+            'sources': [source]
+        }))
+        crawler = Crawler(str(config_path))
+        html = (FIXTURE_DIR / fixture).read_text(encoding='utf-8')
+        
+        results = []
+        for backend in INSTALLED:
+            crawler.parser = backend
+            with patch.object(crawler, '_fetch_text', return_value=(html, False)):
+                results.append(crawler.crawl_source(source))
+        
+        assert results[0]
+        assert all(result == results[0] for result in results[1:])
+
+
+
+SNIPPETS = [
+    '<p>Release <strong>2.0</strong> adds <a href="https://example.com">agent tooling</a> &amp; fixes.</p>',
+    '<ul><li>Faster tool calls</li><li>Read more</li></ul>',
+    'Plain   text\n with  spacing',
+    'Agents &#8217; new planner &nbsp; &copy; 2024',
+    '&lt;p&gt;Escaped markup&lt;/p&gt;',
+    'Re<b>lease</b> notes<br/>and<br>more',
+    'Before<script>var x = "<p>no</p>";</script><style>p { color: red }</style>after',
+    'Kept <!-- comment --> apart <![CDATA[raw]]> text',
+    '<p>Unclosed <b>bold and a < b comparison',
+    '',
+]
+
+
+class TestHtmlToText:
+    """Test html_to_text function"""
+    
+    @pytest.mark.parametrize("snippet", SNIPPETS)
+    def test_matches_beautifulsoup(self, snippet):
+        """Test text matches BeautifulSoup's get_text on the same snippet"""
+        soup = BeautifulSoup(snippet, 'html.parser')
+        expected = ' '.join(soup.get_text(separator=' ', strip=True).split())
+        assert html_to_text(snippet) == expected
+    
+    def test_tags_entities_and_whitespace(self):
+        """Test tags are removed, entities decoded and whitespace collapsed"""
+        assert html_to_text(SNIPPETS[0]) == 'Release 2.0 adds agent tooling & fixes.'
+        assert html_to_text(SNIPPETS[3]) == 'Agents ’ new planner © 2024'
+        assert html_to_text(SNIPPETS[6]) == 'Before after'
+    
+    @pytest.mark.parametrize("fixture", ["anthropic_page.html", "cursor_page.html"])
+    def test_fixture_pages_match_beautifulsoup(self, fixture):
+        """Test whole fixture pages give the same text as BeautifulSoup"""
+        html = (FIXTURE_DIR / fixture).read_text(encoding='utf-8')
+        soup = BeautifulSoup(html, 'html.parser')
+        assert html_to_text(html) == ' '.join(soup.get_text(separator=' ', strip=True).split())
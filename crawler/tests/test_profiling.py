@@ -0,0 +1,128 @@
+"""
+Unit tests for crawl profiling and the run report
+"""
+
+import json
+import pstats
+import threading
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import Mock, patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from crawler import Crawler
+from profiling import RunProfile, profile_call, profile_path, report_path
+
+
+class TestRunProfile:
+    """Test RunProfile class"""
+
+    def test_stages_and_counters(self):
+        """Test stage calls, seconds and counters accumulate"""
+        profile = RunProfile()
+        profile.add('fetch', 0.5)
+        profile.add('fetch', 0.25)
+        with profile.stage('parse'):
+            pass
+        profile.count('requests')
+        profile.count('requests', 2)
+
+        report = profile.report()
+        assert report['stages']['fetch'] == {'calls': 2, 'seconds': 0.75}
+        assert report['stages']['parse']['calls'] == 1
+        assert list(report['stages']) == ['fetch', 'parse']
+        assert report['counters'] == {'requests': 3}
+
+    def test_source_attribution_per_thread(self):
+        """Test work on each worker thread is attributed to its own source"""
+        profile = RunProfile()
+
+        def crawl(name, seconds):
+            with profile.source(name):
+                profile.add('fetch', seconds)
+                profile.count('entries')
+
+        threads = [threading.Thread(target=crawl, args=(name, seconds))
+                   for name, seconds in (('A', 1.0), ('B', 2.0))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        profile.add('save_entries', 0.5)
+
+        report = profile.report(extra_field=1)
+        assert report['stages']['fetch'] == {'calls': 2, 'seconds': 3.0}
+        assert report['sources']['A']['stages'] == {'fetch': {'calls': 1, 'seconds': 1.0}}
+        assert report['sources']['B']['counters'] == {'entries': 1}
+        assert 'save_entries' not in report['sources']['A']['stages']
+        assert report['extra_field'] == 1
+
+    def test_paths_next_to_output(self):
+        """Test report and profile files sit next to the output"""
+        assert report_path('data/entries.json') == Path('data/entries.report.json')
+        assert profile_path('data/entries.json', 'cprofile') == Path('data/entries.prof')
+        assert profile_path('data/entries.json', 'pyinstrument') == Path('data/entries.profile.html')
+
+    def test_profile_call_cprofile(self, tmp_path):
+        """Test cProfile stats are saved and the result is returned"""
+        output = tmp_path / "run.prof"
+        assert profile_call(lambda: sum(range(100)), 'cprofile', output) == 4950
+        assert pstats.Stats(str(output)).total_calls > 0
+
+    def test_profile_call_unknown(self, tmp_path):
+        """Test an unknown profiler is rejected"""
+        with pytest.raises(ValueError):
+            profile_call(lambda: None, 'perf', tmp_path / "run.prof")
+
+
+class TestRunReport:
+    """Integration test for the run report written by the crawler"""
+
+    def test_run_writes_report(self, tmp_path):
+        """Test a run writes stage, source and counter totals next to the output"""
+        config_path = tmp_path / "test_config.yaml"
+        output_path = tmp_path / "output.json"
+        config_path.write_text(f"""
+output:
+  path: "{output_path}"
+
+backfill:
+  enabled: false
+
+crawler:
+  delay_between_requests: 0
+
+profiling:
+  report: true
+
+sources:
+  - name: "Test Source"
+    url: "https://example.com"
+    rss_url: "https://example.com/feed"
+""")
+        crawler = Crawler(str(config_path))
+        crawler.summarizer = Mock()
+        crawler.summarizer.enrich.return_value = {
+            'summary': "Summary", 'category': "Other", 'confidence': 80
+        }
+        feed = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><title>First</title><link>https://example.com/1</link>
+<pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate><description>First body.</description></item>
+</channel></rss>"""
+
+        with patch.object(crawler, '_fetch_text', return_value=(feed, False)):
+            crawler.run()
+
+        with open(tmp_path / "output.report.json") as f:
+            report = json.load(f)
+        for stage in ('crawl_all', 'fetch_rss', 'parse', 'generate_summaries', 'save_entries'):
+            assert report['stages'][stage]['calls'] == 1
+        assert report['sources']['Test Source']['counters'] == {'entries': 1}
+        assert 'fetch_rss' in report['sources']['Test Source']['stages']
+        assert report['counters']['enriched'] == 1
+        assert report['total_entries'] == 1
+        assert report['http']['requests'] == 0
@@ -0,0 +1,176 @@
+"""
+Unit tests for streaming feed ingestion
+"""
+
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import patch
+from xml.etree import ElementTree
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from crawler import Crawler
+from rss_adapter import entry_item, iter_feed_items, parse_feed
+
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:media="http://search.yahoo.com/mrss/">
+<channel><title>Example</title><link>https://example.com</link>
+  <item><title> Agents &amp; tools &#8217; </title><media:title>Ignored</media:title>
+    <link> https://example.com/a </link><pubDate>Wed, 01 May 2024 08:00:00 GMT</pubDate>
+    <description>&lt;p&gt;Agents now plan tasks.&lt;/p&gt;</description></item>
+  <item><title><![CDATA[Release <b>2.0</b>]]></title><guid>https://example.com/b</guid>
+    <dc:date>2024-04-01</dc:date><content:encoded><![CDATA[<p>Full notes.</p>]]></content:encoded></item>
+</channel></rss>
+"""
+
+ATOM = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Example</title>
+  <entry><title>Agent mode</title><link rel="self" href="https://example.com/self"/>
+    <link href="https://example.com/agent-mode"/><updated>2024-05-03T00:00:00Z</updated>
+    <published>2024-05-02T00:00:00Z</published><summary type="html">&lt;p&gt;Now GA.&lt;/p&gt;</summary></entry>
+</feed>
+"""
+
+
+def feed(*items, tail='</channel></rss>'):
+    """Build an RSS feed from (title, pubDate) tuples"""
+    body = ''.join(
+        f"<item><title>{title}</title><link>https://example.com/{title.replace(' ', '-')}</link>"
+        f"<pubDate>{published}</pubDate><description>&lt;p&gt;{title} notes. Read more&lt;/p&gt;</description></item>"
+        for title, published in items
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>{body}{tail}'
+
+
+FEED_URL = 'https://example.com/feed.xml'
+
+NEW = [(f"New {n}", 'Wed, 01 May 2024 08:00:00 GMT') for n in range(2)]
+OLD = [(f"Old {n}", 'Mon, 01 May 2023 08:00:00 GMT') for n in range(50)]
+
+
+@pytest.fixture
+def crawler(tmp_path):
+    """Create crawler streaming an RSS source"""
+    config_path = tmp_path / "test_config.yaml"
+    config_path.write_text(f"""
+output:
+  path: "{tmp_path / 'output.json'}"
+
+backfill:
+  enabled: true
+  start_date: "2024-01-01"
+
+crawler:
+  delay_between_requests: 0
+  known_streak: 1
+  cutoff_streak: 2
+  stream_feeds: true
+
+sources:
+  - name: "Example"
+    type: "rss"
+    url: "https://example.com/feed.xml"
+""")
+    return Crawler(str(config_path))
+
+
+class TestIterFeedItems:
+    """Test iter_feed_items function"""
+
+    def test_rss_items(self):
+        """Test RSS fields, guid links and content:encoded descriptions"""
+        assert list(iter_feed_items(RSS)) == [
+            {'title': 'Agents & tools ’', 'url': 'https://example.com/a',
+             'date': 'Wed, 01 May 2024 08:00:00 GMT', 'description': '<p>Agents now plan tasks.</p>'},
+            {'title': 'Release <b>2.0</b>', 'url': 'https://example.com/b',
+             'date': '2024-04-01', 'description': '<p>Full notes.</p>'},
+        ]
+
+    def test_atom_entries(self):
+        """Test the alternate link and published date of Atom entries"""
+        assert list(iter_feed_items(ATOM)) == [
+            {'title': 'Agent mode', 'url': 'https://example.com/agent-mode',
+             'date': '2024-05-02T00:00:00Z', 'description': '<p>Now GA.</p>'},
+        ]
+
+    def test_relative_links_resolve_against_xml_base(self):
+        """Test links resolve against inherited and own xml:base, then the feed URL"""
+        text = """<feed xmlns="http://www.w3.org/2005/Atom" xml:base="https://y.com/blog/">
+          <entry><title>A</title><link href="post-1"/></entry>
+          <entry xml:base="/other/"><title>B</title><link href="post-2"/></entry>
+          <entry><title>C</title><link xml:base="sub/" href="post-3"/></entry>
+        </feed>"""
+        assert [item['url'] for item in iter_feed_items(text)] == [
+            'https://y.com/blog/post-1', 'https://y.com/other/post-2', 'https://y.com/blog/sub/post-3'
+        ]
+        relative = feed(NEW[0]).replace('https://example.com/New-0', '/posts/new-0')
+        assert next(iter_feed_items(relative, FEED_URL))['url'] == 'https://example.com/posts/new-0'
+
+    @pytest.mark.parametrize('text', [
+        RSS, ATOM, feed(*NEW, *OLD),
+        ATOM.replace('<feed ', '<feed xml:base="https://y.com/blog/" ').replace('https://example.com/agent-mode', 'post-1'),
+        feed(NEW[0]).replace('https://example.com/New-0', 'posts/new-0'),
+    ])
+    def test_matches_feedparser(self, text):
+        """Test items match those built from feedparser, so entry ids are stable"""
+        expected = [entry_item(e) for e in parse_feed(text, FEED_URL).entries]
+        assert list(iter_feed_items(text, FEED_URL)) == expected
+
+    def test_items_are_parsed_lazily(self):
+        """Test items before a malformed part of the feed are read"""
+        items = iter_feed_items(feed(*NEW, tail='<item><title>&nbsp;</title></item></channel></rss>'))
+        assert [next(items)['title'], next(items)['title']] == ['New 0', 'New 1']
+        with pytest.raises(ElementTree.ParseError):
+            next(items)
+
+
+class TestStreamFeeds:
+    """Test crawling feeds with stream_feeds"""
+
+    def test_stops_reading_at_old_items(self, crawler):
+        """Test the rest of the feed is never parsed or cleaned after a streak of old items"""
+        text = feed(*NEW, *OLD, tail='<item>&nbsp;</item></channel></rss>')
+        with patch.object(crawler, '_fetch_text', return_value=(text, False)), \
+             patch('rss_adapter.feedparser.parse') as mock_parse, \
+             patch.object(crawler, '_clean_html', wraps=crawler._clean_html) as mock_clean:
+            entries = crawler.crawl_source(crawler.config['sources'][0])
+
+        assert [e['title'] for e in entries] == ['New 0', 'New 1']
+        assert entries[0]['content'] == 'New 0 notes.'
+        assert mock_clean.call_count == 2
+        mock_parse.assert_not_called()
+
+    def test_stops_reading_at_known_items(self, crawler):
+        """Test an incremental crawl stops at the first known item"""
+        crawler.known_entries = {crawler._generate_id('https://example.com/New-1', 'New 1'): {}}
+        with patch.object(crawler, '_fetch_text', return_value=(feed(*NEW, *OLD), False)), \
+             patch.object(crawler, '_clean_html', wraps=crawler._clean_html) as mock_clean:
+            entries = crawler.crawl_source(crawler.config['sources'][0])
+
+        assert [e['title'] for e in entries] == ['New 0']
+        assert mock_clean.call_count == 1
+
+    def test_same_entries_as_feedparser(self, crawler):
+        """Test streamed and fully parsed feeds give the same entries"""
+        text = feed(*NEW, *OLD[:1], ('New 2', '2024-02-01'), *OLD[1:])
+        source = crawler.config['sources'][0]
+        with patch.object(crawler, '_fetch_text', return_value=(text, False)):
+            streamed = crawler.crawl_source(source)
+            crawler.config['crawler']['stream_feeds'] = False
+            parsed = crawler.crawl_source(source)
+
+        assert [e['title'] for e in streamed] == ['New 0', 'New 1', 'New 2']
+        assert streamed == parsed
+
+    def test_malformed_feed_falls_back_to_feedparser(self, crawler):
+        """Test items after a malformed part are read with feedparser, without repeats"""
+        text = feed(NEW[0], tail='<item><title>Bad&nbsp;entity</title><link>https://example.com/bad</link>'
+                                 '</item></channel></rss>')
+        with patch.object(crawler, '_fetch_text', return_value=(text, False)):
+            entries = crawler.crawl_source(crawler.config['sources'][0])
+
+        assert [e['url'] for e in entries] == ['https://example.com/New-0', 'https://example.com/bad']
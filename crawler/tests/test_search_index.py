@@ -0,0 +1,84 @@
+"""
+Unit tests for the prebuilt site search index
+"""
+
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from search_index import build_index, decode_bitset, encode_bitset, search, tokenize
+
+
+ENTRIES = [
+    {'id': 'a', 'title': 'Agents that use tools', 'summary': 'Tool use GA.', 'source': 'Anthropic',
+     'category': 'Agentic AI', 'tags': ['API']},
+    {'id': 'b', 'title': 'GPT-5 released', 'summary': 'A new model.', 'source': 'OpenAI',
+     'category': 'Other', 'tags': []},
+    {'id': 'c', 'title': 'Agent mode in the editor', 'summary': None, 'source': 'Cursor',
+     'category': 'Agentic AI'},
+]
+
+
+class TestTokenize:
+    """Test tokenize function"""
+
+    def test_splits_on_punctuation(self):
+        assert tokenize('GPT-5, now in the API!') == ['gpt', '5', 'now', 'in', 'the', 'api']
+
+    def test_empty(self):
+        assert tokenize(None) == []
+
+
+class TestBitsets:
+    """Test bitset encoding"""
+
+    def test_round_trip(self):
+        assert decode_bitset(encode_bitset([0, 3, 9], 10)) == 0b1000001001
+
+
+class TestBuildIndex:
+    """Test build_index function"""
+
+    def test_tokens_sorted_with_delta_postings(self):
+        """Test postings are delta-encoded document numbers"""
+        index = build_index(ENTRIES)
+        assert index['tokens'] == sorted(index['tokens'])
+        assert index['ids'] == ['a', 'b', 'c']
+        postings = dict(zip(index['tokens'], index['postings']))
+        assert postings['agent'] == [2]
+        assert postings['use'] == [0]
+
+    def test_facet_bitsets(self):
+        """Test source and category bitsets"""
+        index = build_index(ENTRIES)
+        assert decode_bitset(index['categories']['Agentic AI']) == 0b101
+        assert decode_bitset(index['sources']['OpenAI']) == 0b010
+
+
+class TestSearch:
+    """Test search function"""
+
+    def test_prefix_match(self):
+        """Test query tokens match token prefixes"""
+        index = build_index(ENTRIES)
+        assert search(index, 'agent') == ['a', 'c']
+        assert search(index, 'gpt') == ['b']
+
+    def test_all_tokens_required(self):
+        """Test every query token must match"""
+        assert search(build_index(ENTRIES), 'agent tool') == ['a']
+
+    def test_tags_are_searchable(self):
+        assert search(build_index(ENTRIES), 'api') == ['a']
+
+    def test_filters(self):
+        """Test source and category filters intersect with the query"""
+        index = build_index(ENTRIES)
+        assert search(index, category='Agentic AI') == ['a', 'c']
+        assert search(index, 'agent', source='Cursor') == ['c']
+        assert search(index, source='Unknown') == []
+
+    def test_no_match(self):
+        assert search(build_index(ENTRIES), 'zzz') == []
@@ -0,0 +1,107 @@
+"""
+Unit tests for the sharded static site export
+"""
+
+import json
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from site_export import build_facets, build_shards, export_site_data, shard_key
+
+
+def make_entry(entry_id, date, source='OpenAI', category='Other'):
+    return {
+        'id': entry_id,
+        'title': f'Title {entry_id}',
+        'source': source,
+        'url': f'https://example.com/{entry_id}',
+        'date': date,
+        'content': 'Long content that the site never shows',
+        'summary': 'Summary',
+        'category': category,
+        'categoryConfidence': 90,
+        'tags': []
+    }
+
+
+ENTRIES = [
+    make_entry('a', '2026-01-20T00:00:00', category='Agentic AI'),
+    make_entry('b', '2025-12-03T00:00:00', source='Anthropic'),
+    make_entry('c', '2026-01-28T00:00:00'),
+    make_entry('d', None, source='Cursor'),
+]
+
+
+class TestShards:
+    """Test shard and facet building"""
+
+    def test_shard_key(self):
+        """Test entries are bucketed by month"""
+        assert shard_key(ENTRIES[0]) == '2026-01'
+        assert shard_key(ENTRIES[3]) == 'undated'
+
+    def test_build_shards(self):
+        """Test shards are newest first with undated entries last"""
+        shards = build_shards(ENTRIES)
+        assert [key for key, _ in shards] == ['2026-01', '2025-12', 'undated']
+        assert [e['id'] for e in shards[0][1]] == ['c', 'a']
+
+    def test_shards_drop_unused_fields(self):
+        """Test only the fields the site uses are exported"""
+        entry = build_shards(ENTRIES)[0][1][0]
+        assert 'content' not in entry
+        assert 'categoryConfidence' not in entry
+        assert entry['summary'] == 'Summary'
+
+    def test_build_facets(self):
+        """Test facet counts"""
+        facets = build_facets(ENTRIES)
+        assert facets['sources'] == {'OpenAI': 2, 'Anthropic': 1, 'Cursor': 1}
+        assert facets['categories'] == {'Other': 3, 'Agentic AI': 1}
+
+
+class TestExportSiteData:
+    """Test export_site_data function"""
+
+    def test_writes_manifest_and_shards(self, tmp_path):
+        """Test every entry lands in exactly one minified shard"""
+        manifest = export_site_data({'last_updated': '2026-01-31T00:00:00Z', 'entries': ENTRIES}, tmp_path)
+
+        stored = json.loads((tmp_path / 'manifest.json').read_text(encoding='utf-8'))
+        assert stored == manifest
+        assert manifest['total'] == 4
+        assert manifest['last_updated'] == '2026-01-31T00:00:00Z'
+
+        exported = []
+        for shard in manifest['shards']:
+            raw = (tmp_path / shard['file']).read_text(encoding='utf-8')
+            assert '\n' not in raw and ', ' not in raw
+            assert len(json.loads(raw)) == shard['count']
+            exported.extend(e['id'] for e in json.loads(raw))
+        assert sorted(exported) == ['a', 'b', 'c', 'd']
+
+        index = json.loads((tmp_path / manifest['index']['file']).read_text(encoding='utf-8'))
+        assert index['ids'] == exported
+
+    def test_unchanged_shards_keep_their_names(self, tmp_path):
+        """Test content hashes only change for shards whose entries changed"""
+        first = export_site_data({'entries': ENTRIES}, tmp_path)
+        changed = [dict(e) for e in ENTRIES]
+        changed[0]['summary'] = 'New summary'
+        second = export_site_data({'entries': changed}, tmp_path)
+
+        files = lambda manifest: {s['key']: s['file'] for s in manifest['shards']}
+        assert files(first)['2025-12'] == files(second)['2025-12']
+        assert files(first)['2026-01'] != files(second)['2026-01']
+
+    def test_removes_stale_shards(self, tmp_path):
+        """Test shards no longer in the manifest are deleted"""
+        export_site_data({'entries': ENTRIES}, tmp_path)
+        manifest = export_site_data({'entries': ENTRIES[:1]}, tmp_path)
+
+        on_disk = sorted(p.name for p in (tmp_path / 'shards').iterdir())
+        written = manifest['shards'] + [manifest['index']]
+        assert on_disk == sorted(Path(s['file']).name for s in written)
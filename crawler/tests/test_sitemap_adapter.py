@@ -0,0 +1,190 @@
+"""
+Unit tests for sitemap sources
+"""
+
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from crawler import Crawler
+from sitemap_adapter import iter_sitemap, page_metadata, sitemap_url, slug_title
+
+
+def urlset(*urls):
+    """Build a sitemap from (loc, lastmod) tuples"""
+    body = ''.join(
+        f"<url><loc>{loc}</loc>{f'<lastmod>{lastmod}</lastmod>' if lastmod else ''}</url>"
+        for loc, lastmod in urls
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?>' \
+           f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{body}</urlset>'
+
+
+INDEX = """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/sitemap-news.xml</loc><lastmod>2024-05-02</lastmod></sitemap>
+  <sitemap><loc>https://example.com/sitemap-2023.xml</loc><lastmod>2023-12-31</lastmod></sitemap>
+</sitemapindex>
+"""
+
+SITEMAPS = {
+    'https://example.com/sitemap.xml': INDEX,
+    'https://example.com/sitemap-news.xml': urlset(
+        ('https://example.com/news/older-post', '2024-02-01T10:00:00+00:00'),
+        ('https://example.com/news/introducing-agent-mode', '2024-05-01T10:00:00+00:00'),
+        ('https://example.com/careers/engineer', '2024-05-02'),
+        ('https://example.com/news/last-year', '2023-06-01'),
+        ('https://example.com/news/undated-post', None),
+    ),
+}
+
+
+@pytest.fixture
+def crawler(tmp_path):
+    """Create crawler with a sitemap source"""
+    config_path = tmp_path / "test_config.yaml"
+    config_path.write_text(f"""
+output:
+  path: "{tmp_path / 'output.json'}"
+
+backfill:
+  enabled: true
+  start_date: "2024-01-01"
+
+crawler:
+  delay_between_requests: 0
+  known_streak: 1
+
+sources:
+  - name: "Example"
+    type: "sitemap"
+    url: "https://example.com/news"
+    sitemap:
+      include: "/news/"
+""")
+    return Crawler(str(config_path))
+
+
+def fetch_pages(pages):
+    """Fake _fetch_text serving pages by URL"""
+    return lambda url: (pages.get(url), False)
+
+
+class TestIterSitemap:
+    """Test iter_sitemap function"""
+
+    def test_urls_and_news_extension(self):
+        """Test url records with lastmod and Google News title and date"""
+        text = """<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+                          xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
+                          xmlns:image="http://www.google.com/schemas/sitemap-image/0.9">
+          <url><loc>https://example.com/a</loc><lastmod>2024-05-01</lastmod>
+            <image:image><image:loc>https://example.com/a.png</image:loc><image:title>Chart</image:title></image:image>
+            <news:news><news:title>Agents ship</news:title>
+              <news:publication_date>2024-04-30</news:publication_date></news:news></url>
+          <url><loc> https://example.com/b </loc></url>
+          <url><lastmod>2024-05-01</lastmod></url>
+        </urlset>"""
+        assert list(iter_sitemap(text)) == [
+            ('url', {'loc': 'https://example.com/a', 'lastmod': '2024-05-01',
+                     'title': 'Agents ship', 'published': '2024-04-30'}),
+            ('url', {'loc': 'https://example.com/b'}),
+        ]
+
+    def test_sitemap_index(self):
+        """Test sitemap index entries are reported as sitemaps"""
+        assert [kind for kind, _ in iter_sitemap(INDEX)] == ['sitemap', 'sitemap']
+
+    def test_large_sitemap_is_streamed_in_chunks(self):
+        """Test records spanning chunk boundaries are read intact"""
+        urls = [(f"https://example.com/news/post-{n}", '2024-05-01') for n in range(5000)]
+        records = list(iter_sitemap(urlset(*urls)))
+        assert len(records) == 5000
+        assert records[-1][1]['loc'] == 'https://example.com/news/post-4999'
+
+
+class TestHelpers:
+    """Test sitemap helper functions"""
+
+    def test_sitemap_url(self):
+        """Test the sitemap defaults to /sitemap.xml on the source's site"""
+        assert sitemap_url({'url': 'https://example.com/news'}) == 'https://example.com/sitemap.xml'
+        assert sitemap_url({'sitemap_url': 'https://example.com/news.xml'}) == 'https://example.com/news.xml'
+
+    def test_slug_title(self):
+        """Test titles are derived from the last path segment"""
+        assert slug_title('https://example.com/news/introducing-agent-mode/') == 'Introducing agent mode'
+        assert slug_title('https://example.com/blog/release_notes.html') == 'Release notes'
+
+    def test_page_metadata(self):
+        """Test Open Graph tags are preferred over <title> and meta description"""
+        html = ('<html><head><title> Agents | Example </title>'
+                '<meta name="description" content="Short.">'
+                '<meta property="og:description" content="Agents can plan.">'
+                '</head><body><meta property="og:title" content="Ignored"></body></html>')
+        assert page_metadata(html) == ('Agents | Example', 'Agents can plan.')
+
+
+class TestSitemapAdapter:
+    """Test crawling sitemap sources"""
+
+    def test_crawl_filters_and_sorts(self, crawler):
+        """Test URLs are filtered by pattern and lastmod and returned newest first"""
+        with patch.object(crawler, '_fetch_text', side_effect=fetch_pages(SITEMAPS)) as mock_fetch:
+            entries = crawler.crawl_source(crawler.config['sources'][0])
+
+        assert [(e['title'], e['date']) for e in entries] == [
+            ('Introducing agent mode', '2024-05-01'),
+            ('Older post', '2024-02-01'),
+            ('Undated post', None),
+        ]
+        # The child sitemap last modified before the cutoff is not fetched
+        assert [c.args[0] for c in mock_fetch.call_args_list] == [
+            'https://example.com/sitemap.xml', 'https://example.com/sitemap-news.xml'
+        ]
+
+    def test_incremental_crawl_stops_at_known_urls(self, crawler):
+        """Test a streak of known URLs ends an incremental crawl"""
+        crawler.known_entries = {
+            crawler._generate_id('https://example.com/news/older-post', 'Older post'): {}
+        }
+        with patch.object(crawler, '_fetch_text', side_effect=fetch_pages(SITEMAPS)):
+            entries = crawler.crawl_source(crawler.config['sources'][0])
+
+        assert [e['title'] for e in entries] == ['Introducing agent mode']
+
+    def test_fetch_pages_keeps_ids(self, crawler):
+        """Test article pages supply title and content without changing entry ids"""
+        source = {**crawler.config['sources'][0], 'sitemap': {'include': '/news/', 'fetch_pages': True}}
+        pages = {
+            **SITEMAPS,
+            'https://example.com/news/introducing-agent-mode': (
+                '<html><head><meta property="og:title" content="Introducing Agent Mode">'
+                '<meta property="og:description" content="Agents now plan and run tasks. Read more">'
+                '</head><body>...</body></html>'
+            ),
+        }
+        with patch.object(crawler, '_fetch_text', side_effect=fetch_pages(pages)):
+            entries = crawler.crawl_source(source)
+
+        assert entries[0]['id'] == crawler._generate_id(
+            'https://example.com/news/introducing-agent-mode', 'Introducing agent mode'
+        )
+        assert entries[0]['title'] == 'Introducing Agent Mode'
+        assert entries[0]['content'] == 'Agents now plan and run tasks.'
+        # Pages that fail to load keep the sitemap's title
+        assert entries[1]['title'] == 'Older post'
+
+    def test_invalid_include_pattern(self, crawler):
+        """Test a bad include pattern fails at startup"""
+        with pytest.raises(ValueError, match="Example.*include"):
+            crawler._adapter('sitemap').prepare({**crawler.config['sources'][0], 'sitemap': {'include': '('}})
+
+    def test_malformed_sitemap(self, crawler):
+        """Test unparseable XML yields no entries"""
+        with patch.object(crawler, '_fetch_text', return_value=('<urlset><url>', False)):
+            assert crawler.crawl_source(crawler.config['sources'][0]) == []
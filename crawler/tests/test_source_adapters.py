@@ -0,0 +1,162 @@
+"""
+Unit tests for the source adapter registry
+"""
+
+import subprocess
+import time
+import pytest
+import yaml
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+# Add src to path
+SRC_DIR = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(SRC_DIR))
+
+from crawler import Crawler
+import source_adapters
+from source_adapters import SourceAdapter, load_adapter, register_adapter, source_type
+from rss_adapter import RssAdapter, feed_date
+
+
+class StaticAdapter(SourceAdapter):
+    """Adapter serving entries from the source config"""
+
+    def prepare(self, source):
+        if 'items' not in source:
+            raise ValueError(f"Source '{source['name']}': static sources need items")
+
+    def crawl(self, source):
+        return [
+            self.crawler._make_entry(self.crawler._generate_id(url, title), title, source['name'],
+                                     url, None, '')
+            for title, url in source['items']
+        ]
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Isolate registrations made by a test"""
+    monkeypatch.setattr(source_adapters, 'ADAPTERS', dict(source_adapters.ADAPTERS))
+    monkeypatch.setattr(source_adapters, '_loaded', {})
+    return source_adapters.ADAPTERS
+
+
+def make_crawler(tmp_path, *sources):
+    config_path = tmp_path / "test_config.yaml"
+    config_path.write_text(yaml.safe_dump({
+        'output': {'path': str(tmp_path / 'output.json')},
+        'backfill': {'enabled': False},
+        'sources': list(sources)
+    }))
+    return Crawler(str(config_path))
+
+
+class TestSourceType:
+    """Test source_type function"""
+
+    def test_explicit_type(self):
+        """Test a registered type is used as is"""
+        assert source_type({'type': 'rss', 'url': 'https://example.com/feed'}) == 'rss'
+        assert source_type({'type': 'html-listing', 'rss_url': 'https://example.com/feed'}) == 'html-listing'
+
+    @pytest.mark.parametrize('type_name', [None, 'blog', 'changelog'])
+    def test_untyped_sources_prefer_rss(self, type_name):
+        """Test sources without an adapter type read their feed if they have one"""
+        assert source_type({'type': type_name, 'rss_url': 'https://example.com/feed'}) == 'rss'
+        assert source_type({'type': type_name, 'rss_url': None}) == 'html-listing'
+
+    def test_unknown_type(self):
+        """Test unknown types are rejected with the source name"""
+        with pytest.raises(ValueError, match="Test Source.*podcast"):
+            source_type({'name': 'Test Source', 'type': 'podcast'})
+
+
+class TestRegistry:
+    """Test adapter registration and lazy loading"""
+
+    def test_load_adapter(self, registry):
+        """Test 'module:Class' targets are imported and cached"""
+        assert load_adapter('rss') is RssAdapter
+        assert source_adapters._loaded['rss'] is RssAdapter
+
+    def test_import_loads_no_parsers(self):
+        """Test importing the crawler leaves feed and HTML parsing unloaded"""
+        modules = ('feedparser', 'bs4', 'dateutil', 'rss_adapter', 'html_adapter')
+        result = subprocess.run(
+            [sys.executable, '-c', f"import sys, crawler; print([m for m in {modules!r} if m in sys.modules])"],
+            cwd=SRC_DIR, capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == '[]'
+
+    def test_feed_sources_load_no_html_parsing(self, tmp_path):
+        """Test a crawler with feed sources only never imports selector or HTML parsing libraries"""
+        config_path = tmp_path / "test_config.yaml"
+        config_path.write_text(yaml.safe_dump({
+            'output': {'path': str(tmp_path / 'output.json')},
+            'sources': [{'name': 'Feed', 'type': 'rss', 'url': 'https://example.com/feed',
+                         'pagination': {'url_template': 'https://example.com/feed?paged={page}'}}]
+        }))
+        modules = ('bs4', 'soupsieve', 'lxml', 'html_adapter', 'source_plan')
+        result = subprocess.run(
+            [sys.executable, '-c', f"import sys, crawler; crawler.Crawler({str(config_path)!r}); "
+                                   f"print([m for m in {modules!r} if m in sys.modules])"],
+            cwd=SRC_DIR, capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip().splitlines()[-1] == '[]'
+
+    def test_only_configured_types_are_loaded(self, tmp_path):
+        """Test a crawler with feed sources only never loads the HTML adapter"""
+        crawler = make_crawler(tmp_path, {'name': 'Feed', 'type': 'rss', 'url': 'https://example.com/feed'})
+        assert list(crawler.adapters) == ['rss']
+
+    def test_registered_adapter_crawls(self, tmp_path, registry):
+        """Test a registered adapter validates and crawls its sources"""
+        register_adapter('static', StaticAdapter)
+        crawler = make_crawler(tmp_path, {
+            'name': 'Static', 'type': 'static', 'items': [['Agents', 'https://example.com/agents']]
+        })
+
+        entries = crawler.crawl_source(crawler.config['sources'][0])
+        assert [(e['title'], e['source']) for e in entries] == [('Agents', 'Static')]
+
+    def test_startup_validation(self, tmp_path, registry):
+        """Test unknown types and invalid sources fail when the crawler starts"""
+        with pytest.raises(ValueError, match="unknown type"):
+            make_crawler(tmp_path, {'name': 'Odd', 'type': 'podcast', 'url': 'https://example.com'})
+
+        register_adapter('static', StaticAdapter)
+        with pytest.raises(ValueError, match="Static.*items"):
+            make_crawler(tmp_path, {'name': 'Static', 'type': 'static'})
+
+        # Disabled sources are not validated
+        make_crawler(tmp_path, {'name': 'Static', 'type': 'static', 'enabled': False})
+
+
+class TestRssAdapter:
+    """Test the RSS adapter"""
+
+    def test_typed_source_reads_url(self, tmp_path):
+        """Test an rss-typed source without rss_url reads its url as the feed"""
+        crawler = make_crawler(tmp_path, {'name': 'Feed', 'type': 'rss', 'url': 'https://example.com/feed'})
+        items = [{'title': 'Agents', 'url': 'https://example.com/agents', 'date': '2024-05-01',
+                  'content': 'Body.'}]
+        with patch.object(crawler, '_fetch_rss', return_value=items) as mock_fetch:
+            entries = crawler.crawl_source(crawler.config['sources'][0])
+
+        mock_fetch.assert_called_once_with('https://example.com/feed')
+        assert [e['title'] for e in entries] == ['Agents']
+
+    def test_next_selector_needs_listing_source(self, tmp_path):
+        """Test feeds only accept page-numbered pagination"""
+        with pytest.raises(ValueError, match="Feed.*url_template"):
+            make_crawler(tmp_path, {'name': 'Feed', 'type': 'rss', 'url': 'https://example.com/feed',
+                                    'pagination': {'next': 'a[rel=next]'}})
+
+    def test_feed_date_falls_back_to_parsed_tuple(self):
+        """Test feedparser's parsed date is used when the raw string is unparseable"""
+        parsed = time.strptime('2024-03-09', '%Y-%m-%d')
+        assert feed_date({'published': 'Tue, 02 Jan 2024 08:00:00 GMT'}) == 'Tue, 02 Jan 2024 08:00:00 GMT'
+        assert feed_date({'published': '9 mars 2024', 'published_parsed': parsed}) == '2024-03-09'
+        assert feed_date({'published': '9 mars 2024'}) == '9 mars 2024'
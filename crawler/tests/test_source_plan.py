@@ -0,0 +1,140 @@
+"""
+Unit tests for compiled per-source extraction plans
+"""
+
+import pytest
+import yaml
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from crawler import Crawler
+from source_plan import SourcePlan
+
+
+def make_source(**selectors):
+    return {
+        'name': 'Test Source',
+        'url': 'https://example.com/blog/',
+        'selectors': selectors
+    }
+
+
+class TestSourcePlan:
+    """Test SourcePlan class"""
+
+    def test_defaults(self):
+        """Test missing selectors fall back to the defaults"""
+        soup = BeautifulSoup(
+            '<article><h2>Title</h2><time datetime="2025-01-02">Jan 2</time><a href="/a">x</a></article>',
+            'html.parser'
+        )
+        plan = SourcePlan(make_source())
+        article = plan.articles(soup)[0]
+        assert plan.title_text(article) == 'Title'
+        assert plan.date_text(article) == '2025-01-02'
+        assert plan.link_url(article) == 'https://example.com/a'
+
+    def test_date_text_without_datetime(self):
+        """Test the element text is used when there is no datetime attribute"""
+        soup = BeautifulSoup('<article><time> March 3, 2025 </time></article>', 'html.parser')
+        assert SourcePlan(make_source()).date_text(soup.article) == 'March 3, 2025'
+
+    def test_relative_link(self):
+        """Test links relative to the listing URL"""
+        soup = BeautifulSoup('<article><a href="post-1">x</a></article>', 'html.parser')
+        assert SourcePlan(make_source()).link_url(soup.article) == 'https://example.com/blog/post-1'
+
+    def test_article_is_link(self):
+        """Test a null link selector uses the article element itself"""
+        soup = BeautifulSoup('<a href="/news/1"><h3>One</h3></a><div><h3>Two</h3></div>', 'html.parser')
+        plan = SourcePlan(make_source(article_list='a, div', title='h3', link=None))
+        first, second = plan.articles(soup)
+        assert plan.link_url(first) == 'https://example.com/news/1'
+        assert plan.link_url(second) == ''
+
+    def test_articles_limit(self):
+        """Test the article limit keeps document order"""
+        soup = BeautifulSoup(''.join(f'<article id="a{i}"></article>' for i in range(5)), 'html.parser')
+        articles = SourcePlan(make_source()).articles(soup, limit=2)
+        assert [a['id'] for a in articles] == ['a0', 'a1']
+
+    def test_invalid_selector(self):
+        """Test invalid selectors name the source and field"""
+        with pytest.raises(ValueError, match="Test Source.*title"):
+            SourcePlan(make_source(title='h2['))
+
+    def test_matches(self):
+        """Test plans notice changed selectors"""
+        source = make_source(title='h3')
+        plan = SourcePlan(source)
+        assert plan.matches(source)
+        assert not plan.matches(make_source(title='h4'))
+
+        assert not plan.matches({**source, 'pagination': {'url_template': '/page/{page}'}})
+
+    def test_no_pagination(self):
+        """Test sources without pagination have a single page"""
+        plan = SourcePlan(make_source())
+        assert plan.max_pages == 1
+        assert plan.next_page_url(1, plan.url) is None
+
+    def test_next_page_selector(self):
+        """Test next links are resolved against the current page"""
+        source = {**make_source(), 'pagination': {'next': 'a[rel=next]', 'max_pages': 3}}
+        plan = SourcePlan(source)
+        soup = BeautifulSoup('<a rel="next" href="?page=2">Older</a>', 'html.parser')
+        assert plan.next_page_url(1, 'https://example.com/blog/', soup) == 'https://example.com/blog/?page=2'
+        assert plan.next_page_url(1, 'https://example.com/blog/', BeautifulSoup('', 'html.parser')) is None
+        assert plan.next_page_url(3, 'https://example.com/blog/', soup) is None
+
+    def test_url_template(self):
+        """Test templated pages are numbered from 2"""
+        plan = SourcePlan({**make_source(), 'pagination': {'url_template': 'https://example.com/blog/page/{page}'}})
+        assert plan.max_pages == 10
+        assert plan.next_page_url(1, plan.url) == 'https://example.com/blog/page/2'
+
+    def test_invalid_pagination(self):
+        """Test pagination without a way to find the next page is rejected"""
+        with pytest.raises(ValueError, match="Test Source.*pagination"):
+            SourcePlan({**make_source(), 'pagination': {'max_pages': 5}})
+        with pytest.raises(ValueError, match="Test Source.*url_template"):
+            SourcePlan({**make_source(), 'pagination': {'url_template': '/page/2'}})
+        with pytest.raises(ValueError, match="Test Source.*next"):
+            SourcePlan({**make_source(), 'pagination': {'next': 'a['}})
+
+class TestCrawlerPlans:
+    """Test plans built at Crawler startup"""
+
+    def test_crawler_rejects_invalid_selector(self, tmp_path):
+        """Test a bad selector fails at startup rather than mid-crawl"""
+        config_path = tmp_path / "test_config.yaml"
+        config_path.write_text(yaml.safe_dump({
+            'output': {'path': str(tmp_path / 'output.json')},
+            'sources': [make_source(article_list='article >')]
+        }))
+        with pytest.raises(ValueError, match="article_list"):
+            Crawler(str(config_path))
+
+    def test_crawl_does_not_compile_selectors(self, tmp_path):
+        """Test crawling a listing page reuses the startup plan"""
+        config_path = tmp_path / "test_config.yaml"
+        source = make_source(article_list='article', title='h2', date='time', link='a')
+        config_path.write_text(yaml.safe_dump({
+            'output': {'path': str(tmp_path / 'output.json')},
+            'backfill': {'enabled': False},
+            'sources': [source]
+        }))
+        crawler = Crawler(str(config_path))
+        html = '<article><h2>Agents</h2><a href="/agents">x</a><p>Agents can now plan their own tasks.</p></article>'
+
+        with patch.object(crawler, '_fetch_text', return_value=(html, False)), \
+             patch('soupsieve.compile', side_effect=AssertionError("selector compiled mid-crawl")):
+            entries = crawler.crawl_source(crawler.config['sources'][0])
+
+        assert [e['url'] for e in entries] == ['https://example.com/agents']
@@ -9,6 +9,8 @@ import sys
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+from unittest.mock import Mock
+
 from summarizer import Summarizer
 
 
@@ -74,3 +76,45 @@ class TestSummarizer:
         )
         assert len(result) > 0
         assert isinstance(result, str)
+    
+    def test_enrich_without_sdk(self, summarizer):
+        """Test enrich falls back to an uncategorized summary without the SDK"""
+        summarizer.client = None
+        result = summarizer.enrich(
+            title="New AI Model Released",
+            content="Company X has released a new AI model. It is faster.",
+            source="Company X"
+        )
+        assert "Company X has released" in result['summary']
+        assert result['category'] == ''
+        assert result['confidence'] is None
+    
+    def test_enrich_single_call(self, summarizer):
+        """Test enrich gets all three fields from one completion"""
+        summarizer.client = Mock()
+        summarizer.client.complete.return_value = (
+            'Here you go:\n```json\n{"summary": "An agent SDK.", '
+            '"category": "Agentic AI", "confidence": 92}\n```'
+        )
+        result = summarizer.enrich("Agent SDK", "An SDK for agents.", "Test Source")
+        
+        summarizer.client.complete.assert_called_once()
+        assert result == {'summary': 'An agent SDK.', 'category': 'Agentic AI', 'confidence': 92}
+    
+    def test_enrich_per_field_fallback(self, summarizer):
+        """Test malformed fields fall back individually"""
+        summarizer.client = Mock()
+        summarizer.client.complete.return_value = '{"summary": "", "category": "Maybe", "confidence": "n/a"}'
+        result = summarizer.enrich("Title", "First sentence here. Second one.", "Test Source")
+        
+        assert result['summary'].startswith("First sentence here")
+        assert result['category'] == 'Other'
+        assert result['confidence'] is None
+    
+    def test_enrich_category_matches_enrichment_pipeline(self, summarizer):
+        """Test categories are normalized as in the enrichment pipeline, case-insensitively"""
+        summarizer.client = Mock()
+        summarizer.client.complete.return_value = '{"summary": "An agent.", "category": "agentic ai", "confidence": 80}'
+        result = summarizer.enrich("Title", "Content.", "Test Source")
+        
+        assert result['category'] == 'Agentic AI'
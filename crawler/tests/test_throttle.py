@@ -0,0 +1,46 @@
+"""
+Unit tests for per-host request throttling
+"""
+
+import time
+import threading
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from throttle import HostThrottle
+
+
+class TestHostThrottle:
+    """Test HostThrottle class"""
+    
+    def test_same_host_waits_for_delay(self):
+        """Test consecutive requests to one host are spaced by the delay"""
+        throttle = HostThrottle(delay=0.05)
+        throttle.wait("https://example.com/a")
+        start = time.monotonic()
+        throttle.wait("https://example.com/b")
+        assert time.monotonic() - start >= 0.04
+    
+    def test_different_hosts_run_in_parallel(self):
+        """Test requests to different hosts do not wait on each other"""
+        throttle = HostThrottle(delay=0.2)
+        hosts = ["https://a.example.com", "https://b.example.com", "https://c.example.com"]
+        threads = [threading.Thread(target=throttle.wait, args=(h,)) for h in hosts]
+        
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        # Three sequential waits would take 0.6s
+        assert time.monotonic() - start < 0.4
+    
+    def test_zero_delay(self):
+        """Test zero delay never sleeps"""
+        throttle = HostThrottle(delay=0)
+        assert throttle.wait("https://example.com") == 0
+        assert throttle.wait("https://example.com") == 0
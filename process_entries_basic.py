@@ -7,36 +7,41 @@ Process entries from 'entries raw.json' and add:
 This script is designed to be run with Claude as the processing engine.
 """
 
-import json
+import sys
+from datetime import datetime, timezone
 from pathlib import Path
+import yaml
 
-def load_entries():
-    """Load entries from the raw JSON file"""
-    input_path = Path("c:/Users/VilhenaM/Cursor_VSCode Workspaces/ai-landscape-tracker/site/data/entries raw.json")
-    with open(input_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+CRAWLER_SRC = Path(__file__).parent / 'crawler' / 'src'
+sys.path.insert(0, str(CRAWLER_SRC))
+from changes import stored_fingerprint
+from entry_store import open_store
 
-def load_existing_entries():
-    """Load existing processed entries if they exist"""
-    output_path = Path("c:/Users/VilhenaM/Cursor_VSCode Workspaces/ai-landscape-tracker/site/data/entries.json")
-    if output_path.exists():
-        with open(output_path, 'r', encoding='utf-8') as f:
-            existing_data = json.load(f)
-            # Create a lookup dictionary by entry ID
-            existing_entries = {}
-            for entry in existing_data.get('entries', []):
-                entry_id = entry.get('id')
-                if entry_id:
-                    existing_entries[entry_id] = entry
-            return existing_entries
-    return {}
+INPUT_PATH = Path("c:/Users/VilhenaM/Cursor_VSCode Workspaces/ai-landscape-tracker/site/data/entries raw.json")
+OUTPUT_PATH = Path("c:/Users/VilhenaM/Cursor_VSCode Workspaces/ai-landscape-tracker/site/data/entries.json")
+# Relative paths in the config are resolved against crawler/src, as when the crawler runs
+CONFIG_PATH = Path(__file__).parent / 'crawler' / 'config.yaml'
 
-def save_entries(data):
-    """Save processed entries to the output file"""
-    output_path = Path("c:/Users/VilhenaM/Cursor_VSCode Workspaces/ai-landscape-tracker/site/data/entries.json")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"Saved to {output_path}")
+def open_entry_store():
+    """Open the crawler's entry store, merging in the raw entries not yet stored"""
+    with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    store = open_store(config.get('entry_store'), base_dir=CRAWLER_SRC)
+    if store is None:
+        sys.exit(f"Enable entry_store in {CONFIG_PATH}: entries are read from and saved to the store")
+    
+    if len(store) == 0 and OUTPUT_PATH.exists():
+        print(f"Imported {store.import_json(OUTPUT_PATH)} processed entries into the entry store")
+    if INPUT_PATH.exists():
+        print(f"Merged {store.merge_json(INPUT_PATH)} new or changed entries from {INPUT_PATH.name}")
+    return store
+
+def save_entries(store, entries):
+    """Save processed entries to the store and export the output file"""
+    store.upsert(entries)
+    last_updated = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+    store.export_json(OUTPUT_PATH, last_updated)
+    print(f"Saved to {OUTPUT_PATH}")
 
 def analyze_entry(entry):
     """
@@ -83,33 +88,13 @@ def analyze_entry(entry):
 
 def main():
     # Load data
-    data = load_entries()
-    entries = data['entries']
-    
-    # Load existing processed entries
-    existing_entries = load_existing_entries()
+    store = open_entry_store()
+    print(f"Total entries in the store: {len(store)}")
     
-    print(f"Found {len(existing_entries)} existing processed entries")
-    print(f"Total entries to check: {len(entries)}")
-    
-    # Identify entries that need processing
-    entries_to_process = []
-    for entry in entries:
-        entry_id = entry.get('id')
-        existing = existing_entries.get(entry_id)
-        
-        # Process if entry doesn't exist or has low/empty confidence
-        if not existing:
-            entries_to_process.append(entry)
-        else:
-            confidence = existing.get('categoryConfidence')
-            if confidence is None or confidence == '' or confidence < 75:
-                entries_to_process.append(entry)
-            else:
-                # Copy existing data to this entry
-                entry['summary'] = existing.get('summary', '')
-                entry['category'] = existing.get('category', 'Other')
-                entry['categoryConfidence'] = existing.get('categoryConfidence', 0)
+    # New, changed, low-confidence and unscored entries, from the confidence index
+    entries_to_process = store.needing_processing()
+    for entry in entries_to_process:
+        entry['contentHash'] = stored_fingerprint(entry)
     
     print(f"Entries requiring processing: {len(entries_to_process)}")
     print("\nThis is a placeholder script.")
@@ -128,9 +113,11 @@ def main():
         entry['categoryConfidence'] = result['categoryConfidence']
     
     # Save results
-    save_entries(data)
+    save_entries(store, entries_to_process)
     
     # Statistics
+    entries = list(store.iter_entries())
+    store.close()
     agentic_count = sum(1 for e in entries if e.get('category') == 'Agentic AI')
     other_count = len(entries) - agentic_count
     avg_confidence = sum(e.get('categoryConfidence', 0) for e in entries) / len(entries)
@@ -8,6 +8,10 @@ class AITracker {
         this.filteredEntries = [];
         this.sources = new Set();
         this.categories = new Set();
+        this.pendingShards = [];
+        this.dataBase = null;
+        this.indexFile = null;
+        this.searchIndex = null;
         
         this.init();
     }
@@ -18,47 +22,172 @@ class AITracker {
         this.setupSearch();
         this.setupFilterToggle();
         this.applyFilters();
+        this.loadRemainingShards();
+        this.loadSearchIndex();
     }
     
     async loadData() {
         try {
-            var response;
-            var data;
+            const manifest = await this.fetchData('manifest.json').catch(() => null);
             
-            try
-            {
-                //get from github pages
-                response= await fetch('/ai-landscape-tracker/data/entries.json');
-                data = await response.json();
-            }
-            catch (error) {
-                //fallback... local file
-                response= await fetch('../data/entries.json');
-                data = await response.json();
+            if (manifest && manifest.shards) {
+                // Sharded export: facets come from the manifest and only the
+                // newest month is needed for first paint
+                Object.keys(manifest.facets.sources).forEach(source => this.sources.add(source));
+                Object.keys(manifest.facets.categories).forEach(category => this.categories.add(category));
+                this.pendingShards = manifest.shards.slice(1);
+                this.indexFile = manifest.index ? manifest.index.file : null;
+                this.entries = manifest.shards.length ? await this.fetchData(manifest.shards[0].file) : [];
+                this.showLastUpdated(manifest.last_updated);
+            } else {
+                // Unsharded fallback (e.g. a local checkout without an export)
+                const data = await this.fetchData('entries.json');
+                this.entries = data.entries || [];
+                
+                // Extract unique sources and categories
+                this.entries.forEach(entry => {
+                    if (entry.source) this.sources.add(entry.source);
+                    if (entry.category) this.categories.add(entry.category);
+                });
+                this.showLastUpdated(data.last_updated);
             }
             
-            
-            this.entries = data.entries || [];
             this.filteredEntries = [...this.entries];
-            
-            // Extract unique sources and categories
-            this.entries.forEach(entry => {
-                if (entry.source) this.sources.add(entry.source);
-                if (entry.category) this.categories.add(entry.category);
-            });
-            
-            // Update last updated timestamp
-            if (data.last_updated) {
-                const lastUpdated = document.getElementById('last-updated');
-                const date = new Date(data.last_updated);
-                lastUpdated.textContent = `Last updated: ${date.toLocaleDateString()} ${date.toLocaleTimeString()}`;
-            }
         } catch (error) {
             console.error('Failed to load data:', error);
             this.showError('Failed to load updates. Please try again later.');
         }
     }
     
+    async fetchData(path) {
+        if (this.dataBase) {
+            const response = await fetch(this.dataBase + path);
+            return response.json();
+        }
+        
+        try
+        {
+            //get from github pages
+            const response = await fetch('/ai-landscape-tracker/data/' + path);
+            const data = await response.json();
+            this.dataBase = '/ai-landscape-tracker/data/';
+            return data;
+        }
+        catch (error) {
+            //fallback... local file
+            const response = await fetch('../data/' + path);
+            const data = await response.json();
+            this.dataBase = '../data/';
+            return data;
+        }
+    }
+    
+    async loadRemainingShards() {
+        // Older months load in the background and are rendered together
+        const shards = this.pendingShards;
+        this.pendingShards = [];
+        if (shards.length === 0) return;
+        
+        const results = await Promise.allSettled(shards.map(shard => this.fetchData(shard.file)));
+        results.forEach(result => {
+            if (result.status === 'fulfilled') {
+                this.entries = this.entries.concat(result.value);
+            } else {
+                console.error('Failed to load older updates:', result.reason);
+            }
+        });
+        this.applyFilters();
+    }
+    
+    async loadSearchIndex() {
+        // Until the index arrives, searches scan entry text with the same rules
+        if (!this.indexFile) return;
+        
+        try {
+            const data = await this.fetchData(this.indexFile);
+            const size = data.ids.length;
+            const decode = encoded => {
+                const bits = new Uint8Array(Math.ceil(size / 8));
+                const raw = atob(encoded);
+                for (let i = 0; i < raw.length; i++) bits[i] = raw.charCodeAt(i);
+                return bits;
+            };
+            
+            this.searchIndex = {
+                size: size,
+                tokens: data.tokens,
+                postings: data.postings,
+                docOf: new Map(data.ids.map((id, doc) => [id, doc])),
+                sources: new Map(Object.entries(data.sources).map(([name, bits]) => [name, decode(bits)])),
+                categories: new Map(Object.entries(data.categories).map(([name, bits]) => [name, decode(bits)])),
+                prefixCache: new Map()
+            };
+            this.applyFilters();
+        } catch (error) {
+            console.error('Failed to load search index:', error);
+        }
+    }
+    
+    tokenize(text) {
+        // Same rule as the Python index builder: runs of letters and digits
+        return text.toLowerCase().match(/[\p{L}\p{N}]+/gu) || [];
+    }
+    
+    prefixBits(prefix) {
+        const index = this.searchIndex;
+        if (index.prefixCache.has(prefix)) return index.prefixCache.get(prefix);
+        
+        // Tokens are sorted, so every token with this prefix is in one run
+        let low = 0;
+        let high = index.tokens.length;
+        while (low < high) {
+            const mid = (low + high) >> 1;
+            if (index.tokens[mid] < prefix) low = mid + 1;
+            else high = mid;
+        }
+        
+        const bits = new Uint8Array(Math.ceil(index.size / 8));
+        for (let i = low; i < index.tokens.length && index.tokens[i].startsWith(prefix); i++) {
+            let doc = 0;
+            for (const delta of index.postings[i]) {
+                doc += delta;
+                bits[doc >> 3] |= 1 << (doc & 7);
+            }
+        }
+        
+        if (index.prefixCache.size > 256) index.prefixCache.clear();
+        index.prefixCache.set(prefix, bits);
+        return bits;
+    }
+    
+    indexMatches(sourceValue, categoryValue, searchValue) {
+        // Intersect source, category and per-token bitsets; null means no constraint
+        const index = this.searchIndex;
+        const empty = new Uint8Array(Math.ceil(index.size / 8));
+        let bits = null;
+        const intersect = other => {
+            if (bits === null) {
+                bits = other.slice();
+            } else {
+                for (let i = 0; i < bits.length; i++) bits[i] &= other[i];
+            }
+        };
+        
+        if (sourceValue !== 'all') intersect(index.sources.get(sourceValue) || empty);
+        if (categoryValue !== 'all') intersect(index.categories.get(categoryValue) || empty);
+        this.tokenize(searchValue).forEach(token => intersect(this.prefixBits(token)));
+        return bits;
+    }
+    
+    showLastUpdated(lastUpdated) {
+        // Update last updated timestamp
+        if (lastUpdated) {
+            const element = document.getElementById('last-updated');
+            const date = new Date(lastUpdated);
+            element.textContent = `Last updated: ${date.toLocaleDateString()} ${date.toLocaleTimeString()}`;
+        }
+    }
+    
     setupFilters() {
         const sourceFilter = document.getElementById('source-filter');
         const categoryFilter = document.getElementById('category-filter');
@@ -140,6 +269,30 @@ class AITracker {
                 cutoffDate = null;
         }
         
+        if (this.searchIndex) {
+            // Answer source, category and search filters from the prebuilt index
+            const bits = this.indexMatches(sourceValue, categoryValue, searchValue);
+            const docOf = this.searchIndex.docOf;
+            
+            this.filteredEntries = this.entries.filter(entry => {
+                if (bits !== null) {
+                    const doc = docOf.get(entry.id);
+                    if (doc === undefined || !(bits[doc >> 3] & (1 << (doc & 7)))) {
+                        return false;
+                    }
+                }
+                
+                // Time range filter
+                return !(cutoffDate && entry.date && new Date(entry.date) < cutoffDate);
+            });
+            
+            this.render();
+            return;
+        }
+        
+        // Without the index, search with the same tokens and word-prefix rule
+        const searchTokens = this.tokenize(searchValue);
+        
         this.filteredEntries = this.entries.filter(entry => {
             // Source filter
             if (sourceValue !== 'all' && entry.source !== sourceValue) {
@@ -159,16 +312,16 @@ class AITracker {
                 }
             }
             
-            // Search filter
-            if (searchValue) {
-                const searchableText = [
+            // Search filter: every search token starts a word of the entry
+            if (searchTokens.length) {
+                const words = this.tokenize([
                     entry.title,
                     entry.summary,
                     entry.source,
                     ...(entry.tags || [])
-                ].join(' ').toLowerCase();
+                ].join(' '));
                 
-                if (!searchableText.includes(searchValue)) {
+                if (!searchTokens.every(token => words.some(word => word.startsWith(token)))) {
                     return false;
                 }
             }
@@ -1,149 +1,272 @@
-import json
+import sys
+import random
 import asyncio
+import argparse
+from datetime import datetime, timezone
 from pathlib import Path
+import yaml
 from copilot import CopilotClient
 
-async def categorize_and_summarize_entry(entry, session):
+CRAWLER_SRC = Path(__file__).parent / 'crawler' / 'src'
+sys.path.insert(0, str(CRAWLER_SRC))
+from changes import stored_fingerprint
+from entry_store import open_store
+from enrichment import (
+    PROMPT_VERSION, Checkpoint, build_batch_prompt, build_prompt, fallback_result,
+    is_rate_limit_error, parse_batch_result, parse_result
+)
+from llm_cache import LLMCache, open_cache
+
+INPUT_PATH = Path("c:/Users/VilhenaM/Cursor_VSCode Workspaces/ai-landscape-tracker/site/data/entries raw.json")
+OUTPUT_PATH = Path("c:/Users/VilhenaM/Cursor_VSCode Workspaces/ai-landscape-tracker/site/data/entries.json")
+CHECKPOINT_PATH = OUTPUT_PATH.with_name("entries.checkpoint.jsonl")
+# Shared with the crawler: the entry store and LLM cache sections are read from here,
+# with relative paths resolved against crawler/src, as when the crawler runs
+CONFIG_PATH = Path(__file__).parent / 'crawler' / 'config.yaml'
+
+MODEL = "gpt-4.1"
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 2  # Seconds; doubled on each rate-limited attempt
+BACKOFF_MAX = 60
+
+
+class RateLimitBackoff:
+    """Shared pause so every worker backs off together when rate limited."""
+
+    def __init__(self):
+        self.resume_at = 0.0
+
+    async def wait(self):
+        """Sleep until the current rate-limit pause has passed."""
+        loop = asyncio.get_running_loop()
+        delay = self.resume_at - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, attempt):
+        """Start (or extend) a pause after a rate-limited call."""
+        loop = asyncio.get_running_loop()
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) + random.uniform(0, 1)
+        self.resume_at = max(self.resume_at, loop.time() + delay)
+        return delay
+
+
+async def send_prompt(prompt, session, backoff):
+    """Send a prompt, retrying with backoff while the service is rate limiting."""
+    for attempt in range(MAX_ATTEMPTS):
+        await backoff.wait()
+        try:
+            response = await session.send_and_wait({"prompt": prompt})
+            return response.data.content
+        except Exception as e:
+            if not is_rate_limit_error(e) or attempt == MAX_ATTEMPTS - 1:
+                raise
+            delay = backoff.pause(attempt)
+            print(f"  Rate limited, backing off {delay:.1f}s")
+
+
+async def categorize_and_summarize_entry(entry, session, backoff):
     """
     Analyze an entry and return:
     - A concise summary
     - Category (Agentic AI or Other)
     - Confidence level (0-100)
     """
-    
-    # Prepare the prompt
-    prompt = f"""Analyze this AI news entry and provide:
-1. A concise 1-2 sentence summary of the content
-2. Choose the best category: "Agentic AI" or "Other"
-   - "Agentic AI" = AI systems that can take actions, make decisions, use tools, plan, or operate autonomously
-   - "Other" = General AI models, applications, partnerships, policy, infrastructure, etc.
-3. Your confidence level (0-100) in the category choice
-
-Entry:
-Title: {entry.get('title', '')}
-Source: {entry.get('source', '')}
-Content: {entry.get('content', '')}
-
-Respond in this exact JSON format:
-{{
-  "summary": "your summary here",
-  "category": "Agentic AI" or "Other",
-  "confidence": 85
-}}"""
-
     try:
-        response = await session.send_and_wait({"prompt": prompt})
-        
-        # Parse the response
-        response_text = response.data.content
-        
-        # Extract JSON from the response
-        import re
-        json_match = re.search(r'\{[\s\S]*\}', response_text)
-        if json_match:
-            result = json.loads(json_match.group())
-            return result
-        else:
+        response_text = await send_prompt(build_prompt(entry), session, backoff)
+        result = parse_result(response_text, entry)
+        if result is None:
             print(f"Warning: Could not parse response for entry {entry.get('id')}")
-            return {
-                "summary": entry.get('content', '')[:200],
-                "category": "Other",
-                "confidence": 50
-            }
-            
+            return fallback_result(entry, confidence=50), False
+        return result, True
+
     except Exception as e:
         print(f"Error processing entry {entry.get('id')}: {e}")
-        return {
-            "summary": entry.get('content', '')[:200],
-            "category": "Other",
-            "confidence": 0
-        }
-
-async def process_entries():
-    """Process all entries in the raw JSON file"""
-    
+        return fallback_result(entry, confidence=0), False
+
+
+async def categorize_and_summarize_batch(entries, session, backoff):
+    """
+    Analyze several entries with one prompt.
+
+    Entries the model leaves out of its JSON array are retried one by one.
+
+    Returns:
+        List of (result, succeeded) tuples in the same order as entries
+    """
+    if len(entries) == 1:
+        return [await categorize_and_summarize_entry(entries[0], session, backoff)]
+
+    try:
+        response_text = await send_prompt(build_batch_prompt(entries), session, backoff)
+        results = parse_batch_result(response_text, entries)
+    except Exception as e:
+        print(f"Error processing batch of {len(entries)} entries: {e}")
+        results = {}
+
+    outcomes = []
+    for entry in entries:
+        if entry.get('id') in results:
+            outcomes.append((results[entry.get('id')], True))
+        else:
+            outcomes.append(await categorize_and_summarize_entry(entry, session, backoff))
+    return outcomes
+
+
+def cache_key(entry):
+    """LLM cache key for an entry's enrichment, whether sent alone or batched."""
+    return LLMCache.make_key(MODEL, 'enrich', PROMPT_VERSION, build_prompt(entry))
+
+
+def apply_result(entry, result):
+    """Copy an enrichment result onto an entry."""
+    entry['summary'] = result['summary']
+    entry['category'] = result['category']
+    entry['categoryConfidence'] = result['confidence']
+
+
+def load_config():
+    """Load the crawler's config."""
+    with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def open_entry_store(config):
+    """Open the crawler's entry store, merging in the raw entries not yet stored."""
+    store = open_store(config.get('entry_store'), base_dir=CRAWLER_SRC)
+    if store is None:
+        sys.exit(f"Enable entry_store in {CONFIG_PATH}: entries are read from and saved to the store")
+
+    if len(store) == 0 and OUTPUT_PATH.exists():
+        print(f"Imported {store.import_json(OUTPUT_PATH)} processed entries into the entry store")
+    if INPUT_PATH.exists():
+        print(f"Merged {store.merge_json(INPUT_PATH)} new or changed entries from {INPUT_PATH.name}")
+    return store
+
+
+async def process_entries(concurrency=4, batch_size=1, use_cache=True):
+    """
+    Process the entries in the entry store that need enrichment
+
+    Args:
+        concurrency: Prompts in flight at once (one Copilot session each)
+        batch_size: Entries sent per prompt
+        use_cache: Reuse and store results in the persistent LLM cache
+    """
+
     # Initialize Copilot client
     client = CopilotClient()
     await client.start()
-    session = await client.create_session({"model": "gpt-4.1"})
-    
+    sessions = asyncio.Queue()
+    for _ in range(concurrency):
+        sessions.put_nowait(await client.create_session({"model": MODEL}))
+    checkpoint = Checkpoint(CHECKPOINT_PATH)
+    config = load_config()
+    cache = open_cache(config.get('llm_cache'), base_dir=CRAWLER_SRC) if use_cache else None
+    store = open_entry_store(config)
+
     try:
-        # Read the input file
-        input_path = Path("c:/Users/VilhenaM/Cursor_VSCode Workspaces/ai-landscape-tracker/site/data/entries raw.json")
-        output_path = Path("c:/Users/VilhenaM/Cursor_VSCode Workspaces/ai-landscape-tracker/site/data/entries.json")
-        
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Load existing processed entries if they exist
-        existing_entries = {}
-        if output_path.exists():
-            with open(output_path, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-                # Create a lookup dictionary by entry ID
-                for entry in existing_data.get('entries', []):
-                    entry_id = entry.get('id')
-                    if entry_id:
-                        existing_entries[entry_id] = entry
-        
-        print(f"Found {len(existing_entries)} existing processed entries")
-        print(f"Total entries to check: {len(data['entries'])}")
-        
-        entries_to_process = []
-        for entry in data['entries']:
-            entry_id = entry.get('id')
-            existing = existing_entries.get(entry_id)
-            
-            # Process if entry doesn't exist or has low/empty confidence
-            if not existing:
-                entries_to_process.append(entry)
-            else:
-                confidence = existing.get('categoryConfidence')
-                if confidence is None or confidence == '' or confidence < 75:
-                    entries_to_process.append(entry)
-                else:
-                    # Copy existing data to this entry
-                    entry['summary'] = existing.get('summary', '')
-                    entry['category'] = existing.get('category', 'Other')
-                    entry['categoryConfidence'] = existing.get('categoryConfidence', 0)
-        
+        output_path = OUTPUT_PATH
+        print(f"Total entries in the store: {len(store)}")
+
+        # New, changed, low-confidence and unscored entries, from the confidence index
+        entries_to_process = store.needing_processing()
+        for entry in entries_to_process:
+            entry['contentHash'] = stored_fingerprint(entry)
+
         print(f"Entries requiring processing: {len(entries_to_process)}")
-        
-        # Process each entry that needs it
-        for i, entry in enumerate(entries_to_process):
-            print(f"Processing entry {i+1}/{len(entries_to_process)}: {entry.get('title', 'Untitled')}")
-            
-            result = await categorize_and_summarize_entry(entry, session)
-            
-            # Update the entry
-            entry['summary'] = result['summary']
-            entry['category'] = result['category']
-            entry['categoryConfidence'] = result['confidence']
-            
+
+        # Resume from an interrupted run: reuse results for unchanged entries,
+        # then answer whatever the LLM cache already knows
+        completed = checkpoint.load()
+        remaining = []
+        resumed = cached = 0
+        for entry in entries_to_process:
+            record = completed.get(entry.get('id'))
+            if record and record.get('contentHash') == entry['contentHash']:
+                apply_result(entry, record['result'])
+                resumed += 1
+            elif cache is not None and (cached_result := cache.get(cache_key(entry))) is not None:
+                apply_result(entry, cached_result)
+                cached += 1
+            else:
+                remaining.append(entry)
+        if resumed:
+            print(f"Resumed {resumed} entries from checkpoint")
+        if cached:
+            print(f"Reused {cached} cached results")
+
+        batches = [remaining[i:i + batch_size] for i in range(0, len(remaining), batch_size)]
+        backoff = RateLimitBackoff()
+        done = 0
+
+        async def run_batch(batch):
+            nonlocal done
+            # Waiting for a free session bounds the number of prompts in flight
+            session = await sessions.get()
+            try:
+                outcomes = await categorize_and_summarize_batch(batch, session, backoff)
+            finally:
+                sessions.put_nowait(session)
+
+            for entry, (result, succeeded) in zip(batch, outcomes):
+                apply_result(entry, result)
+                # Failures are not checkpointed so a resumed run retries them
+                if succeeded:
+                    checkpoint.record(entry, result)
+                    if cache is not None:
+                        cache.set(cache_key(entry), result)
+
             # Progress indicator every 10 entries
-            if (i + 1) % 10 == 0:
-                print(f"  ... {i+1} entries processed")
-        
-        # Write back to the file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
+            previous = done
+            done += len(batch)
+            if done // 10 > previous // 10 or done == len(remaining):
+                print(f"  ... {done}/{len(remaining)} entries processed")
+
+        await asyncio.gather(*(run_batch(batch) for batch in batches))
+
+        # Save to the store, then export the file (atomically, so the deploy never sees a partial file)
+        store.upsert(entries_to_process)
+        last_updated = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        store.export_json(output_path, last_updated)
+        checkpoint.clear()
+
         print(f"\nComplete! Processed {len(entries_to_process)} entries.")
         print(f"Output saved to: {output_path}")
-        
+
         # Print statistics
-        agentic_count = sum(1 for e in data['entries'] if e.get('category') == 'Agentic AI')
-        other_count = len(data['entries']) - agentic_count
-        avg_confidence = sum(e.get('categoryConfidence', 0) for e in data['entries']) / len(data['entries'])
-        
+        entries = list(store.iter_entries())
+        agentic_count = sum(1 for e in entries if e.get('category') == 'Agentic AI')
+        other_count = len(entries) - agentic_count
+        avg_confidence = sum(e.get('categoryConfidence', 0) for e in entries) / len(entries)
+
         print(f"\nStatistics:")
         print(f"  Agentic AI: {agentic_count}")
         print(f"  Other: {other_count}")
         print(f"  Average Confidence: {avg_confidence:.1f}")
-    
+        if cache is not None:
+            print(f"  {cache.stats()}")
+
     finally:
+        checkpoint.close()
+        store.close()
+        if cache is not None:
+            cache.close()
         # Clean up Copilot client
         await client.stop()
 
 if __name__ == "__main__":
-    asyncio.run(process_entries())
+    arg_parser = argparse.ArgumentParser(description="Summarize and categorize entries with Copilot")
+    arg_parser.add_argument('--concurrency', type=int, default=4,
+                            help="Prompts in flight at once, one Copilot session each (default: 4)")
+    arg_parser.add_argument('--batch-size', type=int, default=1,
+                            help="Entries per prompt; above 1 the model answers with a JSON array (default: 1)")
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help="Ignore the persistent LLM cache and call the model for every entry")
+    args = arg_parser.parse_args()
+
+    asyncio.run(process_entries(
+        concurrency=max(1, args.concurrency),
+        batch_size=max(1, args.batch_size),
+        use_cache=not args.no_cache
+    ))